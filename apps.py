@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class MonogramConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'monogram'
+
+    def ready(self):
+        from . import signals  # noqa: F401  (connects cache invalidation handlers)
+        from . import codec
+
+        codec.use(getattr(settings, 'MONOGRAM_JSON_CODEC', 'auto'))
+
+        # Import bot classes at boot so the webhook path never imports and bad paths fail early
+        if getattr(settings, 'MONOGRAM_PRELOAD_BOT_CLASSES', False):
+            from .dispatch import preload_bot_classes
+            preload_bot_classes()
@@ -0,0 +1,72 @@
+import timeit
+from django.conf import settings
+
+if not settings.configured:
+    # Standalone run: the default settings are enough for parsing and building requests
+    settings.configure()
+
+from monogram import codec
+from monogram.dispatch import parse_update
+from monogram.methods import Methods
+
+"""
+JSON codec benchmark.
+Times the update -> reply path for every installed backend: decode the raw webhook body, parse_update,
+build the Message.answer request (text formatting and an 8-button keyboard), encode it with codec.dumpb
+and decode a canned API reply with codec.loads. Only the HTTP round trip itself is left out.
+
+    python -m monogram.benchmarks.codec
+"""
+
+USER = {'id': 1, 'is_bot': False, 'first_name': 'Алиса', 'username': 'alice', 'language_code': 'ru'}
+CHAT = {'id': 1, 'type': 'private', 'first_name': 'Алиса', 'username': 'alice'}
+UPDATE = {
+    'update_id': 1,
+    'message': {'message_id': 5, 'from': USER, 'chat': CHAT, 'date': 1, 'text': '/menu',
+                'entities': [{'offset': 0, 'length': 5, 'type': 'bot_command'}]},
+}
+KEYBOARD = {'inline_keyboard': [[{'text': f'Пункт {i}', 'callback_data': f'menu:{i}'}] for i in range(8)]}
+REPLY = {
+    'ok': True,
+    'result': {'message_id': 6, 'from': {**USER, 'id': 2, 'is_bot': True}, 'chat': CHAT, 'date': 2,
+               'text': 'Main menu: pick one', 'entities': [{'offset': 11, 'length': 8, 'type': 'bold'}],
+               'reply_markup': KEYBOARD},
+}
+
+
+class OfflineBot(Methods):
+    """Sends nothing: encodes the request body and decodes a canned reply like Network._send."""
+
+    reply = b''
+
+    def _send(self, method, url, payload, files, return_response, timeout):
+        codec.dumpb(payload)
+        return codec.loads(self.reply)['result']
+
+
+def main(number=5000):
+    bot = OfflineBot(token='123:abc', secret_token='', endpoint='api.telegram.org', proxy=False, proxy_url=None)
+
+    def update_to_reply(body):
+        update = parse_update(bot, codec.loads(body))
+        update.message.answer('Main menu: *pick one*', keyboard=KEYBOARD)
+
+    for backend in ('orjson', 'msgspec', 'json'):
+        try:
+            codec.use(backend)
+        except ImportError:
+            print(f"{backend}: not installed")
+            continue
+        # Bodies as the backend itself would produce them
+        body = codec.dumpb(UPDATE)
+        bot.reply = codec.dumpb(REPLY)
+        seconds = timeit.timeit(lambda: update_to_reply(body), number=number) / number
+        codec_only = timeit.timeit(
+            lambda: (codec.loads(body), codec.dumpb(REPLY['result']), codec.loads(bot.reply)), number=number
+        ) / number
+        print(f"{backend}: {seconds * 1e6:.0f}us per update -> reply ({codec_only * 1e6:.1f}us in the codec)")
+    codec.use(getattr(settings, 'MONOGRAM_JSON_CODEC', 'auto'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+import gc
+import copy
+import tracemalloc
+from monogram.monoTypes import Message, CompactMessage
+
+"""
+Compact type memory benchmark.
+Measures, with tracemalloc, the memory held per message (nested objects included) by Message and by
+the slotted CompactMessage for 10k text messages with an entity and 2k photo messages with 3 sizes.
+
+    python -m monogram.benchmarks.compact_types
+"""
+
+USER = {'id': 1, 'is_bot': False, 'first_name': 'A', 'username': 'a', 'language_code': 'en'}
+CHAT = {'id': 1, 'type': 'private', 'first_name': 'A', 'username': 'a'}
+
+
+def corpus(texts=10000, photos=2000):
+    messages = [
+        {'message_id': i, 'from': USER, 'chat': CHAT, 'date': 1, 'text': f'hello there {i}',
+         'entities': [{'offset': 0, 'length': 5, 'type': 'bold'}]}
+        for i in range(texts)
+    ]
+    messages += [
+        {'message_id': i, 'from': USER, 'chat': CHAT, 'date': 1, 'caption': 'pic',
+         'photo': [{'file_id': f'x{j}', 'file_unique_id': 'u', 'width': 90, 'height': 90, 'file_size': 10}
+                   for j in range(3)]}
+        for i in range(photos)
+    ]
+    return messages
+
+
+def main():
+    messages = corpus()
+    for cls in (Message, CompactMessage):
+        payloads = copy.deepcopy(messages)
+        gc.collect()
+        tracemalloc.start()
+        objects = [cls(**payload) for payload in payloads]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{cls.__name__}: {size // len(objects)} bytes per message")
+        del objects
+
+
+if __name__ == '__main__':
+    main()
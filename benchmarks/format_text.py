@@ -0,0 +1,51 @@
+import re
+import timeit
+from monogram.text import format_text, disable_format_cache
+
+"""
+format_text benchmark.
+Times the single-pass formatter on 4 KB messages with dense markup and with plain text, next to
+the previous approach of one re.sub per style over the whole text (kept here as the reference).
+
+    python -m monogram.benchmarks.format_text
+"""
+
+# One substitution per style, as format_text did before the single-pass pattern
+_MULTI_PASS = [
+    (re.compile(r'\*([^*]+)\*'), r'<b>\1</b>'),
+    (re.compile(r'(?<!:/)(?<![a-zA-Z0-9])_([^_\s]+)_(?![a-zA-Z0-9])'), r'<i>\1</i>'),
+    (re.compile(r'(?<!:/)(?<![a-zA-Z0-9])__(.+?)__(?![a-zA-Z0-9])'), r'<u>\1</u>'),
+    (re.compile(r'~(.*?)~'), r'<s>\1</s>'),
+    (re.compile(r'\|\|(.*?)\|\|'), r'<span class="tg-spoiler">\1</span>'),
+    (re.compile(r'\[(.*?)\]\((.*?)\)'), r'<a href="\2">\1</a>'),
+    (re.compile(r'!\[(.*?)\]\(tg://emoji\?id=(.*?)\)'), r'<tg-emoji emoji-id="\2">\1</tg-emoji>'),
+    (re.compile(r'`([^`]+)`'), r'<code>\1</code>'),
+    (re.compile(r'```(.*?)```', re.DOTALL), r'<pre>\1</pre>'),
+]
+
+
+def multi_pass(text):
+    for pattern, replacement in _MULTI_PASS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def sample(kind, size=4096):
+    if kind == 'markup':
+        chunk = 'Hello *bold* and _italic_ with ~strike~, ||secret||, `code` and [a link](https://example.com/). '
+    else:
+        chunk = 'Hello there, this is a plain status update without any markup characters in it at all. '
+    return (chunk * (size // len(chunk) + 1))[:size]
+
+
+def main(number=2000):
+    disable_format_cache()
+    for kind in ('markup', 'plain'):
+        text = sample(kind)
+        single = timeit.timeit(lambda: format_text(text), number=number) / number
+        multi = timeit.timeit(lambda: multi_pass(text), number=number) / number
+        print(f"4 KB {kind}: single pass {single * 1e6:.0f}us, one pass per style {multi * 1e6:.0f}us")
+
+
+if __name__ == '__main__':
+    main()
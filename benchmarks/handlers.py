@@ -0,0 +1,42 @@
+import timeit
+from monogram.handlers import BotHandlerManager
+
+"""
+Handler dispatch benchmark.
+Compares scanning a bot class for decorated handlers (what every bot instance did per update
+before the tables were compiled per class) with creating an instance and dispatching a message.
+
+    python -m monogram.benchmarks.handlers
+"""
+
+HANDLERS = 500
+
+
+def make_bot_class(count=HANDLERS):
+    namespace = {'unknown_message': lambda self, message, user: None}
+    for index in range(count):
+        def handler(self, message, user):
+            return None
+        namespace[f'handler_{index}'] = BotHandlerManager.on_message(f'text {index}')(handler)
+    return type('BenchmarkBot', (BotHandlerManager,), namespace)
+
+
+def main(number=2000):
+    bot_class = make_bot_class()
+    message = {'text': f'text {HANDLERS - 1}'}
+
+    def dispatch():
+        bot_class().handle_message(message, None)
+
+    results = {
+        'scan handlers (old per-instance cost)': timeit.timeit(bot_class._compile_handlers, number=number // 20) / (number // 20),
+        'create instance': timeit.timeit(bot_class, number=number) / number,
+        'create instance + dispatch': timeit.timeit(dispatch, number=number) / number,
+    }
+    print(f"{HANDLERS} message handlers")
+    for name, seconds in results.items():
+        print(f"  {name}: {seconds * 1e6:.1f}us")
+
+
+if __name__ == '__main__':
+    main()
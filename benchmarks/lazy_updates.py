@@ -0,0 +1,48 @@
+import copy
+import timeit
+from monogram.monoTypes import Update
+
+"""
+Lazy update parsing benchmark.
+Parses a mixed corpus of updates eagerly and lazily (Update(..., lazy=True), see MONOGRAM_LAZY_UPDATES)
+with a handler that reads only the text and the chat id, as most handlers do.
+
+    python -m monogram.benchmarks.lazy_updates
+"""
+
+USER = {'id': 1, 'is_bot': False, 'first_name': 'A', 'username': 'a', 'language_code': 'en'}
+CHAT = {'id': 1, 'type': 'private', 'first_name': 'A', 'username': 'a'}
+COMMAND = {'message_id': 5, 'from': USER, 'chat': CHAT, 'date': 1, 'text': '/start hello',
+           'entities': [{'offset': 0, 'length': 6, 'type': 'bot_command'}]}
+PHOTO = {'message_id': 6, 'from': USER, 'chat': CHAT, 'date': 1, 'caption': 'pic',
+         'photo': [{'file_id': f'x{i}', 'file_unique_id': 'u', 'width': 90 * i, 'height': 90 * i, 'file_size': 1000 * i}
+                   for i in range(1, 5)]}
+REPLY = {'message_id': 7, 'from': USER, 'chat': CHAT, 'date': 1, 'text': 'ok', 'reply_to_message': COMMAND}
+
+# 6 commands, a photo, a reply and a callback query
+CORPUS = (
+    [{'update_id': 1, 'message': COMMAND}] * 6
+    + [{'update_id': 2, 'message': PHOTO}, {'update_id': 3, 'message': REPLY}]
+    + [{'update_id': 4, 'callback_query': {'id': '9', 'from': USER, 'chat_instance': 'c', 'data': 'menu:1', 'message': REPLY}}]
+)
+
+
+def handle(lazy, payloads):
+    for payload in payloads:
+        update = Update(bot=None, lazy=lazy, **payload)
+        message = getattr(update, 'message', None) or update.callback_query.message
+        message.text
+        message.chat.id
+
+
+def main(number=3000):
+    # Parsing consumes the payloads, so every run gets fresh copies; their cost is subtracted
+    copies = lambda: [copy.deepcopy(payload) for payload in CORPUS]
+    copying = timeit.timeit(copies, number=number)
+    for lazy in (False, True):
+        seconds = timeit.timeit(lambda: handle(lazy, copies()), number=number) - copying
+        print(f"{'lazy' if lazy else 'eager'}: {seconds / number / len(CORPUS) * 1e6:.1f}us per update")
+
+
+if __name__ == '__main__':
+    main()
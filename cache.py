@@ -0,0 +1,155 @@
+import time
+import threading
+import logging
+from django.conf import settings
+from django.core.cache import caches
+from django.db import router
+
+"""
+BotManager lookup cache for the webhook hot path.
+Bots are cached by name in process memory with a TTL, optionally backed by one of Django's cache backends,
+and invalidated by the BotManager post_save/post_delete signals (see signals.py).
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class BotCache:
+    """
+    Name -> BotManager cache.
+
+    Settings:
+        MONOGRAM_BOT_CACHE_TTL: Seconds a bot stays in process memory (default 300, 0 disables caching)
+        MONOGRAM_BOT_CACHE_BACKEND: Optional Django cache alias shared by all workers (default None)
+    """
+
+    key_prefix = 'monogram:bot:'
+
+    def __init__(self):
+        self._bots = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self):
+        return getattr(settings, 'MONOGRAM_BOT_CACHE_TTL', 300)
+
+    @property
+    def backend(self):
+        alias = getattr(settings, 'MONOGRAM_BOT_CACHE_BACKEND', None)
+        return caches[alias] if alias else None
+
+    def get(self, name):
+        """
+        Returns the bot with the given name, querying the database only on a cache miss.
+
+        Raises:
+            BotManager.DoesNotExist: If no such bot exists
+        """
+        bot = self._get_local(name)
+        if bot is not None:
+            return bot
+
+        from .models import BotManager
+
+        bot = self._from_backend(name)
+        if bot is None:
+            bot = BotManager.objects.get(name=name)
+            self._to_backend(bot)
+        self._set_local(bot)
+        return bot
+
+    async def aget(self, name):
+        """Async variant of ``get`` for async views."""
+        bot = self._get_local(name)
+        if bot is not None:
+            return bot
+
+        from .models import BotManager
+
+        bot = await self._afrom_backend(name)
+        if bot is None:
+            bot = await BotManager.objects.aget(name=name)
+            await self._ato_backend(bot)
+        self._set_local(bot)
+        return bot
+
+    def invalidate(self, name=None, pk=None):
+        """Drops a bot from every cache layer, by name and/or primary key."""
+        with self._lock:
+            for cached_name, (expires, bot) in list(self._bots.items()):
+                if cached_name == name or (pk is not None and bot.pk == pk):
+                    del self._bots[cached_name]
+        backend = self.backend
+        if backend is not None and name:
+            backend.delete(self.key_prefix + name)
+
+    def clear(self):
+        """Empties the process-local cache."""
+        with self._lock:
+            self._bots.clear()
+
+    def _get_local(self, name):
+        entry = self._bots.get(name)
+        if entry is None:
+            return None
+        expires, bot = entry
+        if expires < time.monotonic():
+            with self._lock:
+                self._bots.pop(name, None)
+            return None
+        return bot
+
+    def _set_local(self, bot):
+        ttl = self.ttl
+        if ttl:
+            with self._lock:
+                self._bots[bot.name] = (time.monotonic() + ttl, bot)
+
+    def _from_backend(self, name):
+        backend = self.backend
+        if backend is None:
+            return None
+        return self._from_values(name, backend.get(self.key_prefix + name))
+
+    async def _afrom_backend(self, name):
+        # Async backend API: the database cache cannot be used synchronously from async code
+        backend = self.backend
+        if backend is None:
+            return None
+        return self._from_values(name, await backend.aget(self.key_prefix + name))
+
+    def _from_values(self, name, values):
+        if values is None:
+            return None
+
+        from .models import BotManager
+
+        # Rebuild from field values so the instance gets a pooled session like any DB row,
+        # bound to the database the row would have been read from
+        field_names = [field.attname for field in BotManager._meta.concrete_fields]
+        try:
+            return BotManager.from_db(
+                router.db_for_read(BotManager), field_names, [values[field] for field in field_names]
+            )
+        except KeyError:
+            logger.warning(f"Discarding stale cache entry for bot {name}")
+            return None
+
+    def _to_backend(self, bot):
+        backend = self.backend
+        if backend is None:
+            return
+        backend.set(self.key_prefix + bot.name, self._values(bot), self.ttl)
+
+    async def _ato_backend(self, bot):
+        backend = self.backend
+        if backend is None:
+            return
+        await backend.aset(self.key_prefix + bot.name, self._values(bot), self.ttl)
+
+    @staticmethod
+    def _values(bot):
+        return {field.attname: getattr(bot, field.attname) for field in bot._meta.concrete_fields}
+
+
+bot_cache = BotCache()
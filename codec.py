@@ -0,0 +1,125 @@
+import json
+
+"""
+JSON codec used for every encode/decode in monogram.
+The fastest available backend is selected at import time (orjson, then msgspec, then the stdlib json
+module); set MONOGRAM_JSON_CODEC to 'orjson', 'msgspec' or 'json' to pin one. All backends accept the
+same values, including the generated compact types (serialized with their to_dict()), and raise
+DecodeError on invalid input.
+"""
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional dependency
+    msgspec = None
+
+
+class DecodeError(ValueError):
+    """Raised by loads() for invalid JSON, whatever the backend."""
+
+
+def _default(obj):
+    # Objects the backends cannot encode natively, e.g. CompactInlineKeyboardMarkup
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is None:
+        raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
+    return to_dict()
+
+
+def _json_backend():
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=_default)
+
+    def dumpb(obj):
+        return encoder.encode(obj).encode()
+
+    # json.loads accepts both str and bytes
+    return encoder.encode, dumpb, json.loads, json.JSONDecodeError
+
+
+def _orjson_backend():
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj):
+        return orjson.dumps(obj, default=_default, option=option).decode()
+
+    def dumpb(obj):
+        return orjson.dumps(obj, default=_default, option=option)
+
+    return dumps, dumpb, orjson.loads, orjson.JSONDecodeError
+
+
+def _msgspec_backend():
+    encoder = msgspec.json.Encoder(enc_hook=_default)
+    decoder = msgspec.json.Decoder()
+
+    def dumps(obj):
+        return encoder.encode(obj).decode()
+
+    return dumps, encoder.encode, decoder.decode, msgspec.DecodeError
+
+
+_BACKENDS = {
+    'orjson': (lambda: orjson is not None, _orjson_backend),
+    'msgspec': (lambda: msgspec is not None, _msgspec_backend),
+    'json': (lambda: True, _json_backend),
+}
+
+name = None
+_dumps = _dumpb = _loads = None
+_decode_errors = ()
+
+
+def use(backend='auto'):
+    """
+    Selects the JSON backend.
+
+    Args:
+        backend (str): 'orjson', 'msgspec', 'json', or 'auto' for the fastest installed one.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the requested backend is not installed.
+    """
+    global name, _dumps, _dumpb, _loads, _decode_errors
+
+    if backend == 'auto':
+        backend = next(key for key, (available, _) in _BACKENDS.items() if available())
+    elif backend not in _BACKENDS:
+        raise ValueError(f"Unknown JSON codec '{backend}', expected one of {', '.join(_BACKENDS)} or 'auto'")
+    elif not _BACKENDS[backend][0]():
+        raise ImportError(f"JSON codec '{backend}' is not installed")
+
+    _dumps, _dumpb, _loads, error = _BACKENDS[backend][1]()
+    _decode_errors = (error, UnicodeDecodeError)
+    name = backend
+
+
+def dumps(obj):
+    """Encodes ``obj`` to a JSON string (for form fields)."""
+    return _dumps(obj)
+
+
+def dumpb(obj):
+    """Encodes ``obj`` to UTF-8 JSON bytes (for request bodies)."""
+    return _dumpb(obj)
+
+
+def loads(data):
+    """
+    Decodes JSON from str or bytes.
+
+    Raises:
+        DecodeError: If the data is not valid JSON.
+    """
+    try:
+        return _loads(data)
+    except _decode_errors as e:
+        raise DecodeError(str(e)) from e
+
+
+use()
@@ -0,0 +1,226 @@
+import re
+import threading
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+
+"""
+Deduplication of redelivered updates.
+Telegram redelivers an update when the webhook is slow or answers with an error, and a poller replays its
+last batch after a crash. The update_id is read from the raw body, before any decoding or Update parsing,
+and checked against a per-process LRU of recently accepted updates, optionally backed by one of Django's
+cache backends (e.g. Redis, Memcached or the database cache) so that all workers share what they have seen.
+"""
+
+# update_id is the first key Telegram sends; a quote inside a JSON string is always escaped,
+# so the pattern cannot match text sent by a user
+_UPDATE_ID = re.compile(rb'"update_id"\s*:\s*(\d+)')
+
+
+def update_id_of(body):
+    """
+    Reads the update_id from a raw update body without decoding it.
+
+    Args:
+        body: Request body (bytes)
+
+    Returns:
+        int: The update_id, or None if the body has none
+    """
+    match = _UPDATE_ID.search(body)
+    return int(match.group(1)) if match else None
+
+
+class UpdateDeduplicator:
+    """
+    Remembers accepted updates by (bot name, update_id).
+
+    Settings:
+        MONOGRAM_DEDUP_SIZE: Updates remembered in process memory (default 10000, 0 disables deduplication)
+        MONOGRAM_DEDUP_BACKEND: Optional Django cache alias shared by all workers (default None)
+        MONOGRAM_DEDUP_TTL: Seconds an update is remembered in the shared backend (default 86400,
+            Telegram keeps undelivered updates for 24 hours)
+    """
+
+    key_prefix = 'monogram:update:'
+
+    def __init__(self):
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+        self._config = None
+        # Metrics
+        self.duplicates = 0
+
+    def config(self):
+        """(size, ttl, backend alias), read from the settings once since this runs for every update."""
+        if self._config is None:
+            self._config = (
+                getattr(settings, 'MONOGRAM_DEDUP_SIZE', 10000),
+                getattr(settings, 'MONOGRAM_DEDUP_TTL', 86400),
+                getattr(settings, 'MONOGRAM_DEDUP_BACKEND', None),
+            )
+        return self._config
+
+    def reload(self):
+        """Re-reads the settings on next use."""
+        self._config = None
+
+    @property
+    def size(self):
+        return self.config()[0]
+
+    @property
+    def ttl(self):
+        return self.config()[1]
+
+    @property
+    def backend(self):
+        alias = self.config()[2]
+        return caches[alias] if alias else None
+
+    def seen(self, bot_name, update_id):
+        """
+        Marks an update as accepted.
+
+        Args:
+            bot_name: Name of the bot receiving the update
+            update_id: Identifier of the update (None is never a duplicate)
+
+        Returns:
+            bool: True if the update was accepted before and must be skipped
+        """
+        if update_id is None or not self.size:
+            return False
+        key = (bot_name, update_id)
+        if self._seen_local(key):
+            return True
+
+        backend = self.backend
+        # add() only stores missing keys, so exactly one worker wins
+        if backend is not None and not backend.add(self._backend_key(key), 1, self.ttl):
+            self.duplicates += 1
+            return True
+        return False
+
+    async def aseen(self, bot_name, update_id):
+        """Async variant of ``seen``."""
+        if update_id is None or not self.size:
+            return False
+        key = (bot_name, update_id)
+        if self._seen_local(key):
+            return True
+
+        backend = self.backend
+        if backend is not None and not await backend.aadd(self._backend_key(key), 1, self.ttl):
+            self.duplicates += 1
+            return True
+        return False
+
+    def contains(self, bot_name, update_id):
+        """
+        Checks an update without marking it; pollers mark updates with ``mark`` once they are processed.
+
+        Returns:
+            bool: True if the update was marked before and must be skipped
+        """
+        if update_id is None or not self.size:
+            return False
+        key = (bot_name, update_id)
+        if self._contains_local(key):
+            return True
+        backend = self.backend
+        if backend is not None and backend.has_key(self._backend_key(key)):
+            self.duplicates += 1
+            return True
+        return False
+
+    async def acontains(self, bot_name, update_id):
+        """Async variant of ``contains``."""
+        if update_id is None or not self.size:
+            return False
+        key = (bot_name, update_id)
+        if self._contains_local(key):
+            return True
+        backend = self.backend
+        if backend is not None and await backend.ahas_key(self._backend_key(key)):
+            self.duplicates += 1
+            return True
+        return False
+
+    def mark(self, bot_name, update_id):
+        """Marks a processed update, so a redelivery or replay of it is skipped."""
+        if update_id is None or not self.size:
+            return
+        key = (bot_name, update_id)
+        self._add_local(key)
+        backend = self.backend
+        if backend is not None:
+            backend.set(self._backend_key(key), 1, self.ttl)
+
+    def forget(self, bot_name, update_id):
+        """Unmarks an update that could not be accepted, so its redelivery is processed."""
+        if update_id is None:
+            return
+        key = (bot_name, update_id)
+        with self._lock:
+            self._seen.pop(key, None)
+        backend = self.backend
+        if backend is not None:
+            backend.delete(self._backend_key(key))
+
+    async def aforget(self, bot_name, update_id):
+        """Async variant of ``forget``."""
+        if update_id is None:
+            return
+        key = (bot_name, update_id)
+        with self._lock:
+            self._seen.pop(key, None)
+        backend = self.backend
+        if backend is not None:
+            await backend.adelete(self._backend_key(key))
+
+    def clear(self):
+        with self._lock:
+            self._seen.clear()
+
+    def _seen_local(self, key):
+        with self._lock:
+            if key in self._seen:
+                self._seen.move_to_end(key)
+                self.duplicates += 1
+                return True
+            self._insert(key)
+        return False
+
+    def _contains_local(self, key):
+        with self._lock:
+            if key in self._seen:
+                self._seen.move_to_end(key)
+                self.duplicates += 1
+                return True
+        return False
+
+    def _add_local(self, key):
+        with self._lock:
+            self._insert(key)
+
+    def _insert(self, key):
+        self._seen[key] = None
+        self._seen.move_to_end(key)
+        if len(self._seen) > self.size:
+            self._seen.popitem(last=False)
+
+    def _backend_key(self, key):
+        return f'{self.key_prefix}{key[0]}:{key[1]}'
+
+
+deduplicator = UpdateDeduplicator()
+
+
+def _reload_settings(setting, **kwargs):
+    if setting.startswith('MONOGRAM_DEDUP_'):
+        deduplicator.reload()
+
+
+setting_changed.connect(_reload_settings)
@@ -0,0 +1,232 @@
+import asyncio
+import logging
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DatabaseError
+from .monoTypes import Update
+
+"""
+Update dispatching for Telegram bots.
+This module holds the pipeline shared by every entry point that hands an update to a bot class,
+and the asyncio dispatcher used by the async webhook to process updates off the request path.
+"""
+
+logger = logging.getLogger(__name__)
+
+# Resolved bot classes keyed by their dotted ``BotManager.object`` path
+_bot_classes = {}
+
+
+def load_bot_class(path):
+    """
+    Resolves a dotted bot class path, importing it only the first time it is seen.
+
+    Args:
+        path: Dotted path of the bot class (e.g. 'Bots.bot.bot1')
+
+    Returns:
+        The bot class
+
+    Raises:
+        ImportError: If the module cannot be imported
+        AttributeError: If the module has no such class
+    """
+    BotClass = _bot_classes.get(path)
+    if BotClass is None:
+        module_path, class_name = path.rsplit('.', 1)
+        module = __import__(module_path, fromlist=[class_name])
+        BotClass = getattr(module, class_name)
+        _bot_classes[path] = BotClass
+    return BotClass
+
+
+def forget_bot_class(path):
+    """Drops a cached bot class so the next update resolves it again."""
+    _bot_classes.pop(path, None)
+
+
+def preload_bot_classes():
+    """
+    Imports the bot class of every configured BotManager up front.
+
+    Raises:
+        ImproperlyConfigured: If any configured class cannot be imported
+    """
+    from .models import BotManager
+
+    try:
+        paths = set(
+            BotManager.objects.exclude(object__isnull=True).exclude(object='').values_list('object', flat=True)
+        )
+    except DatabaseError:
+        # Tables may not exist yet (e.g. before the first migrate)
+        logger.warning("Skipping bot class preload: BotManager table is not available")
+        return
+
+    for path in paths:
+        try:
+            load_bot_class(path)
+        except (ImportError, AttributeError, ValueError) as e:
+            raise ImproperlyConfigured(f"Cannot load bot class '{path}': {e}") from e
+
+
+def process_update(bot, update, raise_errors=False):
+    """
+    Hands a parsed update to the bot class configured in ``bot.object``.
+
+    Args:
+        bot: BotManager instance receiving the update
+        update: Parsed Update object
+        raise_errors: Re-raise errors of the bot class instead of logging them, for callers
+            that retry failed updates (the durable queue worker)
+
+    Raises:
+        ImproperlyConfigured, Exception: Only with ``raise_errors``
+    """
+    logger.info(f"Received update for {bot.name}: {update}")
+
+    if not bot.object:
+        if raise_errors:
+            raise ImproperlyConfigured(f"No bot class defined for {bot.name}")
+        logger.error(f"No bot class defined for {bot.name}")
+        return
+
+    try:
+        # load dynamic bot class (cached after the first update)
+        BotClass = load_bot_class(bot.object)
+
+        # create instance from bot class and process update
+        BotClass(bot, update)
+
+    except ImportError:
+        if raise_errors:
+            raise
+        logger.exception(f"Failed to import bot class: {bot.object}")
+    except AttributeError:
+        if raise_errors:
+            raise
+        logger.exception(f"Class not found: {bot.object}")
+    except Exception as e:
+        if raise_errors:
+            raise
+        logger.exception(f"Error processing update: {str(e)}")
+
+
+def parse_update(bot, update_data):
+    """
+    Builds an Update from a decoded payload.
+
+    With MONOGRAM_LAZY_UPDATES enabled, messages keep their raw payload and
+    nested objects (chat, user, entities, photos, ...) are built on first access.
+    With MONOGRAM_COMPACT_UPDATES enabled, messages and callback queries are
+    CompactMessage/CompactCallbackQuery built by their generated from_dict
+    (this takes precedence over lazy parsing for those kinds).
+    """
+    return Update(
+        bot=bot,
+        lazy=getattr(settings, 'MONOGRAM_LAZY_UPDATES', False),
+        compact=getattr(settings, 'MONOGRAM_COMPACT_UPDATES', False),
+        **update_data
+    )
+
+
+def process_raw_update(bot, update_data, raise_errors=False):
+    """Parses a decoded update payload and dispatches it to the bot class (see ``process_update``)."""
+    process_update(bot, parse_update(bot, update_data), raise_errors)
+
+
+class UpdateDispatcher:
+    """
+    Asyncio dispatcher that processes updates off the request path.
+
+    Each bot gets a bounded queue drained by a fixed number of worker tasks;
+    the synchronous bot classes run in the default thread pool, so at most
+    ``workers`` updates of one bot are processed at the same time.
+
+    Queues and workers live on the event loop of the first update, which must keep
+    running (ASGI). Moving to another loop is refused while updates are unfinished,
+    e.g. when the async view runs under WSGI, where every request gets a fresh loop.
+
+    Settings:
+        MONOGRAM_ASYNC_WORKERS: Workers per bot (default 4)
+        MONOGRAM_ASYNC_WORKERS_PER_BOT: Per-bot overrides, e.g. ``{'SupportBot': 16}``
+        MONOGRAM_ASYNC_QUEUE_SIZE: Pending updates per bot before enqueue is refused (default 1000)
+    """
+
+    def __init__(self):
+        self._queues = {}
+        self._workers = {}
+        self._loop = None
+        # Updates queued but not processed yet, across all bots
+        self.unfinished = 0
+
+    def workers_for(self, botname):
+        """Returns the configured worker count for a bot."""
+        per_bot = getattr(settings, 'MONOGRAM_ASYNC_WORKERS_PER_BOT', {})
+        return per_bot.get(botname, getattr(settings, 'MONOGRAM_ASYNC_WORKERS', 4))
+
+    def enqueue(self, bot, update_data):
+        """
+        Queues a decoded update for background processing.
+
+        Must be called from the event loop. Returns False when the bot's queue is full.
+
+        Raises:
+            ImproperlyConfigured: If updates are still unfinished on another event loop
+        """
+        queue = self._queue_for(bot.name)
+        try:
+            queue.put_nowait((bot, update_data))
+        except asyncio.QueueFull:
+            logger.warning(f"Update queue full for {bot.name}, rejecting update")
+            return False
+        self.unfinished += 1
+        return True
+
+    def pending(self, botname):
+        """Number of updates waiting in a bot's queue."""
+        queue = self._queues.get(botname)
+        return queue.qsize() if queue else 0
+
+    def _queue_for(self, botname):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Queues and workers belong to a single event loop; only a drained one may be replaced
+            if self._loop is not None and (self._loop.is_running() or self.unfinished):
+                logger.error(
+                    f"Update dispatcher called from a new event loop with {self.unfinished} updates "
+                    f"unfinished on the previous one"
+                )
+                raise ImproperlyConfigured(
+                    "The async webhook dispatcher needs one persistent event loop; serve it with an ASGI server"
+                )
+            self._loop = loop
+            self._queues = {}
+            self._workers = {}
+
+        queue = self._queues.get(botname)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=getattr(settings, 'MONOGRAM_ASYNC_QUEUE_SIZE', 1000))
+            self._queues[botname] = queue
+            self._workers[botname] = [
+                loop.create_task(self._worker(queue))
+                for _ in range(self.workers_for(botname))
+            ]
+        return queue
+
+    async def _worker(self, queue):
+        handle = sync_to_async(process_raw_update, thread_sensitive=False)
+        while True:
+            bot, update_data = await queue.get()
+            try:
+                await handle(bot, update_data)
+            except Exception:
+                logger.exception(f"Error processing update for {bot.name}")
+            finally:
+                queue.task_done()
+            # Skipped when the worker is cancelled with its loop: the update stays unfinished
+            self.unfinished -= 1
+
+
+dispatcher = UpdateDispatcher()
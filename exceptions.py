@@ -0,0 +1,122 @@
+from typing import Any, Dict, Optional
+
+"""
+Errors raised for failed Telegram Bot API calls.
+Network.request raises a TelegramError subclass when the API answers with ``"ok": false``, filled
+from the ``error_code``, ``description`` and ``parameters`` (ResponseParameters) of the response,
+and NetworkError when the API could not be reached.
+"""
+
+
+class TelegramError(Exception):
+    """
+    A Bot API call failed.
+
+    Attributes:
+        error_code (int): HTTP-like error code returned by the API (None for network errors)
+        description (str): Human-readable description returned by the API
+        method (str): API method that was called
+        parameters (dict): ResponseParameters of the error, if any
+    """
+
+    def __init__(self, description: str, error_code: Optional[int] = None, method: Optional[str] = None,
+                 parameters: Optional[Dict[str, Any]] = None):
+        super().__init__(description)
+        self.description = description
+        self.error_code = error_code
+        self.method = method
+        self.parameters = parameters or {}
+
+    def __str__(self):
+        where = f"{self.method}: " if self.method else ""
+        code = f" ({self.error_code})" if self.error_code is not None else ""
+        return f"{where}{self.description}{code}"
+
+    @classmethod
+    def from_response(cls, response: Dict[str, Any], method: Optional[str] = None) -> 'TelegramError':
+        """
+        Builds the most specific error for a failed API response.
+
+        Args:
+            response: Decoded response body, e.g. ``{"ok": false, "error_code": 429, ...}``
+            method: API method that was called
+
+        Returns:
+            TelegramError: An instance of the matching subclass
+        """
+        error_code = response.get('error_code')
+        description = response.get('description') or 'Unknown Telegram API error'
+        parameters = response.get('parameters') or {}
+
+        if parameters.get('retry_after') is not None:
+            return RetryAfter(description, error_code, method, parameters)
+        if parameters.get('migrate_to_chat_id') is not None:
+            return ChatMigrated(description, error_code, method, parameters)
+
+        error_class = _ERRORS_BY_CODE.get(error_code)
+        if error_class is None:
+            error_class = ServerError if error_code and error_code >= 500 else TelegramError
+        return error_class(description, error_code, method, parameters)
+
+
+class BadRequest(TelegramError):
+    """The request was invalid (400)."""
+
+
+class Unauthorized(TelegramError):
+    """The bot token is invalid (401)."""
+
+
+class Forbidden(TelegramError):
+    """The bot may not perform this action, e.g. it was blocked by the user (403)."""
+
+
+class NotFound(TelegramError):
+    """The method or the object does not exist (404)."""
+
+
+class Conflict(TelegramError):
+    """Another webhook or getUpdates call is active (409)."""
+
+
+class ServerError(TelegramError):
+    """Telegram had an internal error (5xx); the call may succeed when retried."""
+
+
+class RetryAfter(TelegramError):
+    """
+    Flood control was exceeded (429).
+
+    Attributes:
+        retry_after (int): Seconds to wait before the request can be repeated
+    """
+
+    def __init__(self, description, error_code=None, method=None, parameters=None):
+        super().__init__(description, error_code, method, parameters)
+        self.retry_after = self.parameters.get('retry_after', 0)
+
+
+class ChatMigrated(TelegramError):
+    """
+    The group was upgraded to a supergroup.
+
+    Attributes:
+        migrate_to_chat_id (int): Identifier of the new supergroup
+    """
+
+    def __init__(self, description, error_code=None, method=None, parameters=None):
+        super().__init__(description, error_code, method, parameters)
+        self.migrate_to_chat_id = self.parameters.get('migrate_to_chat_id')
+
+
+class NetworkError(TelegramError):
+    """The API could not be reached (connection errors, timeouts, undecodable responses)."""
+
+
+_ERRORS_BY_CODE = {
+    400: BadRequest,
+    401: Unauthorized,
+    403: Forbidden,
+    404: NotFound,
+    409: Conflict,
+}
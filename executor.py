@@ -0,0 +1,193 @@
+import queue
+import threading
+import logging
+from concurrent.futures import Future
+from django.conf import settings
+from django.db import close_old_connections
+from .dispatch import process_raw_update
+
+"""
+Ordered parallel processing of updates.
+ChatShardedExecutor hashes every update to one of N shards by (bot, chat); each shard is a queue drained
+by a single thread, so the updates of one chat are handled strictly in order (no racing stage transitions)
+while different chats are handled in parallel. Used by the pollers and, with MONOGRAM_ORDERED_DISPATCH,
+by the webhook views.
+"""
+
+logger = logging.getLogger(__name__)
+
+# Keys of an update payload that carry its chat (callback queries via their message), else its user
+_CHAT_PATHS = (('chat',), ('message', 'chat'))
+_USER_PATHS = (('from',), ('user',), ('voter_chat',))
+
+
+def shard_key(update_data):
+    """
+    Ordering key of a raw update: the chat it belongs to, else the user who sent it.
+
+    Args:
+        update_data: Decoded update payload
+
+    Returns:
+        The chat or user id, or the update_id for updates without one (not ordered)
+    """
+    for kind, payload in update_data.items():
+        if kind == 'update_id' or not isinstance(payload, dict):
+            continue
+        for path in _CHAT_PATHS:
+            value = payload
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            if isinstance(value, dict) and 'id' in value:
+                return value['id']
+        for key in _USER_PATHS:
+            user = payload.get(key)
+            if isinstance(user, dict) and 'id' in user:
+                return user['id']
+    return update_data.get('update_id')
+
+
+class _Shard:
+    __slots__ = ('queue', 'thread', 'processed', 'max_depth', 'busy')
+
+    def __init__(self, max_queue):
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.thread = None
+        self.processed = 0
+        self.max_depth = 0
+        self.busy = False
+
+
+class ChatShardedExecutor:
+    """
+    Runs updates on per-shard worker threads, sequentially per chat.
+
+    Settings:
+        MONOGRAM_EXECUTOR_SHARDS: Worker threads, i.e. chats handled at the same time (default 16)
+        MONOGRAM_EXECUTOR_QUEUE_SIZE: Pending updates per shard before submit is refused (default 1000)
+
+    Args:
+        shards: Number of shards (worker threads)
+        max_queue: Pending updates per shard (0 for unbounded)
+        handler: Callable receiving ``(bot, update_data)``; defaults to the dispatch pipeline
+        name: Prefix of the worker thread names
+    """
+
+    def __init__(self, shards=None, max_queue=None, handler=None, name='monogram-shard'):
+        self.shards = shards or getattr(settings, 'MONOGRAM_EXECUTOR_SHARDS', 16)
+        if max_queue is None:
+            max_queue = getattr(settings, 'MONOGRAM_EXECUTOR_QUEUE_SIZE', 1000)
+        self.handler = handler or process_raw_update
+        self.name = name
+        self._shards = [_Shard(max_queue) for _ in range(self.shards)]
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def shard_for(self, bot, update_data):
+        """Index of the shard an update is processed on."""
+        return hash((bot.name, shard_key(update_data))) % self.shards
+
+    def submit(self, bot, update_data, block=True, timeout=None):
+        """
+        Queues an update behind the earlier updates of its chat.
+
+        Args:
+            bot: BotManager instance receiving the update
+            update_data: Decoded update payload
+            block: Wait for room when the shard's queue is full
+            timeout: Longest wait when blocking
+
+        Returns:
+            Future: Resolved when the update has been processed
+
+        Raises:
+            queue.Full: If the shard's queue is full (non-blocking or after ``timeout``)
+            RuntimeError: After ``shutdown``
+        """
+        if self._shutdown:
+            raise RuntimeError("cannot submit updates after shutdown")
+        shard = self._shards[self.shard_for(bot, update_data)]
+        if shard.thread is None:
+            self._start(shard)
+
+        future = Future()
+        shard.queue.put((bot, update_data, future), block, timeout)
+        depth = shard.queue.qsize()
+        if depth > shard.max_depth:
+            shard.max_depth = depth
+        return future
+
+    def stats(self):
+        """
+        Returns:
+            list: Per shard, its queue ``depth``, ``max_depth`` seen, updates ``processed`` and whether it is ``busy``
+        """
+        return [
+            {
+                'shard': index,
+                'depth': shard.queue.qsize(),
+                'max_depth': shard.max_depth,
+                'processed': shard.processed,
+                'busy': shard.busy,
+            }
+            for index, shard in enumerate(self._shards)
+        ]
+
+    def pending(self):
+        """Updates waiting in all shards."""
+        return sum(shard.queue.qsize() for shard in self._shards)
+
+    def shutdown(self, wait=True):
+        """Stops the workers after the queued updates; with ``wait``, blocks until they are done."""
+        with self._lock:
+            self._shutdown = True
+            started = [shard for shard in self._shards if shard.thread is not None]
+        for shard in started:
+            shard.queue.put(None)
+        if wait:
+            for shard in started:
+                shard.thread.join()
+
+    def _start(self, shard):
+        with self._lock:
+            if shard.thread is None:
+                index = self._shards.index(shard)
+                shard.thread = threading.Thread(
+                    target=self._work, args=(shard,), name=f'{self.name}-{index}', daemon=True
+                )
+                shard.thread.start()
+
+    def _work(self, shard):
+        while True:
+            item = shard.queue.get()
+            if item is None:
+                return
+            bot, update_data, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            shard.busy = True
+            try:
+                future.set_result(self.handler(bot, update_data))
+            except Exception as e:
+                logger.exception(f"Error processing update for {bot.name}")
+                future.set_exception(e)
+            finally:
+                shard.busy = False
+                shard.processed += 1
+                # Long-lived thread: drop database connections that broke or outlived CONN_MAX_AGE,
+                # as Django does at the end of a request
+                close_old_connections()
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """The process-wide executor used by the webhook views (created on first use)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ChatShardedExecutor()
+    return _executor
@@ -1,11 +1,225 @@
-import types
+import re
 import inspect
+from collections.abc import MutableMapping
+from types import MappingProxyType
 
 """
 Handler management module for Telegram bots.
 This module includes the BotHandlerManager class, which is responsible for registering and managing handlers.
 """
 
+_DELETED = object()
+
+
+class _BoundHandlers(MutableMapping):
+    """
+    View of a class-level handler table, bound to one bot instance.
+    Handlers are bound to the instance on access, so creating the view costs nothing.
+    Assignments and deletions (e.g. self.message_handlers['hi'] = self.greet) go to a
+    per-instance overlay and leave the class table untouched.
+    """
+    __slots__ = ('_table', '_instance', '_overlay')
+
+    def __init__(self, table, instance):
+        self._table = table
+        self._instance = instance
+        self._overlay = None
+
+    @property
+    def overridden(self):
+        """ True once handlers were added, replaced or removed on this instance. """
+        return bool(self._overlay)
+
+    def __getitem__(self, key):
+        if self._overlay and key in self._overlay:
+            entry = self._overlay[key]
+            if entry is _DELETED:
+                raise KeyError(key)
+            return entry
+        entry = self._table[key]
+        if isinstance(entry, tuple):
+            match_type, func = entry
+            return match_type, func.__get__(self._instance)
+        return entry.__get__(self._instance)
+
+    def __setitem__(self, key, value):
+        if self._overlay is None:
+            self._overlay = {}
+        self._overlay[key] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self[key] = _DELETED
+
+    def __iter__(self):
+        overlay = self._overlay or {}
+        for key in self._table:
+            if overlay.get(key) is not _DELETED:
+                yield key
+        for key, value in overlay.items():
+            if key not in self._table and value is not _DELETED:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+def _resolve_bound(handlers, data):
+    """ Exact match, else longest prefix, over a (match_type, handler) table changed on its instance. """
+    entry = handlers.get(data)
+    if entry is not None and entry[0] == 'exact':
+        return entry[1]
+    best = None
+    for prefix, (match_type, handler) in handlers.items():
+        if match_type == 'startswith' and data.startswith(prefix) and (best is None or len(prefix) > len(best[0])):
+            best = (prefix, handler)
+    return best[1] if best else None
+
+
+class PrefixRouter:
+    """
+    Router for string keys with exact matches and longest-prefix matches.
+    Prefixes are stored in a character trie, so a lookup costs O(len(data))
+    no matter how many prefixes are registered, and the longest matching
+    prefix always wins.
+    """
+    __slots__ = ('_exact', '_trie')
+
+    # کلید نگهداری هندلر در هر گره از trie
+    _HANDLER = object()
+
+    def __init__(self):
+        self._exact = {}
+        self._trie = {}
+
+    def add_exact(self, key, handler):
+        """ Registers a handler for data equal to key. """
+        self._exact[key] = handler
+
+    def add_prefix(self, prefix, handler):
+        """ Registers a handler for data starting with prefix. """
+        node = self._trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[self._HANDLER] = handler
+
+    def resolve(self, data):
+        """ Returns the exact-match handler, else the longest-prefix handler, else None. """
+        handler = self._exact.get(data)
+        if handler is not None:
+            return handler
+
+        node = self._trie
+        handler = node.get(self._HANDLER)
+        for char in data:
+            node = node.get(char)
+            if node is None:
+                break
+            handler = node.get(self._HANDLER, handler)
+        return handler
+
+
+def _message_field(message, name, default=None):
+    """ Reads a field from a Message object or a raw message dict. """
+    if isinstance(message, dict):
+        return message.get(name, default)
+    return getattr(message, name, default)
+
+
+class MessageMatcher:
+    """
+    Matcher for on_message(command=...), on_message(regex=...) and on_message(content_type=...).
+    Commands are a dict lookup on the first word of the text. All regex patterns are
+    compiled into one alternation with a named group per handler, so finding the
+    handler is a single re.match no matter how many patterns are registered (patterns
+    that refer to groups by number, like \\1, are matched one by one instead).
+    """
+
+    # فلگ‌هایی که می‌توان به صورت محلی (?i:...) روی هر الگو اعمال کرد
+    _SCOPED_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'), (re.VERBOSE, 'x'))
+
+    # \1 .. \99 یا (?(1)...)؛ تطابق اضافی (مثلا \\1) فقط به تطبیق ترتیبی می‌انجامد که همیشه درست است
+    _GROUP_NUMBER = re.compile(r'\\[1-9]|\(\?\(\d')
+
+    def __init__(self):
+        self._commands = {}
+        self._patterns = []
+        self._content_types = {}
+        self._combined = None
+
+    def add_command(self, command, handler):
+        """ Registers a handler for a bot command such as '/start'. """
+        self._commands[command.lstrip('/').lower()] = handler
+
+    def add_regex(self, pattern, handler):
+        """ Registers a handler for text matching a pattern (str or compiled) from its start. """
+        self._patterns.append((re.compile(pattern), handler))
+
+    def add_content_type(self, content_type, handler):
+        """ Registers a handler for messages carrying a field such as 'photo' or 'document'. """
+        self._content_types[content_type] = handler
+
+    def compile(self):
+        """ Builds the combined regex; falls back to sequential matching if the patterns cannot be merged. """
+        if not self._patterns or any(self._uses_group_numbers(pattern) for pattern, _ in self._patterns):
+            # گروه‌های نام‌دار _hN شماره گروه‌ها را جابجا می‌کنند، پس \1 یا (?(1)...) به گروه اشتباه اشاره می‌کند
+            self._combined = None
+            return
+        alternatives = []
+        for index, (pattern, _) in enumerate(self._patterns):
+            flags = ''.join(char for flag, char in self._SCOPED_FLAGS if pattern.flags & flag)
+            source = f'(?{flags}:{pattern.pattern})' if flags else pattern.pattern
+            alternatives.append(f'(?P<_h{index}>{source})')
+        try:
+            self._combined = re.compile('|'.join(alternatives))
+        except re.error:
+            # مثلا نام گروه تکراری در دو الگو یا فلگ سراسری وسط الگو
+            self._combined = None
+
+    @classmethod
+    def _uses_group_numbers(cls, pattern):
+        """ True if the pattern may refer to a group by number (a backreference or a conditional). """
+        source = pattern.pattern
+        if isinstance(source, bytes):
+            source = source.decode('latin-1')
+        return cls._GROUP_NUMBER.search(source) is not None
+
+    def match_command(self, text):
+        """ Returns (handler, args) for a registered command, else (None, None). """
+        if not self._commands or not text.startswith('/'):
+            return None, None
+        parts = text.split()
+        # '/start@MyBot' -> 'start'
+        command = parts[0][1:].split('@', 1)[0].lower()
+        handler = self._commands.get(command)
+        if handler is None:
+            return None, None
+        return handler, parts[1:]
+
+    def match_regex(self, text):
+        """ Returns (handler, match) for the first registered pattern matching text, else (None, None). """
+        if self._combined is not None:
+            combined = self._combined.match(text)
+            if combined is None:
+                return None, None
+            pattern, handler = self._patterns[int(combined.lastgroup[2:])]
+            # match دوباره فقط روی الگوی برنده تا گروه‌های خود الگو در دسترس باشند
+            return handler, pattern.match(text)
+        for pattern, handler in self._patterns:
+            match = pattern.match(text)
+            if match:
+                return handler, match
+        return None, None
+
+    def match_content_type(self, message):
+        """ Returns the handler of the first registered content type present in message, else None. """
+        for content_type, handler in self._content_types.items():
+            if _message_field(message, content_type):
+                return handler
+        return None
+
+
 class BotHandlerManager:
     """
     Base class for managing handlers in a bot.
@@ -28,6 +242,8 @@ class BotHandlerManager:
             return decorator
         return decorator_wrapper
 
+    # on_message('text') | on_message(command='/start') -> handler(message, user, args)
+    # on_message(regex=r'...') -> handler(message, user, match) | on_message(content_type='photo')
     # تعریف دکوریتورها به عنوان ویژگی‌های کلاس (Class Attributes)
     # این کار آن‌ها را در زمان تعریف کلاس فرزند قابل دسترسی می‌سازد.
     on_message = _handler_factory('message')
@@ -35,93 +251,182 @@ class BotHandlerManager:
     on_stage = _handler_factory('stage')
     on_inline_query = _handler_factory('inline_query')
 
-    def __init__(self):
-        self.message_handlers = {}
-        self.callback_handlers = {}
-        self.stage_handlers = {}
-        self.inline_query_handlers = {}
+    # جدول‌های هندلر کامپایل‌شده در سطح کلاس (در __init_subclass__ پر می‌شوند)
+    _message_table = MappingProxyType({})
+    _callback_table = MappingProxyType({})
+    _stage_table = MappingProxyType({})
+    _inline_query_table = MappingProxyType({})
+    _callback_router = PrefixRouter()
+    _stage_router = PrefixRouter()
+    _message_matcher = MessageMatcher()
 
-    def _register_handlers(self):
+    def __init_subclass__(cls, **kwargs):
         """
-        This method iterates through all methods of the class, finds decorated ones,
-        and registers them in the appropriate dictionaries.
+        Compiles the handler tables once per class, when the subclass is defined,
+        so creating a bot instance per update does not rescan its attributes.
         """
-        for attr_name in dir(self):
-            # نادیده گرفتن متدهای سیستمی (Dunder methods) برای جلوگیری از خطای 'method-wrapper'
+        super().__init_subclass__(**kwargs)
+        cls._compile_handlers()
+
+    @classmethod
+    def _compile_handlers(cls):
+        """
+        This method iterates through all functions of the class, finds decorated ones,
+        and stores them (unbound) in immutable class-level dispatch tables.
+        """
+        message_table = {}
+        callback_table = {}
+        stage_table = {}
+        inline_query_table = {}
+        callback_router = PrefixRouter()
+        stage_router = PrefixRouter()
+        message_matcher = MessageMatcher()
+
+        # ترتیب تعریف متدها در کلاس‌ها، برای اولویت الگوهای regex
+        definition_order = {}
+        for klass in reversed(cls.__mro__):
+            for name in vars(klass):
+                definition_order.setdefault(name, len(definition_order))
+        regex_handlers = []
+
+        for attr_name in dir(cls):
+            # نادیده گرفتن متدهای سیستمی (Dunder methods)
             if attr_name.startswith('__'):
                 continue
-            
-            try:
-                method = getattr(self, attr_name)
-            except AttributeError:
-                # در صورت خطای دسترسی به ویژگی، ادامه نده
-                continue
 
-            # اطمینان از اینکه شیء یک متد نمونه قابل فراخوانی است.
-            if not isinstance(method, types.MethodType):
+            func = getattr(cls, attr_name, None)
+
+            # فقط توابع معمولی (متدهای نمونه) ثبت می‌شوند
+            if not inspect.isfunction(func):
                 continue
-                
-            # دریافت تابع اصلی (unbound function) برای دسترسی به متادیتا
-            func = method.__func__
-            
-            # بررسی متادیتا ثبت هندلر
-            if hasattr(func, '_handler_info'):
-                for info in func._handler_info:
-                    registry = info['registry']
-                    args = info['args']
-                    kwargs = info['kwargs']
-                    
-                    if registry == 'message':
-                        # در اینجا args[0] متن فرمان یا پیام است
-                        if args:
-                            text = args[0]
-                            # ثبت متد (Bound Method) برای حفظ دسترسی به 'self'
-                            self.message_handlers[text] = method 
-                    
-                    elif registry == 'stage':
-                        if args:
-                            stage = args[0]
-                            self.stage_handlers[stage] = ('exact', method)
-                        elif 'startswith' in kwargs:
-                            key = kwargs['startswith']
-                            self.stage_handlers[key] = ('startswith', method)
-                    
-                    elif registry == 'inline_query':
-                        self.inline_query_handlers['handler'] = method
-                    
-                    elif registry == 'callback':
-                        if 'data' in kwargs:
-                            key = kwargs['data']
-                            self.callback_handlers[key] = ('exact', method)
-                        elif 'startswith' in kwargs:
-                            key = kwargs['startswith']
-                            self.callback_handlers[key] = ('startswith', method)
-                            
+
+            for info in getattr(func, '_handler_info', ()):
+                registry = info['registry']
+                args = info['args']
+                kwargs = info['kwargs']
+
+                if registry == 'message':
+                    # در اینجا args[0] متن فرمان یا پیام است
+                    if args:
+                        message_table[args[0]] = func
+                    elif 'command' in kwargs:
+                        message_matcher.add_command(kwargs['command'], func)
+                    elif 'regex' in kwargs:
+                        regex_handlers.append((definition_order[attr_name], kwargs['regex'], func))
+                    elif 'content_type' in kwargs:
+                        message_matcher.add_content_type(kwargs['content_type'], func)
+
+                elif registry == 'stage':
+                    if args:
+                        stage_table[args[0]] = ('exact', func)
+                        stage_router.add_exact(args[0], func)
+                    elif 'startswith' in kwargs:
+                        stage_table[kwargs['startswith']] = ('startswith', func)
+                        stage_router.add_prefix(kwargs['startswith'], func)
+
+                elif registry == 'inline_query':
+                    inline_query_table['handler'] = func
+
+                elif registry == 'callback':
+                    if 'data' in kwargs:
+                        callback_table[kwargs['data']] = ('exact', func)
+                        callback_router.add_exact(kwargs['data'], func)
+                    elif 'startswith' in kwargs:
+                        callback_table[kwargs['startswith']] = ('startswith', func)
+                        callback_router.add_prefix(kwargs['startswith'], func)
+
+        for _, pattern, func in sorted(regex_handlers, key=lambda item: item[0]):
+            message_matcher.add_regex(pattern, func)
+        message_matcher.compile()
+
+        cls._message_table = MappingProxyType(message_table)
+        cls._message_matcher = message_matcher
+        cls._callback_table = MappingProxyType(callback_table)
+        cls._stage_table = MappingProxyType(stage_table)
+        cls._inline_query_table = MappingProxyType(inline_query_table)
+        # روترها جدا از جدول‌ها ساخته می‌شوند تا exact و startswith با کلید یکسان هر دو حفظ شوند
+        cls._callback_router = callback_router
+        cls._stage_router = stage_router
+
+    def __init__(self):
+        self._register_handlers()
+
+    def _register_handlers(self):
+        """
+        Binds the class dispatch tables to this instance.
+        This is constant-time: handlers are bound lazily when they are looked up.
+        """
+        self.message_handlers = _BoundHandlers(self._message_table, self)
+        self.callback_handlers = _BoundHandlers(self._callback_table, self)
+        self.stage_handlers = _BoundHandlers(self._stage_table, self)
+        self.inline_query_handlers = _BoundHandlers(self._inline_query_table, self)
+
     def handle_message(self, message, user):
-        """ Handles incoming messages. """
-        text = message.get('text', '')
+        """
+        Handles incoming messages. Handlers are tried in this order:
+        exact text -> command (called with args) -> regex (called with the match) -> content type.
+        """
+        text = _message_field(message, 'text') or ''
         handler = self.message_handlers.get(text)
         
         if handler:
             print(f"-> Handler found for message: '{text}'. Executing...")
             handler(message, user) 
             return True
+
+        matcher = self._message_matcher
+        if text:
+            handler, args = matcher.match_command(text)
+            if handler:
+                handler(self, message, user, args)
+                return True
+
+            handler, match = matcher.match_regex(text)
+            if handler:
+                handler(self, message, user, match)
+                return True
+
+        handler = matcher.match_content_type(message)
+        if handler:
+            handler(self, message, user)
+            return True
         
         print(f"-> No specific handler found for message: '{text}'.")
         self.unknown_message(message, user)
         return False
 
     def handle_callback_query(self, callback_query, user):
-        data = callback_query.data
-        handler_info = self.callback_handlers.get(data)
-        if handler_info and handler_info[0] == 'exact':
-            handler_info[1](callback_query, user)
-            return
-        for prefix, (match_type, handler) in self.callback_handlers.items():
-            if match_type == 'startswith' and data.startswith(prefix):
+        """ Handles callback queries: exact data first, then the longest matching prefix. """
+        data = callback_query.data or ''
+        if self.callback_handlers.overridden:
+            # Handlers were changed on this instance: its own table decides
+            handler = _resolve_bound(self.callback_handlers, data)
+            if handler:
                 handler(callback_query, user)
                 return
+        else:
+            handler = self._callback_router.resolve(data)
+            if handler:
+                handler(self, callback_query, user)
+                return
         self.unknown_action(callback_query)
+
+    def handle_stage(self, stage, *args, **kwargs):
+        """
+        Runs the handler registered for a stage: exact stage first, then the longest matching prefix.
+        Returns True if a handler was found.
+        """
+        if self.stage_handlers.overridden:
+            handler = _resolve_bound(self.stage_handlers, stage or '')
+            if handler:
+                handler(*args, **kwargs)
+                return True
+            return False
+        handler = self._stage_router.resolve(stage or '')
+        if handler:
+            handler(self, *args, **kwargs)
+            return True
+        return False
         
     def handle_inline_query(self, inline_query):
         if 'handler' in self.inline_query_handlers:
@@ -129,7 +434,7 @@ class BotHandlerManager:
 
     def unknown_message(self, message, user):
         """ Default method for unknown messages. """
-        print(f"-> Unknown message received: {message.get('text', 'N/A')}")
+        print(f"-> Unknown message received: {_message_field(message, 'text', 'N/A')}")
         pass
     
     def unknown_action(self, callback_query):
@@ -1,14 +1,24 @@
 from django.core.management.base import BaseCommand, CommandError
 from monogram.models import BotManager
+from monogram.polling import UpdatePoller, PollingSupervisor
+from monogram.exceptions import Conflict
+from monogram.updatequeue import QueueWorker
 from django.conf import settings
 import sys
+import asyncio
 
 class Command(BaseCommand):
     help = 'Manage Telegram bots through command line interface'
 
     def add_arguments(self, parser):
-        parser.add_argument('action', nargs='?', type=str, help='Action to perform: add, list, delete or [information/setWebhook/deleteWebhook/webhookInfo] botname')
+        parser.add_argument('action', nargs='?', type=str, help='Action to perform: add, list, delete, supervise, worker, poll or [information/setWebhook/deleteWebhook/webhookInfo] botname')
         parser.add_argument('botname', nargs='?', type=str, help='Name of the bot to manage')
+        parser.add_argument('--limit', type=int, help='poll/supervise: updates per getUpdates batch (1-100); worker: updates claimed at a time')
+        parser.add_argument('--timeout', type=int, help='poll/supervise: long polling timeout in seconds')
+        parser.add_argument('--workers', type=int, help='poll/supervise/worker: chats processed concurrently')
+        parser.add_argument('--bots', type=str, help='supervise/worker: comma-separated bot names (default: all bots)')
+        parser.add_argument('--visibility-timeout', type=int, help='worker: seconds before an unacknowledged update is claimed again')
+        parser.add_argument('--report-interval', type=int, help='supervise: seconds between updates/sec reports (0 disables)')
 
     def handle(self, *args, **options):
         action = options.get('action')
@@ -32,6 +42,15 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.ERROR(f'Please provide a bot name for {action}'))
                 return
             self.manage_bot(action, botname)
+        elif action == 'poll':
+            if not botname:
+                self.stdout.write(self.style.ERROR('Please provide a bot name to poll'))
+                return
+            self.poll_bot(botname, options)
+        elif action == 'supervise':
+            self.supervise_bots(options)
+        elif action == 'worker':
+            self.run_worker(options)
         else:
             self.stdout.write(self.style.ERROR('Invalid action'))
 
@@ -144,6 +163,8 @@ class Command(BaseCommand):
             return
             
         webhook_path = f'/monogram/webhook/{bot.name}/'
+        if getattr(settings, 'MONOGRAM_ASYNC_WEBHOOK', False):
+            webhook_path += 'async/'
         webhook_url = f'https://{settings.DOMAIN_NAME}{webhook_path}'
         
         try:
@@ -220,6 +241,103 @@ class Command(BaseCommand):
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'Error: {str(e)}'))
 
+    def poll_bot(self, botname, options):
+        """Receive updates with long polling instead of a webhook"""
+        try:
+            bot = BotManager.objects.get(name=botname)
+        except BotManager.DoesNotExist:
+            self.stdout.write(self.style.ERROR(f'Bot with name "{botname}" does not exist'))
+            return
+
+        if options.get('limit') is not None and not 1 <= options['limit'] <= 100:
+            raise CommandError('--limit must be between 1 and 100')
+
+        if bot.webhook_active:
+            self.stdout.write(self.style.WARNING('Webhook is active; delete it first with "monogram deleteWebhook <botname>"'))
+            return
+
+        poller = UpdatePoller(
+            bot,
+            limit=options.get('limit'),
+            timeout=options.get('timeout'),
+            workers=options.get('workers'),
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Polling updates for "{bot.name}" from offset {poller.offset or 0} (Ctrl+C to stop)'
+        ))
+        try:
+            poller.run()
+        except KeyboardInterrupt:
+            poller.stop()
+            self.stdout.write('\nPolling stopped')
+        except Conflict as e:
+            raise CommandError(f'Cannot poll "{bot.name}": {e.description}. Is a webhook set or another poller running?')
+        finally:
+            self.stdout.write(f'Processed {poller.updates} updates in {poller.batches} batches')
+
+    def supervise_bots(self, options):
+        """Long-poll many bots from this process"""
+        if options.get('limit') is not None and not 1 <= options['limit'] <= 100:
+            raise CommandError('--limit must be between 1 and 100')
+
+        bots = BotManager.objects.exclude(object__isnull=True).exclude(object='')
+        if options.get('bots'):
+            names = [name.strip() for name in options['bots'].split(',') if name.strip()]
+            bots = bots.filter(name__in=names)
+            missing = set(names) - set(bots.values_list('name', flat=True))
+            if missing:
+                raise CommandError(f'Unknown bots or bots without a class: {", ".join(sorted(missing))}')
+
+        with_webhook = [bot.name for bot in bots if bot.webhook_active]
+        if with_webhook:
+            self.stdout.write(self.style.WARNING(f'Skipping bots with an active webhook: {", ".join(with_webhook)}'))
+        bots = [bot for bot in bots if not bot.webhook_active]
+        if not bots:
+            self.stdout.write(self.style.ERROR('No bots to poll'))
+            return
+
+        supervisor = PollingSupervisor(
+            bots,
+            limit=options.get('limit'),
+            timeout=options.get('timeout'),
+            workers=options.get('workers'),
+            report_interval=options.get('report_interval'),
+            report=self.stdout.write,
+        )
+        try:
+            asyncio.run(supervisor.run())
+        except KeyboardInterrupt:
+            self.stdout.write('\nSupervisor stopped')
+        finally:
+            updates = sum(stats['updates'] for stats in supervisor.stats().values())
+            self.stdout.write(f'Processed {updates} updates for {len(supervisor.pollers)} bots')
+
+    def run_worker(self, options):
+        """Process updates stored in the durable queue"""
+        names = None
+        if options.get('bots'):
+            names = [name.strip() for name in options['bots'].split(',') if name.strip()]
+            missing = set(names) - set(BotManager.objects.filter(name__in=names).values_list('name', flat=True))
+            if missing:
+                raise CommandError(f'Unknown bots: {", ".join(sorted(missing))}')
+
+        worker = QueueWorker(
+            bots=names,
+            batch_size=options.get('limit'),
+            workers=options.get('workers'),
+            visibility_timeout=options.get('visibility_timeout'),
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Worker {worker.worker_id} processing queued updates for {", ".join(names) if names else "all bots"} (Ctrl+C to stop)'
+        ))
+        try:
+            worker.run()
+        except KeyboardInterrupt:
+            worker.stop()
+            self.stdout.write('\nWorker stopped')
+        finally:
+            self.stdout.write(f'Processed {worker.processed} updates ({worker.failed} failed)')
+
     def add_bot(self):
         """Interactive bot creation process"""
         self.stdout.write(self.style.NOTICE("""
@@ -516,7 +634,7 @@ You will need to provide:
                 if bot.webhook_active:
                     try:
                         response = bot.deleteWebhook(return_response=True)
-                        if response and response.status_code == 200:
+                        if response:
                             self.stdout.write(self.style.SUCCESS('Webhook removed successfully'))
                     except Exception as e:
                         self.stdout.write(self.style.WARNING(f'Failed to remove webhook: {str(e)}'))
@@ -1,9 +1,8 @@
 from typing import Optional, Dict, Any, Union, List
-from monogram.text import format_text
 from monogram.monoTypes import ChatMember, File, InputFile, Message
-from .network import Network
+from .network import Network, AsyncNetwork
+import functools
 import requests
-import json
 import logging
 
 
@@ -16,6 +15,7 @@ class Methods(Network):
         endpoint: str,
         proxy: bool,
         proxy_url: str,
+        **kwargs
     ):
         """
         Initialize the Methods class with connection parameters.
@@ -26,6 +26,7 @@ class Methods(Network):
             endpoint: Base endpoint URL for the service
             proxy: Whether to use proxy
             proxy_url: Proxy server URL (if proxy is enabled)
+            **kwargs: Timeout and connection pool options (see BaseNetwork)
         """
 
         super().__init__(
@@ -34,6 +35,7 @@ class Methods(Network):
             endpoint=endpoint,
             proxy=proxy,
             proxy_url=proxy_url,
+            **kwargs
         )
 
     def sendMessage(
@@ -72,7 +74,7 @@ class Methods(Network):
         # Prepare base message payload
         payload = {
             'chat_id': chat_id,
-            'text': format_text(text),
+            'text': text,
             'parse_mode': parse_mode,
             'reply_markup': reply_markup,
             **kwargs
@@ -81,17 +83,12 @@ class Methods(Network):
         # Remove None values to avoid sending null parameters
         clean_payload = self._prepare_payload(payload)
 
-        # Serialize JSON-compatible values
-        if isinstance(clean_payload.get('reply_markup'), dict):
-            clean_payload['reply_markup'] = json.dumps(clean_payload['reply_markup'])
-
         try:
-            result =  self.request(
+            return self._convert(self.request(
                 method="sendMessage",
                 payload=clean_payload,
                 return_response=return_response
-            )
-            return Message(**result)
+            ), _message)
         except requests.exceptions.RequestException as e:
             logging.error(f"Failed to send message to chat {chat_id}")
             raise  # Re-raise the exception for caller handling
@@ -146,56 +143,33 @@ class Methods(Network):
             'max_connections': max_connections,
             'drop_pending_updates': drop_pending_updates,
             'secret_token': secret_token,
+            'allowed_updates': allowed_updates,
             **kwargs
         }
 
-        # Handle allowed_updates as a JSON-serialized list
-        if allowed_updates is not None:
-            payload['allowed_updates'] = json.dumps(allowed_updates)
-
         # Remove None values from the payload
         clean_payload = self._prepare_payload(payload)
 
         files = {}
         if certificate:
-            if isinstance(certificate, str): # Assume it's a file path
-                try:
-                    files['certificate'] = open(certificate, 'rb')
-                except FileNotFoundError:
-                    logging.error(f"Certificate file not found at: {certificate}")
-                    raise
+            if isinstance(certificate, str): # Assume it's a file path, opened by the transport
+                files['certificate'] = InputFile(certificate)
             elif isinstance(certificate, bytes): # Assume it's file content
                 files['certificate'] = ('certificate.pem', certificate, 'application/x-pem-file')
             else:
                 raise TypeError("Certificate must be a file path (str) or file content (bytes).")
 
         try:
-            # If files are present, requests will automatically set the Content-Type to multipart/form-data
-            # For JSON data, we should use 'data' instead of 'json' for requests.post when 'files' is also used.
-            # We'll need to send the payload as a dictionary of strings, not json=...
-            if files:
-                # Convert non-file payload items to strings for multipart/form-data
-                data_payload = {k: str(v) for k, v in clean_payload.items()}
-                response = self.request(
-                    method="setWebhook",
-                    payload=data_payload, # Pass as data, not json
-                    return_response=return_response,
-                    files=files # Pass files separately
-                )
-            else:
-                response = self.request(
-                    method="setWebhook",
-                    payload=clean_payload, # Pass as JSON
-                    return_response=return_response
-                )
-            return response
+            # With a certificate the request is sent as multipart/form-data, otherwise as JSON
+            return self.request(
+                method="setWebhook",
+                payload=clean_payload,
+                return_response=return_response,
+                files=files or None
+            )
         except requests.exceptions.RequestException as e:
             logging.error(f"Failed to set webhook for URL: {url}. Error: {e}")
             raise
-        finally:
-            # Ensure file handles are closed if opened
-            if 'certificate' in files and hasattr(files['certificate'], 'close'):
-                files['certificate'].close()
 
     def deleteWebhook(
         self,
@@ -263,6 +237,65 @@ class Methods(Network):
             logging.error(f"Failed to get webhook information. Error: {e}")
             raise
 
+    def getUpdates(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        timeout: Optional[int] = None,
+        allowed_updates: Optional[List[str]] = None,
+        return_response: bool = True,
+        **kwargs: Any
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Receive incoming updates using long polling. Does not work while a webhook is set.
+
+        Args:
+            offset: Identifier of the first update to be returned; pass the last received
+                update_id + 1 to confirm everything before it.
+            limit: Number of updates to retrieve, 1-100 (defaults to 100).
+            timeout: Long polling timeout in seconds (0 for short polling).
+            allowed_updates: Update types to receive, e.g. ["message", "callback_query"].
+            return_response: Whether to return the API result.
+            **kwargs: Additional API parameters for future extensions.
+
+        Returns:
+            List of raw update dicts if return_response=True, None otherwise.
+            Build Update objects with monogram.dispatch.parse_update.
+
+        Raises:
+            ValueError: If limit is out of range.
+            TelegramError: Conflict if a webhook is set or another poller is running.
+        """
+        if limit is not None and not 1 <= limit <= 100:
+            raise ValueError("limit must be between 1 and 100")
+
+        payload = {
+            'offset': offset,
+            'limit': limit,
+            'timeout': timeout,
+            'allowed_updates': allowed_updates,
+            **kwargs
+        }
+
+        clean_payload = self._prepare_payload(payload)
+
+        # The HTTP read timeout has to outlast the long polling timeout
+        request_timeout = None
+        if timeout:
+            connect, read = self.timeout if isinstance(self.timeout, (tuple, list)) else (self.timeout, self.timeout)
+            request_timeout = (connect, read + timeout)
+
+        try:
+            return self.request(
+                method="getUpdates",
+                payload=clean_payload,
+                return_response=return_response,
+                timeout=request_timeout
+            )
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Failed to get updates. Error: {e}")
+            raise
+
     def answerCallbackQuery(
         self,
         callback_query_id: str,
@@ -303,7 +336,7 @@ class Methods(Network):
 
         payload = {
             'callback_query_id': callback_query_id,
-            'text': format_text(text),
+            'text': text,
             'show_alert': show_alert,
             'url': url,
             'cache_time': cache_time,
@@ -650,14 +683,6 @@ class Methods(Network):
         # Remove None values from the payload
         clean_payload = self._prepare_payload(payload)
 
-        # Serialize JSON-compatible values if they are dictionaries/lists
-        if isinstance(clean_payload.get('reply_markup'), dict):
-            clean_payload['reply_markup'] = json.dumps(clean_payload['reply_markup'])
-        if isinstance(clean_payload.get('reply_parameters'), dict):
-            clean_payload['reply_parameters'] = json.dumps(clean_payload['reply_parameters'])
-        if isinstance(clean_payload.get('caption_entities'), list):
-            clean_payload['caption_entities'] = json.dumps(clean_payload['caption_entities'])
-
         try:
             return self.request(
                 method="copyMessage",
@@ -1012,10 +1037,6 @@ class Methods(Network):
         # Remove None values from the payload
         clean_payload = self._prepare_payload(payload)
 
-        # Serialize JSON-compatible values if they are dictionaries
-        if isinstance(clean_payload.get('scope'), dict):
-            clean_payload['scope'] = json.dumps(clean_payload['scope'])
-
         try:
             return self.request(
                 method="deleteMyCommands",
@@ -1444,13 +1465,11 @@ class Methods(Network):
         clean_payload = self._prepare_payload(payload)
 
         try:
-            response =  self.request(
+            return self._convert(self.request(
                 method="getChatMember",
                 payload=clean_payload,
                 return_response=return_response
-            )
-            if response:
-                return ChatMember(**response)
+            ), lambda response: ChatMember(**response))
         except requests.exceptions.RequestException as e:
             logging.error(f"Failed to get chat member {user_id} for chat {chat_id}. Error: {e}")
             raise
@@ -1579,14 +1598,11 @@ class Methods(Network):
         clean_payload = self._prepare_payload(payload)
 
         try:
-            response =  self.request(
+            return self._convert(self.request(
                 method="getFile",
                 payload=clean_payload,
                 return_response=return_response
-            )
-            if response:
-                response['bot'] = self
-                return File(**response)
+            ), lambda response: File(**response, bot=self))
         except requests.exceptions.RequestException as e:
             logging.error(f"Failed to get file information for file_id {file_id}. Error: {e}")
             raise
@@ -1698,10 +1714,6 @@ class Methods(Network):
         # Remove None values from the payload
         clean_payload = self._prepare_payload(payload)
 
-        # Serialize JSON-compatible values if they are dictionaries
-        if isinstance(clean_payload.get('scope'), dict):
-            clean_payload['scope'] = json.dumps(clean_payload['scope'])
-
         try:
             return self.request(
                 method="getMyCommands",
@@ -2296,10 +2308,6 @@ class Methods(Network):
 
         clean_payload = self._prepare_payload(payload)
 
-        # Serialize the permissions dictionary
-        if 'permissions' in clean_payload:
-            clean_payload['permissions'] = json.dumps(clean_payload['permissions'])
-
         try:
             return self.request(
                 method="restrictChatMember",
@@ -2424,6 +2432,9 @@ class Methods(Network):
             'has_spoiler': has_spoiler,
             'disable_notification': disable_notification,
             'protect_content': protect_content,
+            'caption_entities': caption_entities,
+            'reply_parameters': reply_parameters,
+            'reply_markup': reply_markup,
             **kwargs
         }
 
@@ -2435,14 +2446,6 @@ class Methods(Network):
         else: # Assume it's a file_id
             payload['animation'] = animation
 
-        # Serialize JSON-compatible values
-        if isinstance(caption_entities, list):
-            payload['caption_entities'] = json.dumps(caption_entities)
-        if isinstance(reply_parameters, dict):
-            payload['reply_parameters'] = json.dumps(reply_parameters)
-        if isinstance(reply_markup, dict):
-            payload['reply_markup'] = json.dumps(reply_markup)
-
         # Remove None values from the payload
         clean_payload = self._prepare_payload(payload)
 
@@ -2531,17 +2534,15 @@ class Methods(Network):
             'title': title,
             'disable_notification': disable_notification,
             'protect_content': protect_content,
+            'reply_markup': reply_markup,
             **kwargs
         }
 
         # Remove None values from the payload
         clean_payload = self._prepare_payload(payload)
-        if isinstance(clean_payload.get('reply_markup'), dict):
-            clean_payload['reply_markup'] = json.dumps(clean_payload['reply_markup'])
 
-        audio = InputFile(audio)
-        file = open(audio.file_path, 'rb')
-        files = {"audio": file}
+        # Opened (and closed) by the transport
+        files = {"audio": InputFile(audio)}
 
         # files = {}
         # if isinstance(audio, bytes):
@@ -2559,32 +2560,17 @@ class Methods(Network):
         #     else:
         #         payload['thumbnail'] = thumbnail
 
-        # # Serialize JSON-compatible values
-        # if isinstance(caption_entities, list):
-        #     payload['caption_entities'] = json.dumps(caption_entities)
-        # if isinstance(reply_parameters, dict):
-        #     payload['reply_parameters'] = json.dumps(reply_parameters)
-        # if isinstance(reply_markup, dict):
-        #     payload['reply_markup'] = json.dumps(reply_markup)
-
         try:
-            result = self.request(
+            return self._convert(self.request(
                 method="sendAudio",
                 payload=clean_payload,
                 return_response=return_response,
                 files=files if files else None
-            )
-            return Message(**result)
+            ), _message)
         
         except requests.exceptions.RequestException as e:
             logging.error(f"Failed to send audio to chat {chat_id}. Error: {e}")
             raise
-        finally:
-            # Close any opened file handles
-            if 'files' in locals() and files:
-                for f_key in ['audio', 'thumbnail']:
-                    if f_key in files and hasattr(files[f_key], 'close'):
-                        files[f_key].close()
 
 
  
@@ -2710,15 +2696,11 @@ class Methods(Network):
             'vcard': vcard,
             'disable_notification': disable_notification,
             'protect_content': protect_content,
+            'reply_parameters': reply_parameters,
+            'reply_markup': reply_markup,
             **kwargs
         }
 
-        # Serialize JSON-compatible values
-        if isinstance(reply_parameters, dict):
-            payload['reply_parameters'] = json.dumps(reply_parameters)
-        if isinstance(reply_markup, dict):
-            payload['reply_markup'] = json.dumps(reply_markup)
-
         clean_payload = self._prepare_payload(payload)
 
         try:
@@ -2782,15 +2764,11 @@ class Methods(Network):
             'emoji': emoji,
             'disable_notification': disable_notification,
             'protect_content': protect_content,
+            'reply_parameters': reply_parameters,
+            'reply_markup': reply_markup,
             **kwargs
         }
 
-        # Serialize JSON-compatible values
-        if isinstance(reply_parameters, dict):
-            payload['reply_parameters'] = json.dumps(reply_parameters)
-        if isinstance(reply_markup, dict):
-            payload['reply_markup'] = json.dumps(reply_markup)
-
         clean_payload = self._prepare_payload(payload)
 
         try:
@@ -2867,6 +2845,7 @@ class Methods(Network):
             'disable_content_type_detection': disable_content_type_detection,
             'disable_notification': disable_notification,
             'protect_content': protect_content,
+            'reply_markup': reply_markup,
             **kwargs
         }
 
@@ -2886,23 +2865,11 @@ class Methods(Network):
         #     else:
         #         payload['thumbnail'] = thumbnail
 
-        # # Serialize JSON-compatible values
-        # if isinstance(caption_entities, list):
-        #     payload['caption_entities'] = json.dumps(caption_entities)
-        # if isinstance(reply_parameters, dict):
-        #     payload['reply_parameters'] = json.dumps(reply_parameters)
-        # if isinstance(reply_markup, dict):
-        #     payload['reply_markup'] = json.dumps(reply_markup)
-
         # # Remove None values from the payload
         # clean_payload = self._prepare_payload(payload)
         # Remove None values from the payload
         clean_payload = self._prepare_payload(payload)
-        if isinstance(clean_payload.get('reply_markup'), dict):
-            clean_payload['reply_markup'] = json.dumps(clean_payload['reply_markup'])
 
-        audio = InputFile(audio)
-        file = open(audio.file_path, 'rb')
         files = {"document": document}
         try:
             return self.request(
@@ -2985,15 +2952,11 @@ class Methods(Network):
             'proximity_alert_radius': proximity_alert_radius,
             'disable_notification': disable_notification,
             'protect_content': protect_content,
+            'reply_parameters': reply_parameters,
+            'reply_markup': reply_markup,
             **kwargs
         }
 
-        # Serialize JSON-compatible values
-        if isinstance(reply_parameters, dict):
-            payload['reply_parameters'] = json.dumps(reply_parameters)
-        if isinstance(reply_markup, dict):
-            payload['reply_markup'] = json.dumps(reply_markup)
-
         clean_payload = self._prepare_payload(payload)
 
         try:
@@ -3052,6 +3015,8 @@ class Methods(Network):
             'message_thread_id': message_thread_id,
             'disable_notification': disable_notification,
             'protect_content': protect_content,
+            'media': media,
+            'reply_parameters': reply_parameters,
             **kwargs
         }
 
@@ -3068,16 +3033,6 @@ class Methods(Network):
                 files[thumb_name] = (f"thumb_{i}.jpg", item['thumbnail'], 'image/jpeg')
                 item['thumbnail'] = f"attach://{thumb_name}"
 
-            # Ensure caption_entities are JSON dumped within each media item if present
-            if 'caption_entities' in item and isinstance(item['caption_entities'], list):
-                item['caption_entities'] = json.dumps(item['caption_entities'])
-
-        payload['media'] = json.dumps(media) # Serialize the entire media array
-
-        # Serialize JSON-compatible values
-        if isinstance(reply_parameters, dict):
-            payload['reply_parameters'] = json.dumps(reply_parameters)
-
         # Remove None values from the payload
         clean_payload = self._prepare_payload(payload)
 
@@ -3166,30 +3121,18 @@ class Methods(Network):
         # else: # Assume it's a file_id
         #     payload['photo'] = photo
 
-        # # Serialize JSON-compatible values
-        # if isinstance(caption_entities, list):
-        #     payload['caption_entities'] = json.dumps(caption_entities)
-        # if isinstance(reply_parameters, dict):
-        #     payload['reply_parameters'] = json.dumps(reply_parameters)
-        
-        if isinstance(clean_payload.get('reply_markup'), dict):
-            clean_payload['reply_markup'] = json.dumps(clean_payload['reply_markup'])
-
         # # Remove None values from the payload
         # clean_payload = self._prepare_payload(payload)
         
-        photo = InputFile(photo)
-        # print("photo is an InputFile object")
-        file = open(photo.file_path, 'rb')
-        file = {"photo": file}
+        # Opened (and closed) by the transport
+        files = {"photo": InputFile(photo)}
         try:
-            result = self.request(
+            return self._convert(self.request(
                 method="sendPhoto",
                 payload=clean_payload,
                 return_response=return_response,
-                files=file if file else None
-            )
-            return Message(**result)
+                files=files
+            ), _message)
 
         except requests.exceptions.RequestException as e:
             logging.error(f"Failed to send photo to chat {chat_id}. Error: {e}")
@@ -3266,7 +3209,7 @@ class Methods(Network):
         payload = {
             'chat_id': chat_id,
             'question': question,
-            'options': json.dumps(options), # Must be JSON-serialized
+            'options': options,
             'message_thread_id': message_thread_id,
             'is_anonymous': is_anonymous,
             'type': type,
@@ -3279,17 +3222,12 @@ class Methods(Network):
             'is_closed': is_closed,
             'disable_notification': disable_notification,
             'protect_content': protect_content,
+            'explanation_entities': explanation_entities,
+            'reply_parameters': reply_parameters,
+            'reply_markup': reply_markup,
             **kwargs
         }
 
-        # Serialize JSON-compatible values
-        if isinstance(explanation_entities, list):
-            payload['explanation_entities'] = json.dumps(explanation_entities)
-        if isinstance(reply_parameters, dict):
-            payload['reply_parameters'] = json.dumps(reply_parameters)
-        if isinstance(reply_markup, dict):
-            payload['reply_markup'] = json.dumps(reply_markup)
-
         clean_payload = self._prepare_payload(payload)
 
         try:
@@ -3374,15 +3312,11 @@ class Methods(Network):
             'google_place_type': google_place_type,
             'disable_notification': disable_notification,
             'protect_content': protect_content,
+            'reply_parameters': reply_parameters,
+            'reply_markup': reply_markup,
             **kwargs
         }
 
-        # Serialize JSON-compatible values
-        if isinstance(reply_parameters, dict):
-            payload['reply_parameters'] = json.dumps(reply_parameters)
-        if isinstance(reply_markup, dict):
-            payload['reply_markup'] = json.dumps(reply_markup)
-
         clean_payload = self._prepare_payload(payload)
 
         try:
@@ -3468,15 +3402,13 @@ class Methods(Network):
             'supports_streaming': supports_streaming,
             'disable_notification': disable_notification,
             'protect_content': protect_content,
+            'reply_markup': reply_markup,
             **kwargs
         }
         clean_payload = self._prepare_payload(payload)
-        if isinstance(clean_payload.get('reply_markup'), dict):
-            clean_payload['reply_markup'] = json.dumps(clean_payload['reply_markup'])
 
-        video = InputFile(video)
-        file = open(video.file_path, 'rb')
-        files = {"video": file}
+        # Opened (and closed) by the transport
+        files = {"video": InputFile(video)}
         # files = {}
         # if isinstance(video, bytes):
         #     files['video'] = ('video.mp4', video, 'video/mp4')
@@ -3493,37 +3425,20 @@ class Methods(Network):
         #     else:
         #         payload['thumbnail'] = thumbnail
 
-        # # Serialize JSON-compatible values
-        # if isinstance(caption_entities, list):
-        #     payload['caption_entities'] = json.dumps(caption_entities)
-        # if isinstance(reply_parameters, dict):
-        #     payload['reply_parameters'] = json.dumps(reply_parameters)
-        # if isinstance(reply_markup, dict):
-        #     payload['reply_markup'] = json.dumps(reply_markup)
-
         # # Remove None values from the payload
         # clean_payload = self._prepare_payload(payload)
 
         try:
-            result = self.request(
+            # On success, return the sent Message object
+            return self._convert(self.request(
                 method="sendVideo",
                 payload=clean_payload,
                 return_response=return_response,
                 files=files if files else None
-            )
-            
-            # On success, return the sent Message object
-            # Uncomment and implement Message class when available
-            return Message(**result)
+            ), _message)
         except requests.exceptions.RequestException as e:
             logging.error(f"Failed to send video to chat {chat_id}. Error: {e}")
             raise
-        finally:
-            # Close any opened file handles
-            if 'files' in locals() and files:
-                for f_key in ['video', 'thumbnail']:
-                    if f_key in files and hasattr(files[f_key], 'close'):
-                        files[f_key].close()
 
     def sendVideoNote(
         self,
@@ -3584,6 +3499,8 @@ class Methods(Network):
             'length': length,
             'disable_notification': disable_notification,
             'protect_content': protect_content,
+            'reply_parameters': reply_parameters,
+            'reply_markup': reply_markup,
             **kwargs
         }
 
@@ -3601,12 +3518,6 @@ class Methods(Network):
             else:
                 payload['thumbnail'] = thumbnail
 
-        # Serialize JSON-compatible values
-        if isinstance(reply_parameters, dict):
-            payload['reply_parameters'] = json.dumps(reply_parameters)
-        if isinstance(reply_markup, dict):
-            payload['reply_markup'] = json.dumps(reply_markup)
-
         # Remove None values from the payload
         clean_payload = self._prepare_payload(payload)
 
@@ -3684,6 +3595,9 @@ class Methods(Network):
             'duration': duration,
             'disable_notification': disable_notification,
             'protect_content': protect_content,
+            'caption_entities': caption_entities,
+            'reply_parameters': reply_parameters,
+            'reply_markup': reply_markup,
             **kwargs
         }
 
@@ -3695,14 +3609,6 @@ class Methods(Network):
         else:
             payload['voice'] = voice
 
-        # Serialize JSON-compatible values
-        if isinstance(caption_entities, list):
-            payload['caption_entities'] = json.dumps(caption_entities)
-        if isinstance(reply_parameters, dict):
-            payload['reply_parameters'] = json.dumps(reply_parameters)
-        if isinstance(reply_markup, dict):
-            payload['reply_markup'] = json.dumps(reply_markup)
-
         # Remove None values from the payload
         clean_payload = self._prepare_payload(payload)
 
@@ -3860,12 +3766,10 @@ class Methods(Network):
         """
         payload = {
             'chat_id': chat_id,
+            'menu_button': menu_button,
             **kwargs
         }
 
-        if menu_button:
-            payload['menu_button'] = json.dumps(menu_button)
-
         clean_payload = self._prepare_payload(payload)
 
         try:
@@ -3915,7 +3819,7 @@ class Methods(Network):
 
         payload = {
             'chat_id': chat_id,
-            'permissions': json.dumps(permissions), # Must be JSON-serialized
+            'permissions': permissions,
             'use_independent_chat_permissions': use_independent_chat_permissions,
             **kwargs
         }
@@ -4129,14 +4033,12 @@ class Methods(Network):
             raise ValueError("commands must be a list of dictionaries with 'command' and 'description' for setMyCommands.")
 
         payload = {
-            'commands': json.dumps(commands), # Must be JSON-serialized
+            'commands': commands,
             'language_code': language_code,
+            'scope': scope,
             **kwargs
         }
 
-        if scope:
-            payload['scope'] = json.dumps(scope) # Must be JSON-serialized
-
         clean_payload = self._prepare_payload(payload)
 
         try:
@@ -4180,13 +4082,13 @@ class Methods(Network):
         """
         payload = {
             'for_channels': for_channels,
+            'rights': rights,
             **kwargs
         }
 
         if rights is not None:
             if not isinstance(rights, dict):
                 raise ValueError("rights must be a dictionary or None for setMyDefaultAdministratorRights.")
-            payload['rights'] = json.dumps(rights) # Must be JSON-serialized
 
         clean_payload = self._prepare_payload(payload)
 
@@ -4793,25 +4695,17 @@ class Methods(Network):
 
         clean_payload = self._prepare_payload(payload)
 
-        if isinstance(clean_payload.get('reply_markup'), dict):
-            clean_payload['reply_markup'] = json.dumps(clean_payload['reply_markup'])
-        if isinstance(clean_payload.get('caption_entities'), list):
-            clean_payload['caption_entities'] = json.dumps(clean_payload['caption_entities'])
-
         try:
             result = self.request(
                 method="editMessageCaption",
                 payload=clean_payload,
                 return_response=return_response
             )
-            # If we get here, result contains the actual API response data
             if inline_message_id:
                 # For inline messages, the API returns True on success
-                return result  # This should be True
-            else:
-                # For non-inline messages, the API returns the edited Message object
-                # Uncomment and implement Message class when available
-                return Message(**result)
+                return result
+            # For non-inline messages, the API returns the edited Message object
+            return self._convert(result, _message)
         except requests.exceptions.RequestException as e:
             logging.error(f"Failed to edit message caption. Error: {e}")
             raise
@@ -4876,9 +4770,6 @@ class Methods(Network):
 
         clean_payload = self._prepare_payload(payload)
 
-        if isinstance(clean_payload.get('reply_markup'), dict):
-            clean_payload['reply_markup'] = json.dumps(clean_payload['reply_markup'])
-
         try:
             return self.request(
                 method="editMessageLiveLocation",
@@ -4934,12 +4825,6 @@ class Methods(Network):
 
         clean_payload = self._prepare_payload(payload)
 
-        # Telegram API expects 'media' to be a JSON string
-        if isinstance(clean_payload.get('media'), dict):
-            clean_payload['media'] = json.dumps(clean_payload['media'])
-        if isinstance(clean_payload.get('reply_markup'), dict):
-            clean_payload['reply_markup'] = json.dumps(clean_payload['reply_markup'])
-
         # This method might require multipart/form-data if 'media' involves file uploads.
         # However, the 'media' parameter itself is a JSON object describing the media.
         # The file content usually comes in a separate 'file' field or as part of the 'media' object itself
@@ -4997,9 +4882,6 @@ class Methods(Network):
 
         clean_payload = self._prepare_payload(payload)
 
-        if isinstance(clean_payload.get('reply_markup'), dict):
-            clean_payload['reply_markup'] = json.dumps(clean_payload['reply_markup'])
-
         try:
             return self.request(
                 method="editMessageReplyMarkup",
@@ -5057,7 +4939,7 @@ class Methods(Network):
             'chat_id': chat_id,
             'message_id': message_id,
             'inline_message_id': inline_message_id,
-            'text': format_text(text),
+            'text': text,
             'parse_mode': parse_mode,
             'entities': entities,
             'link_preview_options': link_preview_options,
@@ -5067,27 +4949,17 @@ class Methods(Network):
 
         clean_payload = self._prepare_payload(payload)
 
-        if isinstance(clean_payload.get('reply_markup'), dict):
-            clean_payload['reply_markup'] = json.dumps(clean_payload['reply_markup'])
-        if isinstance(clean_payload.get('entities'), list):
-            clean_payload['entities'] = json.dumps(clean_payload['entities'])
-        if isinstance(clean_payload.get('link_preview_options'), dict):
-            clean_payload['link_preview_options'] = json.dumps(clean_payload['link_preview_options'])
-
         try:
             result = self.request(
                 method="editMessageText",
                 payload=clean_payload,
                 return_response=return_response
             )
-            # If we get here, result contains the actual API response data
             if inline_message_id:
                 # For inline messages, the API returns True on success
-                return result  # This should be True
-            else:
-                # For non-inline messages, the API returns the edited Message object
-                # Uncomment and implement Message class when available
-                return Message(**result)
+                return result
+            # For non-inline messages, the API returns the edited Message object
+            return self._convert(result, _message)
         
         except requests.exceptions.RequestException as e:
             logging.error(f"Failed to edit message text. Error: {e}")
@@ -5133,9 +5005,6 @@ class Methods(Network):
 
         clean_payload = self._prepare_payload(payload)
 
-        if isinstance(clean_payload.get('reply_markup'), dict):
-            clean_payload['reply_markup'] = json.dumps(clean_payload['reply_markup'])
-
         try:
             return self.request(
                 method="stopMessageLiveLocation",
@@ -5185,9 +5054,6 @@ class Methods(Network):
 
         clean_payload = self._prepare_payload(payload)
 
-        if isinstance(clean_payload.get('reply_markup'), dict):
-            clean_payload['reply_markup'] = json.dumps(clean_payload['reply_markup'])
-
         try:
             return self.request(
                 method="stopPoll",
@@ -5255,10 +5121,6 @@ class Methods(Network):
         clean_payload = self._prepare_payload(payload)
         
         # Serialize JSON-compatible fields
-        if isinstance(clean_payload.get('results'), list):
-            clean_payload['results'] = json.dumps(clean_payload['results'])
-        if isinstance(clean_payload.get('button'), dict):
-            clean_payload['button'] = json.dumps(clean_payload['button'])
         
         try:
             return self.request(
@@ -5268,4 +5130,71 @@ class Methods(Network):
             )
         except requests.exceptions.RequestException as e:
             logging.error(f"Failed to answer inline query {inline_query_id}. Error: {e}")
-            raise
\ No newline at end of file
+            raise
+
+
+def _message(result: Dict[str, Any]) -> Message:
+    return Message(**result)
+
+
+def _awaitable(method):
+    """
+    Build the async version of a Methods API method.
+
+    The method body runs once: it validates the arguments and builds the payload, and on an
+    AsyncMethods client its ``self.request`` (and ``self._convert``) return an awaitable,
+    which is awaited here.
+    """
+    @functools.wraps(method)
+    async def call(self, *args, **kwargs):
+        return await method(self, *args, **kwargs)
+    return call
+
+
+class AsyncMethods(AsyncNetwork):
+    """
+    Awaitable counterpart of Methods.
+
+    Exposes every Telegram API method of Methods as a coroutine with the same
+    signature and return value, running the same method bodies (validation,
+    payload building and result mapping). Requests go through AsyncNetwork's
+    pooled httpx client.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        secret_token: str,
+        endpoint: str,
+        proxy: bool,
+        proxy_url: str,
+        client: Any = None,
+        **kwargs
+    ):
+        """
+        Initialize the AsyncMethods class with connection parameters.
+
+        Args:
+            token: Authentication token for API access
+            secret_token: Secret token for additional security
+            endpoint: Base endpoint URL for the service
+            proxy: Whether to use proxy
+            proxy_url: Proxy server URL (if proxy is enabled)
+            client: Optional httpx.AsyncClient shared with other clients
+            **kwargs: Timeout and connection pool options (see BaseNetwork)
+        """
+        super().__init__(
+            token=token,
+            secret_token=secret_token,
+            endpoint=endpoint,
+            proxy=proxy,
+            proxy_url=proxy_url,
+            client=client,
+            **kwargs
+        )
+
+
+for _name, _member in list(vars(Methods).items()):
+    if not _name.startswith('_') and callable(_member):
+        setattr(AsyncMethods, _name, _awaitable(_member))
+
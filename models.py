@@ -1,6 +1,8 @@
 from django.db import models
 from django.core.exceptions import ValidationError
-from monogram.methods import Methods
+from monogram.methods import Methods, AsyncMethods
+from monogram.network import session_registry
+from monogram.dispatch import forget_bot_class
 import logging
 import secrets
 
@@ -26,7 +28,21 @@ class BotManager(Methods, models.Model):
         null=True,
         help_text="Proxy URL (e.g., 'http://proxy.example.com:8080')"
     )
+    pool_size = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+        help_text="Pooled connections for this bot (default: MONOGRAM_HTTP['pool_maxsize'])"
+    )
+    request_timeout = models.FloatField(
+        blank=True,
+        null=True,
+        help_text="Timeout of API calls in seconds (default: MONOGRAM_HTTP['timeout'])"
+    )
     webhook_active = models.BooleanField(default=False)
+    update_offset = models.BigIntegerField(
+        default=0,
+        help_text="Next update_id to request when long polling (managed by 'monogram poll')"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     object = models.CharField(
@@ -45,6 +61,8 @@ class BotManager(Methods, models.Model):
         """
         # Initialize Django model first
         models.Model.__init__(self, *args, **kwargs)
+        self._loaded_object = self.object
+        self._loaded_name = self.name
         
         # Initialize Methods with current credentials
         Methods.__init__(
@@ -54,6 +72,7 @@ class BotManager(Methods, models.Model):
             endpoint=self.endpoint,
             proxy=self.proxy,
             proxy_url=self.proxy_url,
+            **self.http_options
         )
 
     class Meta:
@@ -63,6 +82,27 @@ class BotManager(Methods, models.Model):
     def __str__(self):
         return f"{self.name} ({'Active' if self.webhook_active else 'Inactive'})"
 
+    @property
+    def http_options(self):
+        """Connection options stored on the bot, passed on to the API clients."""
+        return {'pool_maxsize': self.pool_size, 'timeout': self.request_timeout}
+
+    @property
+    def aio(self) -> AsyncMethods:
+        """
+        Awaitable API client for this bot, e.g. ``await bot.aio.sendMessage(...)``.
+
+        Cheap to create: the underlying httpx client is pooled per event loop.
+        """
+        return AsyncMethods(
+            token=self.token,
+            secret_token=self.secret_token,
+            endpoint=self.endpoint,
+            proxy=self.proxy,
+            proxy_url=self.proxy_url,
+            **self.http_options
+        )
+
     # def __getattr__(self, name):
     #     """
     #     Delegate unknown methods to the Methods API client
@@ -101,8 +141,8 @@ class BotManager(Methods, models.Model):
                     )
                     
                     # Test API connection
-                    me = self.get_me()
-                    if not me or not me.get('ok'):
+                    me = self.getMe()
+                    if not me:
                         errors['token'] = "Failed to verify token with Telegram API"
             except BotManager.DoesNotExist:
                 pass  # New instance, no need to validate against DB
@@ -114,6 +154,10 @@ class BotManager(Methods, models.Model):
     
     def save(self, *args, **kwargs):
         """Save the model and reinitialize API client with current credentials"""
+        # Remember which pooled session this instance was bound to before any changes
+        previous_session_key = self._session_key
+        previous_pool_size = self.http_config['pool_maxsize']
+
         # Run full validation first
         self.full_clean()
         if not self.secret_token:
@@ -130,4 +174,51 @@ class BotManager(Methods, models.Model):
             endpoint=self.endpoint,
             proxy=self.proxy,
             proxy_url=self.proxy_url,
+            **self.http_options
         )
+
+        # Drop the pooled session of the old credentials so it is not reused
+        # (or rebuild it when the pool is resized)
+        if previous_session_key != self._session_key:
+            session_registry.invalidate(*previous_session_key)
+        elif previous_pool_size != self.http_config['pool_maxsize']:
+            session_registry.invalidate(*self._session_key)
+            self.session = session_registry.get(*self._session_key, config=self.http_config)
+
+        # Forget the cached bot class when the class path changes
+        if self._loaded_object != self.object:
+            if self._loaded_object:
+                forget_bot_class(self._loaded_object)
+            self._loaded_object = self.object
+        # The post_save signal has dropped the cache entries of the old name by now
+        self._loaded_name = self.name
+
+
+class QueuedUpdate(models.Model):
+    """
+    Raw update stored until a worker has processed it (see updatequeue.py).
+
+    A row is claimed by setting ``claimed_at``; it is deleted once processed (acknowledged),
+    and becomes claimable again when its claim is older than the visibility timeout.
+    """
+    bot = models.ForeignKey(BotManager, on_delete=models.CASCADE, related_name='queued_updates')
+    update_id = models.BigIntegerField()
+    payload = models.TextField(help_text="Update JSON as received from Telegram")
+    created_at = models.DateTimeField(auto_now_add=True)
+    claimed_at = models.DateTimeField(blank=True, null=True)
+    claimed_by = models.CharField(max_length=64, blank=True, default='')
+    attempts = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Queued Update"
+        verbose_name_plural = "Queued Updates"
+        constraints = [
+            # Redeliveries of an update are dropped on insert
+            models.UniqueConstraint(fields=['bot', 'update_id'], name='monogram_queuedupdate_unique_update'),
+        ]
+        indexes = [
+            models.Index(fields=['claimed_at', 'id'], name='monogram_queuedupdate_claim'),
+        ]
+
+    def __str__(self):
+        return f"{self.bot_id}:{self.update_id}"
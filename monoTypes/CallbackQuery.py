@@ -30,6 +30,17 @@ class CallbackQuery(BaseType):
         super().__init__(**kwargs)
         self.bot = bot
         self.from_user = User(**self.from_user)
+        # The message the button was attached to
+        if isinstance(self.__dict__.get('message'), dict):
+            self.message = Message(bot=bot, **self.message)
+
+    @classmethod
+    def lazy(cls, bot=None, **kwargs):
+        """Creates the callback query with a lazily built message (see BaseType.lazy)."""
+        message = kwargs.get('message')
+        if isinstance(message, dict):
+            kwargs['message'] = Message.lazy(bot=bot, **message)
+        return cls(bot, **kwargs)
 
     def answerCallbackQuery(self):
         self.bot.answerCallbackQuery(self.id)
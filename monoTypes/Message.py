@@ -17,10 +17,37 @@ from monogram.monoTypes.Location import Location
 from monogram.monoTypes.Poll import Poll
 from monogram.monoTypes.Invoice import Invoice
 from monogram.monoTypes.SuccessfulPayment import SuccessfulPayment
-from monogram.text import format_text
 
 
 class Message(BaseType):
+    # Built on first access for messages created with Message.lazy (mirrors __init__)
+    _lazy_fields = {
+        'chat': lambda raw: Chat(**raw),
+        'from_user': lambda raw: User(**raw),
+        'entities': lambda raw: [MessageEntity(**entity) for entity in raw],
+        'animation': lambda raw: Animation(**raw),
+        'audio': lambda raw: Audio(**raw),
+        'document': lambda raw: Document(**raw),
+        'photo': lambda raw: [PhotoSize(**photo_size) for photo_size in raw],
+        'sticker': lambda raw: Sticker(**raw),
+        'video': lambda raw: Video(**raw),
+        'video_note': lambda raw: VideoNote(**raw),
+        'voice': lambda raw: Voice(**raw),
+        'forward_from': lambda raw: User(**raw),
+        'forward_from_chat': lambda raw: Chat(**raw),
+        'reply_to_message': lambda raw: Message.lazy(**raw),
+        'via_bot': lambda raw: User(**raw),
+        'new_chat_members': lambda raw: [User(**member) for member in raw],
+        'left_chat_member': lambda raw: User(**raw),
+        'new_chat_photo': lambda raw: [PhotoSize(**photo) for photo in raw],
+        'pinned_message': lambda raw: Message.lazy(**raw),
+        'contact': lambda raw: Contact(**raw),
+        'location': lambda raw: Location(**raw),
+        'poll': lambda raw: Poll(**raw),
+        'invoice': lambda raw: Invoice(**raw),
+        'successful_payment': lambda raw: SuccessfulPayment(**raw),
+    }
+
     def __init__(
         self,
         message_id: int,
@@ -208,7 +235,7 @@ class Message(BaseType):
         """
         return self.bot.sendMessage(
             chat_id=self.chat.id,
-            text=format_text(text),
+            text=text,
             reply_markup=keyboard,
             parse_mode=parse_mode,
             disable_web_page_preview=disable_web_page_preview
@@ -229,7 +256,7 @@ class Message(BaseType):
             Optional[dict]: The response from the Telegram API
         """
         return self.bot.editMessageText(
-            text=format_text(text),
+            text=text,
             reply_markup=keyboard,
             chat_id=self.chat.id,
             message_id=self.message_id,
@@ -255,7 +282,7 @@ class Message(BaseType):
         """
         return self.bot.sendMessage(
             chat_id=self.chat.id,
-            text=format_text(text),
+            text=text,
             reply_to_message_id=self.message_id,
             reply_markup=keyboard,
             parse_mode=parse_mode,
@@ -135,6 +135,9 @@ from monogram.monoTypes import VideoChatStarted, GeneralForumTopicHidden, Genera
     ForumTopicClosed, ForumTopicCreated, Story
 from .baseType import BaseType
 from .Update import Update
+from .slotted import SlottedType
+from .compact import CompactMessage, CompactUser, CompactChat, CompactMessageEntity, CompactPhotoSize, \
+    CompactInlineKeyboardButton, CompactInlineKeyboardMarkup, CompactCallbackQuery
 
 class CallbackGame:
     pass
@@ -287,5 +290,14 @@ __all__ = [
     'PreparedInlineMessage',
     'answerWebAppQuery',
     'SentWebAppMessage',
+    'SlottedType',
+    'CompactMessage',
+    'CompactUser',
+    'CompactChat',
+    'CompactMessageEntity',
+    'CompactPhotoSize',
+    'CompactInlineKeyboardButton',
+    'CompactInlineKeyboardMarkup',
+    'CompactCallbackQuery',
 ]
 
@@ -1,7 +1,11 @@
 from monogram.text import format_text
 from typing import Dict, Any
+import inspect
 
 class BaseType:
+    # Nested fields that lazy instances build on first access: name -> factory(raw value)
+    _lazy_fields: Dict[str, Any] = {}
+
     def __init__(self, *args, **kwargs):
         # Handle keyword arguments
         for key, value in kwargs.items():
@@ -9,10 +13,71 @@ class BaseType:
                 key = 'from_user'
             self.__dict__[key] = value   
 
+    @classmethod
+    def lazy(cls, **kwargs):
+        """
+        Creates an instance without building its nested objects.
+
+        Plain values are stored as they are; fields listed in ``_lazy_fields`` keep their
+        raw dict and are turned into objects the first time they are accessed. Fields that
+        are not in the payload fall back to the defaults of ``__init__``.
+
+        Args:
+            **kwargs: Raw fields as received from the Telegram API.
+
+        Returns:
+            An instance of the class.
+        """
+        obj = cls.__new__(cls)
+        pending = {}
+        for key, value in kwargs.items():
+            if key == 'from':
+                key = 'from_user'
+            if key in cls._lazy_fields:
+                pending[key] = value
+            else:
+                obj.__dict__[key] = value
+        obj.__dict__['_lazy_raw'] = pending
+        return obj
+
+    @classmethod
+    def _lazy_defaults(cls):
+        # Keyword defaults of __init__, read once per class
+        defaults = cls.__dict__.get('_lazy_defaults_cache')
+        if defaults is None:
+            defaults = {
+                name: param.default
+                for name, param in inspect.signature(cls.__init__).parameters.items()
+                if param.default is not inspect.Parameter.empty
+            }
+            cls._lazy_defaults_cache = defaults
+        return defaults
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails, i.e. for fields not built yet on lazy instances
+        pending = self.__dict__.get('_lazy_raw')
+        if pending is None or name.startswith('__'):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+        if name in pending:
+            raw = pending.pop(name)
+            value = self._lazy_fields[name](raw) if raw else None
+            self.__dict__[name] = value
+            return value
+        if name in self._lazy_fields:
+            return None
+
+        defaults = self._lazy_defaults()
+        if name in defaults:
+            return defaults[name]
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
     def __getitem__(self, key):
         try:
             return self.__dict__[key]
         except KeyError:
+            if key in self.__dict__.get('_lazy_raw', ()):
+                return getattr(self, key)
             raise KeyError(f'Key {key} not found.')
         except Exception as e:
             raise e
@@ -33,7 +98,7 @@ class BaseType:
 
     def __contains__(self, key):
         try:
-            return key in self.__dict__
+            return key in self.__dict__ or key in self.__dict__.get('_lazy_raw', ())
         except Exception as e:
             raise e
 
@@ -0,0 +1,191 @@
+import argparse
+import os
+import sys
+from .schema import SCHEMA
+
+"""
+Generator of compact.py.
+Every type of schema.SCHEMA becomes a slotted class whose from_dict/to_dict are written out
+field by field, so parsing and serializing never loop over or introspect the fields at runtime.
+
+Usage:
+    python -m monogram.monoTypes.codegen          # rewrite compact.py
+    python -m monogram.monoTypes.codegen --check  # exit 1 if compact.py is out of date
+"""
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'compact.py')
+
+HEADER = '''\
+# Generated by monoTypes/codegen.py from monoTypes/schema.py, do not edit by hand.
+from typing import Any, Dict
+from .slotted import SlottedType, MessageHelpers
+
+"""
+Compact variants of the high-frequency monoTypes.
+These classes use __slots__ instead of a per-instance __dict__, which makes them much smaller
+when many of them are kept in memory (e.g. conversation buffers), and come with specialized
+from_dict/to_dict methods for parsing updates and serializing payloads.
+"""
+'''
+
+
+def class_name(type_name):
+    return f'Compact{type_name}'
+
+
+def _json_key(field):
+    return field.key or field.name
+
+
+def _parse_expr(field, value, bot):
+    """Expression turning the raw JSON ``value`` of a nested field into objects."""
+    build = f'{class_name(field.type)}.from_dict'
+    arg = f', {bot}' if field.pass_bot else ''
+    if field.array == 2:
+        return f'[[{build}(item{arg}) for item in row] for row in {value}]'
+    if field.array == 1:
+        return f'[{build}(item{arg}) for item in {value}]'
+    return f'{build}({value}{arg})'
+
+
+def _dump_expr(field, value):
+    """Expression turning the nested objects of a field back into JSON values."""
+    if field.array == 2:
+        return f'[[item.to_dict() for item in row] for row in {value}]'
+    if field.array == 1:
+        return f'[item.to_dict() for item in {value}]'
+    return f'{value}.to_dict()'
+
+
+def generate_class(type_name, spec):
+    fields = spec['fields']
+    has_bot = spec.get('bot', False)
+    bot_arg = 'bot' if has_bot else 'None'
+    bases = ', '.join(['SlottedType'] + spec.get('bases', []))
+    attributes = [field.name for field in fields] + (['bot'] if has_bot else [])
+    lines = [f'class {class_name(type_name)}({bases}):']
+
+    doc = spec['doc'].split('\n')
+    if len(doc) == 1:
+        lines.append(f'    """{doc[0]}"""')
+    else:
+        lines.append('    """')
+        lines.extend(f'    {line}'.rstrip() for line in doc)
+        lines.append('    """')
+    lines.append('')
+
+    lines.append(f'    __slots__ = {tuple(attributes)!r}')
+    lines.append(f'    _fields = {tuple(attributes)!r}')
+    keys = ', '.join(repr(_json_key(field)) for field in fields)
+    lines.append(f'    _keys = frozenset(({keys},))')
+    lines.append('')
+
+    # __init__ takes the raw payload as keyword arguments, like the regular monoTypes
+    params = [f'{field.name}: Any' for field in fields if field.required]
+    if has_bot:
+        params.append('bot: Any = None')
+    params += [f'{field.name}: Any = None' for field in fields if not field.required]
+    lines.append('    def __init__(')
+    lines.append('            self,')
+    lines.extend(f'            {param},' for param in params)
+    lines.append('            **kwargs')
+    lines.append('    ):')
+    for field in fields:
+        if field.key:
+            lines.append(f'        if {field.key!r} in kwargs:')
+            lines.append(f'            {field.name} = kwargs.pop({field.key!r})')
+    for field in fields:
+        if field.type is None:
+            lines.append(f'        self.{field.name} = {field.name}')
+        elif field.required:
+            lines.append(f'        self.{field.name} = {_parse_expr(field, field.name, bot_arg)}')
+        else:
+            lines.append(
+                f'        self.{field.name} = {_parse_expr(field, field.name, bot_arg)} if {field.name} else None'
+            )
+    if has_bot:
+        lines.append('        self.bot = bot')
+    lines.append('        self.extra = kwargs or None')
+    lines.append('')
+
+    lines.append('    @classmethod')
+    if has_bot:
+        lines.append(f"    def from_dict(cls, data: Dict[str, Any], bot: Any = None) -> '{class_name(type_name)}':")
+    else:
+        lines.append(f"    def from_dict(cls, data: Dict[str, Any]) -> '{class_name(type_name)}':")
+    lines.append('        self = cls.__new__(cls)')
+    lines.append('        get = data.get')
+    for field in fields:
+        key = repr(_json_key(field))
+        if field.type is None:
+            source = f'data[{key}]' if field.required else f'get({key})'
+            lines.append(f'        self.{field.name} = {source}')
+        elif field.required:
+            lines.append(f'        self.{field.name} = {_parse_expr(field, f"data[{key}]", bot_arg)}')
+        else:
+            lines.append(f'        value = get({key})')
+            lines.append(f'        self.{field.name} = {_parse_expr(field, "value", bot_arg)} if value else None')
+    if has_bot:
+        lines.append('        self.bot = bot')
+    lines.append('        unknown = data.keys() - cls._keys')
+    lines.append('        self.extra = {key: data[key] for key in unknown} if unknown else None')
+    lines.append('        return self')
+    lines.append('')
+
+    lines.append('    def to_dict(self) -> Dict[str, Any]:')
+    required = [field for field in fields if field.required]
+    if required:
+        lines.append('        data = {')
+        for field in required:
+            value = f'self.{field.name}' if field.type is None else _dump_expr(field, f'self.{field.name}')
+            lines.append(f'            {_json_key(field)!r}: {value},')
+        lines.append('        }')
+    else:
+        lines.append('        data = {}')
+    for field in fields:
+        if field.required:
+            continue
+        lines.append(f'        value = self.{field.name}')
+        lines.append('        if value is not None:')
+        value = 'value' if field.type is None else _dump_expr(field, 'value')
+        lines.append(f'            data[{_json_key(field)!r}] = {value}')
+    lines.append('        if self.extra:')
+    lines.append('            data.update(self.extra)')
+    lines.append('        return data')
+
+    for alias, target in spec.get('aliases', {}).items():
+        lines.append('')
+        lines.append('    @property')
+        lines.append(f'    def {alias}(self) -> Any:')
+        lines.append(f'        return self.{target}')
+
+    return '\n'.join(lines)
+
+
+def generate(schema=SCHEMA):
+    """Returns the source of compact.py for the given schema."""
+    classes = [generate_class(type_name, spec) for type_name, spec in schema.items()]
+    return HEADER + '\n\n' + '\n\n\n'.join(classes) + '\n'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate monoTypes/compact.py from monoTypes/schema.py')
+    parser.add_argument('--check', action='store_true', help='only check that compact.py is up to date')
+    args = parser.parse_args(argv)
+
+    source = generate()
+    if args.check:
+        with open(OUTPUT, encoding='utf-8') as f:
+            if f.read() != source:
+                print('compact.py is out of date, run: python -m monogram.monoTypes.codegen')
+                return 1
+        return 0
+
+    with open(OUTPUT, 'w', encoding='utf-8') as f:
+        f.write(source)
+    print(f'Wrote {OUTPUT}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,578 @@
+# Generated by monoTypes/codegen.py from monoTypes/schema.py, do not edit by hand.
+from typing import Any, Dict
+from .slotted import SlottedType, MessageHelpers
+
+"""
+Compact variants of the high-frequency monoTypes.
+These classes use __slots__ instead of a per-instance __dict__, which makes them much smaller
+when many of them are kept in memory (e.g. conversation buffers), and come with specialized
+from_dict/to_dict methods for parsing updates and serializing payloads.
+"""
+
+
+class CompactUser(SlottedType):
+    """Slotted variant of User."""
+
+    __slots__ = ('id', 'is_bot', 'first_name', 'last_name', 'username', 'language_code', 'is_premium')
+    _fields = ('id', 'is_bot', 'first_name', 'last_name', 'username', 'language_code', 'is_premium')
+    _keys = frozenset(('id', 'is_bot', 'first_name', 'last_name', 'username', 'language_code', 'is_premium',))
+
+    def __init__(
+            self,
+            id: Any,
+            is_bot: Any,
+            first_name: Any,
+            last_name: Any = None,
+            username: Any = None,
+            language_code: Any = None,
+            is_premium: Any = None,
+            **kwargs
+    ):
+        self.id = id
+        self.is_bot = is_bot
+        self.first_name = first_name
+        self.last_name = last_name
+        self.username = username
+        self.language_code = language_code
+        self.is_premium = is_premium
+        self.extra = kwargs or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactUser':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = data['id']
+        self.is_bot = data['is_bot']
+        self.first_name = data['first_name']
+        self.last_name = get('last_name')
+        self.username = get('username')
+        self.language_code = get('language_code')
+        self.is_premium = get('is_premium')
+        unknown = data.keys() - cls._keys
+        self.extra = {key: data[key] for key in unknown} if unknown else None
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'id': self.id,
+            'is_bot': self.is_bot,
+            'first_name': self.first_name,
+        }
+        value = self.last_name
+        if value is not None:
+            data['last_name'] = value
+        value = self.username
+        if value is not None:
+            data['username'] = value
+        value = self.language_code
+        if value is not None:
+            data['language_code'] = value
+        value = self.is_premium
+        if value is not None:
+            data['is_premium'] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+class CompactChat(SlottedType):
+    """Slotted variant of Chat."""
+
+    __slots__ = ('id', 'type', 'title', 'username', 'first_name', 'last_name', 'is_forum')
+    _fields = ('id', 'type', 'title', 'username', 'first_name', 'last_name', 'is_forum')
+    _keys = frozenset(('id', 'type', 'title', 'username', 'first_name', 'last_name', 'is_forum',))
+
+    def __init__(
+            self,
+            id: Any,
+            type: Any,
+            title: Any = None,
+            username: Any = None,
+            first_name: Any = None,
+            last_name: Any = None,
+            is_forum: Any = None,
+            **kwargs
+    ):
+        self.id = id
+        self.type = type
+        self.title = title
+        self.username = username
+        self.first_name = first_name
+        self.last_name = last_name
+        self.is_forum = is_forum
+        self.extra = kwargs or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactChat':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = data['id']
+        self.type = data['type']
+        self.title = get('title')
+        self.username = get('username')
+        self.first_name = get('first_name')
+        self.last_name = get('last_name')
+        self.is_forum = get('is_forum')
+        unknown = data.keys() - cls._keys
+        self.extra = {key: data[key] for key in unknown} if unknown else None
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'id': self.id,
+            'type': self.type,
+        }
+        value = self.title
+        if value is not None:
+            data['title'] = value
+        value = self.username
+        if value is not None:
+            data['username'] = value
+        value = self.first_name
+        if value is not None:
+            data['first_name'] = value
+        value = self.last_name
+        if value is not None:
+            data['last_name'] = value
+        value = self.is_forum
+        if value is not None:
+            data['is_forum'] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+class CompactMessageEntity(SlottedType):
+    """Slotted variant of MessageEntity."""
+
+    __slots__ = ('type', 'offset', 'length', 'url', 'user', 'language', 'custom_emoji_id')
+    _fields = ('type', 'offset', 'length', 'url', 'user', 'language', 'custom_emoji_id')
+    _keys = frozenset(('type', 'offset', 'length', 'url', 'user', 'language', 'custom_emoji_id',))
+
+    def __init__(
+            self,
+            type: Any,
+            offset: Any,
+            length: Any,
+            url: Any = None,
+            user: Any = None,
+            language: Any = None,
+            custom_emoji_id: Any = None,
+            **kwargs
+    ):
+        self.type = type
+        self.offset = offset
+        self.length = length
+        self.url = url
+        self.user = CompactUser.from_dict(user) if user else None
+        self.language = language
+        self.custom_emoji_id = custom_emoji_id
+        self.extra = kwargs or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactMessageEntity':
+        self = cls.__new__(cls)
+        get = data.get
+        self.type = data['type']
+        self.offset = data['offset']
+        self.length = data['length']
+        self.url = get('url')
+        value = get('user')
+        self.user = CompactUser.from_dict(value) if value else None
+        self.language = get('language')
+        self.custom_emoji_id = get('custom_emoji_id')
+        unknown = data.keys() - cls._keys
+        self.extra = {key: data[key] for key in unknown} if unknown else None
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'type': self.type,
+            'offset': self.offset,
+            'length': self.length,
+        }
+        value = self.url
+        if value is not None:
+            data['url'] = value
+        value = self.user
+        if value is not None:
+            data['user'] = value.to_dict()
+        value = self.language
+        if value is not None:
+            data['language'] = value
+        value = self.custom_emoji_id
+        if value is not None:
+            data['custom_emoji_id'] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    @property
+    def entity_type(self) -> Any:
+        return self.type
+
+
+class CompactPhotoSize(SlottedType):
+    """Slotted variant of PhotoSize."""
+
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'file_size')
+    _fields = ('file_id', 'file_unique_id', 'width', 'height', 'file_size')
+    _keys = frozenset(('file_id', 'file_unique_id', 'width', 'height', 'file_size',))
+
+    def __init__(
+            self,
+            file_id: Any,
+            file_unique_id: Any,
+            width: Any,
+            height: Any,
+            file_size: Any = None,
+            **kwargs
+    ):
+        self.file_id = file_id
+        self.file_unique_id = file_unique_id
+        self.width = width
+        self.height = height
+        self.file_size = file_size
+        self.extra = kwargs or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactPhotoSize':
+        self = cls.__new__(cls)
+        get = data.get
+        self.file_id = data['file_id']
+        self.file_unique_id = data['file_unique_id']
+        self.width = data['width']
+        self.height = data['height']
+        self.file_size = get('file_size')
+        unknown = data.keys() - cls._keys
+        self.extra = {key: data[key] for key in unknown} if unknown else None
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'file_id': self.file_id,
+            'file_unique_id': self.file_unique_id,
+            'width': self.width,
+            'height': self.height,
+        }
+        value = self.file_size
+        if value is not None:
+            data['file_size'] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+class CompactInlineKeyboardButton(SlottedType):
+    """Slotted variant of InlineKeyboardButton."""
+
+    __slots__ = ('text', 'url', 'callback_data', 'web_app', 'login_url', 'switch_inline_query', 'switch_inline_query_current_chat', 'switch_inline_query_chosen_chat', 'copy_text', 'callback_game', 'pay')
+    _fields = ('text', 'url', 'callback_data', 'web_app', 'login_url', 'switch_inline_query', 'switch_inline_query_current_chat', 'switch_inline_query_chosen_chat', 'copy_text', 'callback_game', 'pay')
+    _keys = frozenset(('text', 'url', 'callback_data', 'web_app', 'login_url', 'switch_inline_query', 'switch_inline_query_current_chat', 'switch_inline_query_chosen_chat', 'copy_text', 'callback_game', 'pay',))
+
+    def __init__(
+            self,
+            text: Any,
+            url: Any = None,
+            callback_data: Any = None,
+            web_app: Any = None,
+            login_url: Any = None,
+            switch_inline_query: Any = None,
+            switch_inline_query_current_chat: Any = None,
+            switch_inline_query_chosen_chat: Any = None,
+            copy_text: Any = None,
+            callback_game: Any = None,
+            pay: Any = None,
+            **kwargs
+    ):
+        self.text = text
+        self.url = url
+        self.callback_data = callback_data
+        self.web_app = web_app
+        self.login_url = login_url
+        self.switch_inline_query = switch_inline_query
+        self.switch_inline_query_current_chat = switch_inline_query_current_chat
+        self.switch_inline_query_chosen_chat = switch_inline_query_chosen_chat
+        self.copy_text = copy_text
+        self.callback_game = callback_game
+        self.pay = pay
+        self.extra = kwargs or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactInlineKeyboardButton':
+        self = cls.__new__(cls)
+        get = data.get
+        self.text = data['text']
+        self.url = get('url')
+        self.callback_data = get('callback_data')
+        self.web_app = get('web_app')
+        self.login_url = get('login_url')
+        self.switch_inline_query = get('switch_inline_query')
+        self.switch_inline_query_current_chat = get('switch_inline_query_current_chat')
+        self.switch_inline_query_chosen_chat = get('switch_inline_query_chosen_chat')
+        self.copy_text = get('copy_text')
+        self.callback_game = get('callback_game')
+        self.pay = get('pay')
+        unknown = data.keys() - cls._keys
+        self.extra = {key: data[key] for key in unknown} if unknown else None
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'text': self.text,
+        }
+        value = self.url
+        if value is not None:
+            data['url'] = value
+        value = self.callback_data
+        if value is not None:
+            data['callback_data'] = value
+        value = self.web_app
+        if value is not None:
+            data['web_app'] = value
+        value = self.login_url
+        if value is not None:
+            data['login_url'] = value
+        value = self.switch_inline_query
+        if value is not None:
+            data['switch_inline_query'] = value
+        value = self.switch_inline_query_current_chat
+        if value is not None:
+            data['switch_inline_query_current_chat'] = value
+        value = self.switch_inline_query_chosen_chat
+        if value is not None:
+            data['switch_inline_query_chosen_chat'] = value
+        value = self.copy_text
+        if value is not None:
+            data['copy_text'] = value
+        value = self.callback_game
+        if value is not None:
+            data['callback_game'] = value
+        value = self.pay
+        if value is not None:
+            data['pay'] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+class CompactInlineKeyboardMarkup(SlottedType):
+    """Slotted variant of InlineKeyboardMarkup."""
+
+    __slots__ = ('inline_keyboard',)
+    _fields = ('inline_keyboard',)
+    _keys = frozenset(('inline_keyboard',))
+
+    def __init__(
+            self,
+            inline_keyboard: Any,
+            **kwargs
+    ):
+        self.inline_keyboard = [[CompactInlineKeyboardButton.from_dict(item) for item in row] for row in inline_keyboard]
+        self.extra = kwargs or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactInlineKeyboardMarkup':
+        self = cls.__new__(cls)
+        get = data.get
+        self.inline_keyboard = [[CompactInlineKeyboardButton.from_dict(item) for item in row] for row in data['inline_keyboard']]
+        unknown = data.keys() - cls._keys
+        self.extra = {key: data[key] for key in unknown} if unknown else None
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'inline_keyboard': [[item.to_dict() for item in row] for row in self.inline_keyboard],
+        }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+class CompactMessage(SlottedType, MessageHelpers):
+    """
+    Slotted variant of Message.
+
+    The text, media and reply fields used on the hot path are slots; any other field of the
+    payload (animation, poll, ...) stays a raw dict in ``extra``. The answer/reply/editMessage
+    helpers of Message work the same way.
+    """
+
+    __slots__ = ('message_id', 'date', 'chat', 'from_user', 'text', 'caption', 'entities', 'caption_entities', 'photo', 'reply_to_message', 'edit_date', 'media_group_id', 'reply_markup', 'bot')
+    _fields = ('message_id', 'date', 'chat', 'from_user', 'text', 'caption', 'entities', 'caption_entities', 'photo', 'reply_to_message', 'edit_date', 'media_group_id', 'reply_markup', 'bot')
+    _keys = frozenset(('message_id', 'date', 'chat', 'from', 'text', 'caption', 'entities', 'caption_entities', 'photo', 'reply_to_message', 'edit_date', 'media_group_id', 'reply_markup',))
+
+    def __init__(
+            self,
+            message_id: Any,
+            date: Any,
+            chat: Any,
+            bot: Any = None,
+            from_user: Any = None,
+            text: Any = None,
+            caption: Any = None,
+            entities: Any = None,
+            caption_entities: Any = None,
+            photo: Any = None,
+            reply_to_message: Any = None,
+            edit_date: Any = None,
+            media_group_id: Any = None,
+            reply_markup: Any = None,
+            **kwargs
+    ):
+        if 'from' in kwargs:
+            from_user = kwargs.pop('from')
+        self.message_id = message_id
+        self.date = date
+        self.chat = CompactChat.from_dict(chat)
+        self.from_user = CompactUser.from_dict(from_user) if from_user else None
+        self.text = text
+        self.caption = caption
+        self.entities = [CompactMessageEntity.from_dict(item) for item in entities] if entities else None
+        self.caption_entities = [CompactMessageEntity.from_dict(item) for item in caption_entities] if caption_entities else None
+        self.photo = [CompactPhotoSize.from_dict(item) for item in photo] if photo else None
+        self.reply_to_message = CompactMessage.from_dict(reply_to_message) if reply_to_message else None
+        self.edit_date = edit_date
+        self.media_group_id = media_group_id
+        self.reply_markup = CompactInlineKeyboardMarkup.from_dict(reply_markup) if reply_markup else None
+        self.bot = bot
+        self.extra = kwargs or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], bot: Any = None) -> 'CompactMessage':
+        self = cls.__new__(cls)
+        get = data.get
+        self.message_id = data['message_id']
+        self.date = data['date']
+        self.chat = CompactChat.from_dict(data['chat'])
+        value = get('from')
+        self.from_user = CompactUser.from_dict(value) if value else None
+        self.text = get('text')
+        self.caption = get('caption')
+        value = get('entities')
+        self.entities = [CompactMessageEntity.from_dict(item) for item in value] if value else None
+        value = get('caption_entities')
+        self.caption_entities = [CompactMessageEntity.from_dict(item) for item in value] if value else None
+        value = get('photo')
+        self.photo = [CompactPhotoSize.from_dict(item) for item in value] if value else None
+        value = get('reply_to_message')
+        self.reply_to_message = CompactMessage.from_dict(value) if value else None
+        self.edit_date = get('edit_date')
+        self.media_group_id = get('media_group_id')
+        value = get('reply_markup')
+        self.reply_markup = CompactInlineKeyboardMarkup.from_dict(value) if value else None
+        self.bot = bot
+        unknown = data.keys() - cls._keys
+        self.extra = {key: data[key] for key in unknown} if unknown else None
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'message_id': self.message_id,
+            'date': self.date,
+            'chat': self.chat.to_dict(),
+        }
+        value = self.from_user
+        if value is not None:
+            data['from'] = value.to_dict()
+        value = self.text
+        if value is not None:
+            data['text'] = value
+        value = self.caption
+        if value is not None:
+            data['caption'] = value
+        value = self.entities
+        if value is not None:
+            data['entities'] = [item.to_dict() for item in value]
+        value = self.caption_entities
+        if value is not None:
+            data['caption_entities'] = [item.to_dict() for item in value]
+        value = self.photo
+        if value is not None:
+            data['photo'] = [item.to_dict() for item in value]
+        value = self.reply_to_message
+        if value is not None:
+            data['reply_to_message'] = value.to_dict()
+        value = self.edit_date
+        if value is not None:
+            data['edit_date'] = value
+        value = self.media_group_id
+        if value is not None:
+            data['media_group_id'] = value
+        value = self.reply_markup
+        if value is not None:
+            data['reply_markup'] = value.to_dict()
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+class CompactCallbackQuery(SlottedType):
+    """Slotted variant of CallbackQuery."""
+
+    __slots__ = ('id', 'from_user', 'chat_instance', 'message', 'inline_message_id', 'data', 'game_short_name', 'bot')
+    _fields = ('id', 'from_user', 'chat_instance', 'message', 'inline_message_id', 'data', 'game_short_name', 'bot')
+    _keys = frozenset(('id', 'from', 'chat_instance', 'message', 'inline_message_id', 'data', 'game_short_name',))
+
+    def __init__(
+            self,
+            id: Any,
+            from_user: Any,
+            chat_instance: Any,
+            bot: Any = None,
+            message: Any = None,
+            inline_message_id: Any = None,
+            data: Any = None,
+            game_short_name: Any = None,
+            **kwargs
+    ):
+        if 'from' in kwargs:
+            from_user = kwargs.pop('from')
+        self.id = id
+        self.from_user = CompactUser.from_dict(from_user)
+        self.chat_instance = chat_instance
+        self.message = CompactMessage.from_dict(message, bot) if message else None
+        self.inline_message_id = inline_message_id
+        self.data = data
+        self.game_short_name = game_short_name
+        self.bot = bot
+        self.extra = kwargs or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], bot: Any = None) -> 'CompactCallbackQuery':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = data['id']
+        self.from_user = CompactUser.from_dict(data['from'])
+        self.chat_instance = data['chat_instance']
+        value = get('message')
+        self.message = CompactMessage.from_dict(value, bot) if value else None
+        self.inline_message_id = get('inline_message_id')
+        self.data = get('data')
+        self.game_short_name = get('game_short_name')
+        self.bot = bot
+        unknown = data.keys() - cls._keys
+        self.extra = {key: data[key] for key in unknown} if unknown else None
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'id': self.id,
+            'from': self.from_user.to_dict(),
+            'chat_instance': self.chat_instance,
+        }
+        value = self.message
+        if value is not None:
+            data['message'] = value.to_dict()
+        value = self.inline_message_id
+        if value is not None:
+            data['inline_message_id'] = value
+        value = self.data
+        if value is not None:
+            data['data'] = value
+        value = self.game_short_name
+        if value is not None:
+            data['game_short_name'] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
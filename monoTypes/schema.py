@@ -0,0 +1,131 @@
+from collections import namedtuple
+
+"""
+Schema of the generated compact types.
+codegen.py turns every entry into a slotted class in compact.py with straight-line
+from_dict/to_dict methods; edit this file and regenerate instead of editing compact.py.
+"""
+
+# name: attribute name on the class
+# type: name of another schema type for nested objects, None for plain JSON values
+# required: the field is always present in the API payload
+# array: 0 for a single value, 1 for a list, 2 for a list of lists (e.g. keyboard rows)
+# key: JSON key when it differs from the attribute name (e.g. 'from' -> from_user)
+# pass_bot: hand the bot of the parent object to the nested object
+Field = namedtuple('Field', 'name type required array key pass_bot', defaults=(None, False, 0, None, False))
+
+# type name -> options
+#   fields: Field list in API order
+#   doc: class docstring
+#   bot: the object carries the bot it was received with (not part of the JSON)
+#   bases: extra base classes from slotted.py
+#   aliases: read-only properties exposing a field under another name
+SCHEMA = {
+    'User': {
+        'doc': 'Slotted variant of User.',
+        'fields': [
+            Field('id', required=True),
+            Field('is_bot', required=True),
+            Field('first_name', required=True),
+            Field('last_name'),
+            Field('username'),
+            Field('language_code'),
+            Field('is_premium'),
+        ],
+    },
+    'Chat': {
+        'doc': 'Slotted variant of Chat.',
+        'fields': [
+            Field('id', required=True),
+            Field('type', required=True),
+            Field('title'),
+            Field('username'),
+            Field('first_name'),
+            Field('last_name'),
+            Field('is_forum'),
+        ],
+    },
+    'MessageEntity': {
+        'doc': 'Slotted variant of MessageEntity.',
+        'fields': [
+            Field('type', required=True),
+            Field('offset', required=True),
+            Field('length', required=True),
+            Field('url'),
+            Field('user', 'User'),
+            Field('language'),
+            Field('custom_emoji_id'),
+        ],
+        'aliases': {'entity_type': 'type'},
+    },
+    'PhotoSize': {
+        'doc': 'Slotted variant of PhotoSize.',
+        'fields': [
+            Field('file_id', required=True),
+            Field('file_unique_id', required=True),
+            Field('width', required=True),
+            Field('height', required=True),
+            Field('file_size'),
+        ],
+    },
+    'InlineKeyboardButton': {
+        'doc': 'Slotted variant of InlineKeyboardButton.',
+        'fields': [
+            Field('text', required=True),
+            Field('url'),
+            Field('callback_data'),
+            Field('web_app'),
+            Field('login_url'),
+            Field('switch_inline_query'),
+            Field('switch_inline_query_current_chat'),
+            Field('switch_inline_query_chosen_chat'),
+            Field('copy_text'),
+            Field('callback_game'),
+            Field('pay'),
+        ],
+    },
+    'InlineKeyboardMarkup': {
+        'doc': 'Slotted variant of InlineKeyboardMarkup.',
+        'fields': [
+            Field('inline_keyboard', 'InlineKeyboardButton', required=True, array=2),
+        ],
+    },
+    'Message': {
+        'doc': (
+            'Slotted variant of Message.\n\n'
+            'The text, media and reply fields used on the hot path are slots; any other field of the\n'
+            'payload (animation, poll, ...) stays a raw dict in ``extra``. The answer/reply/editMessage\n'
+            'helpers of Message work the same way.'
+        ),
+        'bot': True,
+        'bases': ['MessageHelpers'],
+        'fields': [
+            Field('message_id', required=True),
+            Field('date', required=True),
+            Field('chat', 'Chat', required=True),
+            Field('from_user', 'User', key='from'),
+            Field('text'),
+            Field('caption'),
+            Field('entities', 'MessageEntity', array=1),
+            Field('caption_entities', 'MessageEntity', array=1),
+            Field('photo', 'PhotoSize', array=1),
+            Field('reply_to_message', 'Message'),
+            Field('edit_date'),
+            Field('media_group_id'),
+            Field('reply_markup', 'InlineKeyboardMarkup'),
+        ],
+    },
+    'CallbackQuery': {
+        'doc': 'Slotted variant of CallbackQuery.',
+        'bot': True,
+        'fields': [
+            Field('id', required=True),
+            Field('from_user', 'User', required=True, key='from'),
+            Field('chat_instance', required=True),
+            Field('message', 'Message', pass_bot=True),
+            Field('inline_message_id'),
+            Field('data'),
+            Field('game_short_name'),
+        ],
+    },
+}
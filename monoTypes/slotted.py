@@ -0,0 +1,78 @@
+"""
+Base classes of the generated compact types (see compact.py).
+SlottedType gives slotted classes BaseType's mapping API (obj['field'], 'field' in obj);
+fields a class does not declare are kept in ``extra``.
+"""
+
+
+class SlottedType:
+    """
+    Base class for slotted types.
+
+    Subclasses declare ``_fields`` (attribute names) and ``_keys`` (JSON keys of the payload).
+    A field counts as present ('field' in obj) when it is set to something other than None.
+    """
+
+    __slots__ = ('extra',)
+
+    _fields = ()
+    _keys = frozenset()
+
+    def __getattr__(self, name):
+        # Only called for names that are not slots
+        extra = object.__getattribute__(self, 'extra')
+        if extra and name in extra:
+            return extra[name]
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(f'Key {key} not found.')
+
+    def __setitem__(self, key, value):
+        if key in self._fields:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._fields:
+            setattr(self, key, None)
+        elif self.extra and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(f'Key {key} not found.')
+
+    def __contains__(self, key):
+        if key in self._fields:
+            return getattr(self, key) is not None
+        return bool(self.extra) and key in self.extra
+
+    def __len__(self):
+        return sum(1 for name in self._fields if getattr(self, name) is not None) + len(self.extra or ())
+
+    def __repr__(self):
+        fields = {name: getattr(self, name) for name in self._fields if getattr(self, name) is not None}
+        if self.extra:
+            fields.update(self.extra)
+        return f'{self.__class__.__name__}({fields})'
+
+
+class MessageHelpers:
+    """answer/reply/editMessage/deleteMessage of Message; they only need bot, chat and message_id."""
+
+    __slots__ = ()
+
+
+def _bind_message_helpers():
+    from .Message import Message
+
+    for name in ('answer', 'editMessage', 'reply', 'deleteMessage'):
+        setattr(MessageHelpers, name, getattr(Message, name))
+
+
+_bind_message_helpers()
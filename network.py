@@ -1,13 +1,267 @@
 import os
+import time
+import socket
+import asyncio
 import logging
+import threading
+import weakref
+import contextlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import NewConnectionError
 from urllib.parse import urljoin
 from monogram.text import format_text
-from typing import Optional, Dict, Any, Union
+from monogram.monoTypes import InputFile
+from . import codec
+from .ratelimit import rate_limiters, is_throttled
+from .retry import RetryPolicy, retry_budget, is_idempotent
+from .exceptions import TelegramError, RetryAfter, ServerError, NetworkError
+from typing import Optional, Dict, Any, Union, Tuple
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency for AsyncNetwork
+    httpx = None
+
+
+# Connection settings used when neither MONOGRAM_HTTP nor the bot overrides them
+DEFAULT_HTTP_CONFIG = {
+    'pool_connections': 10,   # number of hosts with a pool (one is enough for api.telegram.org)
+    'pool_maxsize': 100,      # connections kept alive per host, i.e. concurrent requests per bot
+    'pool_block': False,      # wait for a free connection instead of opening a throwaway one
+    'max_retries': 0,         # urllib3 retries; Network.request retries failed calls itself
+    'keepalive': True,        # TCP keep-alive probes on pooled connections
+    'timeout': (5.0, 10.0),   # default (connect, read) timeout of a call in seconds
+}
+
+
+def http_config(**overrides) -> Dict[str, Any]:
+    """
+    Connection settings: DEFAULT_HTTP_CONFIG updated with MONOGRAM_HTTP and non-None ``overrides``.
+
+    Settings:
+        MONOGRAM_HTTP: Dict overriding DEFAULT_HTTP_CONFIG, e.g. ``{'pool_maxsize': 200, 'timeout': 15.0}``
+    """
+    try:
+        from django.conf import settings
+        configured = getattr(settings, 'MONOGRAM_HTTP', {})
+    except Exception:
+        # Used outside a configured Django project
+        configured = {}
+    config = {**DEFAULT_HTTP_CONFIG, **(configured or {})}
+    config.update({key: value for key, value in overrides.items() if value is not None})
+    return config
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that enables TCP keep-alive on its pooled connections.
+
+    Idle keep-alive connections to Telegram are otherwise silently dropped by
+    NAT gateways and proxies, and the next request fails on a dead socket.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ['keepalive']
+
+    def __init__(self, keepalive: bool = True, **kwargs) -> None:
+        self.keepalive = keepalive
+        super().__init__(**kwargs)
+
+    @staticmethod
+    def socket_options():
+        options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        # Probe after 60s idle, every 10s, give up after 6 failures (where the platform supports it)
+        for name, value in (('TCP_KEEPIDLE', 60), ('TCP_KEEPINTVL', 10), ('TCP_KEEPCNT', 6)):
+            if hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+        return options
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.keepalive:
+            kwargs['socket_options'] = self.socket_options()
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        if self.keepalive:
+            proxy_kwargs['socket_options'] = self.socket_options()
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Connection reuse counters of every pool opened by this adapter.
+
+        Returns:
+            dict: ``requests`` sent, ``new_connections`` opened, ``reused`` (requests served
+            by an already open connection) and the number of ``pools``
+        """
+        managers = [self.poolmanager] + list(self.proxy_manager.values())
+        pools = [manager.pools[key] for manager in managers if manager is not None
+                 for key in manager.pools.keys()]
+        sent = sum(pool.num_requests for pool in pools)
+        opened = sum(pool.num_connections for pool in pools)
+        return {
+            'requests': sent,
+            'new_connections': opened,
+            'reused': max(sent - opened, 0),
+            'pools': len(pools),
+        }
+
+
+class SessionRegistry:
+    """
+    Process-wide registry of pooled ``requests.Session`` objects.
+
+    Sessions are keyed by ``(token, endpoint, proxy_url)`` so every Network
+    client talking to the same bot through the same route reuses one
+    connection pool (and its TLS keep-alive connections) instead of opening
+    a fresh session per instance. The pool is sized by the configuration of
+    the client that creates the session (see ``http_config``).
+    """
+
+    def __init__(self) -> None:
+        self._sessions: Dict[Tuple[str, str, Optional[str]], requests.Session] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token: str, endpoint: str, proxy_url: Optional[str] = None) -> Tuple[str, str, Optional[str]]:
+        """Build the registry key for a set of credentials."""
+        return (token, endpoint, proxy_url or None)
+
+    @staticmethod
+    def create_session(proxy_url: Optional[str] = None, config: Optional[Dict[str, Any]] = None) -> requests.Session:
+        """
+        Build a session whose HTTP(S) adapter is sized by ``config`` (defaults to ``http_config()``).
+        """
+        config = config or http_config()
+        session = requests.Session()
+        adapter = KeepAliveAdapter(
+            keepalive=config['keepalive'],
+            pool_connections=config['pool_connections'],
+            pool_maxsize=config['pool_maxsize'],
+            pool_block=config['pool_block'],
+            max_retries=config['max_retries'],
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if proxy_url:
+            session.proxies.update({
+                'http': proxy_url,
+                'https': proxy_url
+            })
+        return session
+
+    def get(self, token: str, endpoint: str, proxy_url: Optional[str] = None,
+            config: Optional[Dict[str, Any]] = None) -> requests.Session:
+        """
+        Return the shared session for the given credentials, creating it on first use.
+
+        Args:
+            token: Telegram bot token
+            endpoint: Telegram server endpoint
+            proxy_url: Proxy server URL, or None for a direct connection
+            config: Connection settings used if the session has to be created
+
+        Returns:
+            requests.Session: The pooled session for this key
+        """
+        key = self.key(token, endpoint, proxy_url)
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self.create_session(proxy_url, config)
+                self._sessions[key] = session
+            return session
+
+    def pool_stats(self, token: str, endpoint: str, proxy_url: Optional[str] = None) -> Optional[Dict[str, int]]:
+        """Connection reuse counters of a registered session (None if it does not exist yet)."""
+        session = self._sessions.get(self.key(token, endpoint, proxy_url))
+        if session is None:
+            return None
+        adapter = session.get_adapter('https://')
+        return adapter.pool_stats() if isinstance(adapter, KeepAliveAdapter) else None
+
+    def invalidate(self, token: str, endpoint: str, proxy_url: Optional[str] = None) -> None:
+        """Drop and close the session registered for the given credentials, if any."""
+        with self._lock:
+            session = self._sessions.pop(self.key(token, endpoint, proxy_url), None)
+        if session is not None:
+            session.close()
+
+    def clear(self) -> None:
+        """Close and forget every registered session."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+session_registry = SessionRegistry()
+
+
+class AsyncClientRegistry:
+    """
+    Registry of pooled ``httpx.AsyncClient`` objects for AsyncNetwork.
+
+    Async connection pools are bound to the event loop that opened them, so
+    clients are kept per running loop and, within a loop, per
+    ``(token, endpoint, proxy_url)`` key like ``SessionRegistry``.
+    """
+
+    def __init__(self) -> None:
+        self._clients = weakref.WeakKeyDictionary()
+
+    def get(self, token: str, endpoint: str, proxy_url: Optional[str] = None,
+            config: Optional[Dict[str, Any]] = None) -> 'httpx.AsyncClient':
+        """
+        Return the shared client for the given credentials on the running event loop.
+
+        Must be called from a coroutine. Creates the client on first use, with up to
+        ``pool_maxsize`` connections from ``config`` (defaults to ``http_config()``).
+        """
+        if httpx is None:
+            raise ImportError("AsyncNetwork requires the 'httpx' package (pip install httpx).")
+        loop = asyncio.get_running_loop()
+        clients = self._clients.setdefault(loop, {})
+        key = SessionRegistry.key(token, endpoint, proxy_url)
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            config = config or http_config()
+            client = httpx.AsyncClient(
+                proxy=proxy_url or None,
+                limits=httpx.Limits(
+                    max_connections=config['pool_maxsize'],
+                    max_keepalive_connections=config['pool_maxsize'],
+                ),
+            )
+            clients[key] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close every client opened on the running event loop."""
+        clients = self._clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+
+
+async_client_registry = AsyncClientRegistry()
+
+
+# Requests without files are sent as a single JSON body
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+class BaseNetwork:
+    """Transport-independent client state and payload preparation shared by Network and AsyncNetwork."""
 
-class Network:
-    """Handles network operations for Telegram API with robust error handling."""
-    
     def __init__(
         self,
         token: str,
@@ -15,20 +269,33 @@ class Network:
         endpoint: str,
         proxy: bool = False,
         proxy_url: str = None,
+        timeout: Union[float, Tuple[float, float], None] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_connections: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+        max_retries: Optional[int] = None,
+        keepalive: Optional[bool] = None,
         *args,
         **kwargs
     ) -> None:
         """
-        Initialize the Network client.
-        
+        Initialize the client state.
+
         Args:
             token: Telegram bot token
             secret_token: Webhook verification secret
             endpoint: Telegram server endpoint (e.g., 'api.telegram.org')
-            api_endpoint: Full API endpoint URL (e.g., 'https://api.telegram.org/bot<token>/')
             proxy: Whether to use proxy
             proxy_url: Proxy server URL
-            session_data: Optional dict to restore requests.Session state
+            timeout: Default timeout of a call, in seconds or as ``(connect, read)``
+            pool_maxsize: Connections kept alive for this bot (concurrent requests without new connections)
+            pool_connections: Number of per-host pools of the session
+            pool_block: Wait for a free pooled connection instead of opening a throwaway one
+            max_retries: Connection retries done by urllib3
+            keepalive: Enable TCP keep-alive probes on pooled connections
+
+        Options left as None fall back to MONOGRAM_HTTP and DEFAULT_HTTP_CONFIG. Pool options
+        take effect when the bot's shared session is created.
         """
         self.token = token
         self.secret_token = secret_token
@@ -36,19 +303,222 @@ class Network:
         self.api_endpoint = f'https://{endpoint}/bot{token}/'
         self.proxy = proxy
         self.proxy_url = proxy_url
-        self.session = requests.Session()
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
 
-        # Configure session proxies during initialization
-        if self.proxy:
-            if not self.proxy_url:
-                raise ValueError("Proxy URL is required when proxy is enabled.")
-            proxies = {
-                'http': self.proxy_url,
-                'https': self.proxy_url
-            }
-            self.session.proxies.update(proxies)
+        if self.proxy and not self.proxy_url:
+            raise ValueError("Proxy URL is required when proxy is enabled.")
+
+        # Pooled transports (sessions/clients) are shared per key
+        self._session_key = session_registry.key(token, endpoint, proxy_url if proxy else None)
+        self.http_config = http_config(
+            timeout=timeout,
+            pool_maxsize=pool_maxsize,
+            pool_connections=pool_connections,
+            pool_block=pool_block,
+            max_retries=max_retries,
+            keepalive=keepalive,
+        )
+        self.timeout = self.http_config['timeout']
+        self.retry_policy = RetryPolicy.from_settings()
+
+    @property
+    def rate_limiter(self):
+        """The bot's shared RateLimiter (None when MONOGRAM_RATE_LIMIT is off)."""
+        return rate_limiters.get(self.token)
+
+    def _prepare_payload(self, raw_payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Prepares a payload dictionary for Telegram API requests.
+        Removes None values and formats text/caption fields.
+
+        Args:
+            raw_payload: The dictionary of parameters for the API method.
+
+        Returns:
+            A cleaned and formatted payload dictionary.
+        """
+        if raw_payload:
+            # Remove None values from payload
+            payload = {k: v for k, v in raw_payload.items() if v is not None}
+
+            if 'self' in payload:
+                payload.pop('self')
+            if 'cls' in payload:
+                payload.pop('cls')
+            if 'kwargs' in payload:
+                payload.pop('kwargs')
+            # Apply text formatting if 'text' or 'caption' keys exist
+            if 'text' in payload and payload['text'] is not None:
+                payload['text'] = format_text(payload['text'])
+            if 'caption' in payload and payload['caption'] is not None:
+                payload['caption'] = format_text(payload['caption'])
+                
+            return payload
+        return {}
+
+    @staticmethod
+    def _form_fields(payload: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Encodes a payload as multipart form fields.
+
+        Form fields are flat strings, so nested values (reply_markup, media, entities, ...)
+        and non-string scalars are JSON-encoded one by one. Requests without files send the
+        whole payload as a single JSON body instead.
+        """
+        return {
+            key: value if isinstance(value, str) else codec.dumps(value)
+            for key, value in payload.items()
+        }
+
+    @staticmethod
+    def _parse_response(method: str, status_code: int, content: bytes) -> Dict[str, Any]:
+        """
+        Decodes an API response.
+
+        Telegram reports failures in the body (``ok``, ``error_code``, ``description``, ``parameters``),
+        so the body is decoded whatever the HTTP status is.
+
+        Returns:
+            dict: The decoded response of a successful call
+
+        Raises:
+            TelegramError: The matching subclass when the API answered with ``"ok": false``
+            ServerError: If a 5xx response has no JSON body (e.g. from a proxy)
+            NetworkError: If any other response has no JSON body
+        """
+        try:
+            json_resp = codec.loads(content)
+        except codec.DecodeError:
+            json_resp = None
+        if not isinstance(json_resp, dict):
+            error_class = ServerError if status_code >= 500 else NetworkError
+            raise error_class(f"Invalid response from Telegram (HTTP {status_code})", status_code, method)
+        if json_resp.get('ok', False):
+            return json_resp
+        json_resp.setdefault('error_code', status_code)
+        raise TelegramError.from_response(json_resp, method)
+
+    def _retry_delay(self, error: TelegramError, attempt: int) -> Optional[float]:
+        """
+        Decides whether a failed call is repeated.
+
+        Flood-control errors are retried after the ``retry_after`` Telegram asks for (up to
+        ``max_retry_after``); server errors and connection failures back off exponentially and
+        are paid for from the shared retry budget. Anything else is not retried. The transports
+        only turn connection failures into a retryable NetworkError when the request was not sent
+        yet or the method is idempotent.
+
+        Returns:
+            Seconds to wait before the next attempt, or None to raise ``error``
+        """
+        policy = self.retry_policy
+        if attempt >= policy.max_attempts:
+            return None
+        if isinstance(error, RetryAfter):
+            return error.retry_after if error.retry_after <= policy.max_retry_after else None
+        if isinstance(error, (ServerError, NetworkError)) and retry_budget.try_retry():
+            return policy.backoff(attempt)
+        return None
+
+    def _convert(self, result: Any, convert: Any) -> Any:
+        """
+        Maps the result of ``request`` (e.g. to a Message); empty results are returned as None.
+
+        Shared by the Methods bodies; AsyncNetwork overrides it to map the awaited result.
+        """
+        return convert(result) if result else None
+
+    @staticmethod
+    def _upload_name(upload: InputFile) -> str:
+        return upload.file_name or os.path.basename(upload.file_path)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _open_files(files: Optional[Dict[str, Any]]):
+        """Opens the InputFile entries of ``files`` for the duration of a request and closes them afterwards."""
+        with contextlib.ExitStack() as stack:
+            if files:
+                files = {
+                    name: (BaseNetwork._upload_name(value), stack.enter_context(open(value.file_path, 'rb')))
+                    if isinstance(value, InputFile) else value
+                    for name, value in files.items()
+                }
+            yield files
+
+    @staticmethod
+    def _read_files(files: Dict[str, Any]) -> Dict[str, Any]:
+        """Reads the InputFile entries and file objects of ``files`` into memory (blocking, run in a thread)."""
+        loaded = {}
+        for name, value in files.items():
+            if isinstance(value, InputFile):
+                with open(value.file_path, 'rb') as f:
+                    value = (BaseNetwork._upload_name(value), f.read())
+            elif hasattr(value, 'read'):
+                value = (os.path.basename(getattr(value, 'name', name)), value.read())
+            elif isinstance(value, tuple) and len(value) > 1 and hasattr(value[1], 'read'):
+                value = (value[0], value[1].read(), *value[2:])
+            loaded[name] = value
+        return loaded
+
+    @staticmethod
+    def _rewind(files: Optional[Dict[str, Any]]) -> None:
+        """Seeks uploaded file objects back to the start so a retry sends them again."""
+        for value in (files or {}).values():
+            # Either a file object or a (filename, fileobj[, content_type]) tuple
+            fileobj = value[1] if isinstance(value, tuple) else value
+            if hasattr(fileobj, 'seek'):
+                fileobj.seek(0)
+
+
+class Network(BaseNetwork):
+    """Handles network operations for Telegram API with robust error handling."""
+    
+    def __init__(
+        self,
+        token: str,
+        secret_token: str,
+        endpoint: str,
+        proxy: bool = False,
+        proxy_url: str = None,
+        *args,
+        **kwargs
+    ) -> None:
+        """
+        Initialize the Network client.
+        
+        Args:
+            token: Telegram bot token
+            secret_token: Webhook verification secret
+            endpoint: Telegram server endpoint (e.g., 'api.telegram.org')
+            proxy: Whether to use proxy
+            proxy_url: Proxy server URL
+            **kwargs: Timeout and connection pool options (see BaseNetwork)
+
+        The underlying ``requests.Session`` is taken from the process-wide
+        ``session_registry``, so instances sharing credentials share one
+        connection pool.
+        """
+        super().__init__(
+            token=token,
+            secret_token=secret_token,
+            endpoint=endpoint,
+            proxy=proxy,
+            proxy_url=proxy_url,
+            **kwargs
+        )
+        # Reuse the pooled session for these credentials (proxies and pool size are configured on creation)
+        self.session = session_registry.get(*self._session_key, config=self.http_config)
+
+    def pool_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Connection reuse counters of the bot's shared session.
+
+        Returns:
+            dict: ``requests``, ``new_connections``, ``reused`` and ``pools`` (see KeepAliveAdapter.pool_stats)
+        """
+        adapter = self.session.get_adapter(self.api_endpoint)
+        return adapter.pool_stats() if isinstance(adapter, KeepAliveAdapter) else None
 
     def download_file(
         self,
@@ -105,84 +575,298 @@ class Network:
         payload: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         return_response: bool = True,
-        timeout: float = 10.0
-    ) -> Optional[requests.Response]:
+        timeout: Union[float, Tuple[float, float], None] = None
+    ) -> Any:
         """
-        Execute Telegram API request with error handling.
-        
+        Execute Telegram API request, retrying flood-control, server and connection errors.
+
         Args:
             method: Telegram API method (e.g., 'sendMessage')
-            payload: Dictionary of API parameters
+            payload: Dictionary of API parameters (sent as a JSON body, or as form fields with files)
             files: Files to upload (multipart/form-data)
-            return_response: Whether to return response object
-            
+            return_response: Whether to return the API result
+            timeout: Timeout in seconds or ``(connect, read)``; defaults to ``self.timeout``
+
         Returns:
-            Response object if return_response=True, None otherwise
+            The ``result`` field of the API response if return_response=True, None otherwise
+
+        Raises:
+            TelegramError: The matching subclass (BadRequest, Forbidden, RetryAfter, ChatMigrated, ...)
+                when the API rejects the call and it is not retried
+            NetworkError: If Telegram could not be reached
         """
         url = urljoin(self.api_endpoint, method)
         payload = self._prepare_payload(payload)
-        # print(f"Requesting {url} with payload: {payload} and files: {files}")
+        timeout = self.timeout if timeout is None else timeout
+        self.logger.info(f"Request to {method} with payload: {payload}")
+        retry_budget.record_request()
 
-        try:
-            self.logger.info(f"Request to {method} with payload: {payload}")
-            
-            response = self.session.post(
-                url,
-                data=payload,
-                files=files,
-                timeout=timeout
-            )
-            response.raise_for_status()  # Raise HTTP errors
-            
-            # Log Telegram API errors
-            json_resp = response.json()
-            if not json_resp.get('ok', False):
-                self.logger.error(f"Telegram API error: {json_resp.get('description')}")
+        with self._open_files(files) as files:
+            return self._send(method, url, payload, files, return_response, timeout)
+
+    def _send(self, method, url, payload, files, return_response, timeout) -> Any:
+        """Posts a prepared request, retrying as described in ``request``."""
+        attempt = 0
+        while True:
+            attempt += 1
+            # Wait for a free slot in the bot's global and per-chat message limits
+            if is_throttled(method):
+                limiter = self.rate_limiter
+                if limiter is not None:
+                    limiter.acquire(payload.get('chat_id'), method)
+
+            try:
+                if files:
+                    response = self.session.post(
+                        url,
+                        data=self._form_fields(payload),
+                        files=files,
+                        timeout=timeout
+                    )
+                else:
+                    response = self.session.post(
+                        url,
+                        data=codec.dumpb(payload),
+                        headers=JSON_HEADERS,
+                        timeout=timeout
+                    )
+                json_resp = self._parse_response(method, response.status_code, response.content)
+            except TelegramError as e:
+                error = e
+            except requests.exceptions.ConnectionError as e:
+                if not (self._connect_failed(e) or is_idempotent(method)):
+                    # Reset or aborted after sending: Telegram may have run the call, so it is not repeated
+                    self.logger.error(f"Request failed: {str(e)}")
+                    raise NetworkError(str(e), method=method) from e
+                error = NetworkError(str(e), method=method)
+                error.__cause__ = e
+            except requests.exceptions.RequestException as e:
+                self.logger.error(f"Request failed: {str(e)}")
+                raise NetworkError(str(e), method=method) from e
+            else:
+                self.logger.info(f"Request successful ({response.status_code})")
                 return json_resp['result'] if return_response else None
-              
-            self.logger.info(f"Request successful ({response.status_code})")
-            return json_resp['result'] if return_response else None
-            
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Request failed: {str(e)}")
-            if return_response and hasattr(e, 'response'):
-                return e.response
-        except ValueError as e:
-            self.logger.error(f"JSON parsing error: {str(e)}")
-        except Exception as e:
-            self.logger.exception("Unexpected API request error")
-        
-        finally:
-            # Ensure response is closed if not returned
-            if response and not return_response:
-                response.close()
-    
-    def _prepare_payload(self, raw_payload: Dict[str, Any]) -> Dict[str, Any]:
+
+            delay = self._retry_delay(error, attempt)
+            if delay is None:
+                self.logger.error(f"Telegram API error: {error}")
+                raise error
+            self.logger.warning(f"{error}; retrying in {delay:.2f}s (attempt {attempt + 1})")
+            time.sleep(delay)
+            self._rewind(files)
+
+    @staticmethod
+    def _connect_failed(error: requests.exceptions.ConnectionError) -> bool:
+        """Whether a connection error happened while connecting, i.e. before anything was sent."""
+        if isinstance(error, (requests.exceptions.ConnectTimeout, requests.exceptions.ProxyError)):
+            return True
+        # Refused connections and DNS failures arrive as MaxRetryError(reason=NewConnectionError)
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+
+
+class AsyncNetwork(BaseNetwork):
+    """
+    Asyncio counterpart of Network built on a pooled ``httpx.AsyncClient``.
+
+    Payload preparation is inherited from BaseNetwork, so both transports
+    send exactly the same parameters.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        secret_token: str,
+        endpoint: str,
+        proxy: bool = False,
+        proxy_url: str = None,
+        client: Optional['httpx.AsyncClient'] = None,
+        *args,
+        **kwargs
+    ) -> None:
         """
-        Prepares a payload dictionary for Telegram API requests.
-        Removes None values and formats text/caption fields.
+        Initialize the AsyncNetwork client.
 
         Args:
-            raw_payload: The dictionary of parameters for the API method.
+            token: Telegram bot token
+            secret_token: Webhook verification secret
+            endpoint: Telegram server endpoint (e.g., 'api.telegram.org')
+            proxy: Whether to use proxy
+            proxy_url: Proxy server URL
+            client: Optional httpx.AsyncClient to use instead of the shared
+                    one from ``async_client_registry``
+            **kwargs: Timeout and connection pool options (see BaseNetwork)
+        """
+        if httpx is None:
+            raise ImportError("AsyncNetwork requires the 'httpx' package (pip install httpx).")
+        super().__init__(
+            token=token,
+            secret_token=secret_token,
+            endpoint=endpoint,
+            proxy=proxy,
+            proxy_url=proxy_url,
+            **kwargs
+        )
+        self._client = client
+
+    @property
+    def client(self) -> 'httpx.AsyncClient':
+        """The httpx client used for requests (resolved on the running event loop)."""
+        if self._client is not None:
+            return self._client
+        return async_client_registry.get(*self._session_key, config=self.http_config)
+
+    async def download_file(
+        self,
+        file_path: str,
+        download_path: str,
+        file_name: str
+    ) -> bool:
+        """
+        Download a file from Telegram servers.
+
+        Args:
+            file_path: Telegram file_path to download
+            download_path: Local directory to save the file
+            file_name: Name for the saved file
 
         Returns:
-            A cleaned and formatted payload dictionary.
+            bool: True if successful, False otherwise
         """
-        if raw_payload:
-            # Remove None values from payload
-            payload = {k: v for k, v in raw_payload.items() if v is not None}
+        file_url = f"https://{self.endpoint}/file/bot{self.token}/{file_path}"
 
-            if 'self' in payload:
-                payload.pop('self')
-            if 'cls' in payload:
-                payload.pop('cls')
-            if 'kwargs' in payload:
-                payload.pop('kwargs')
-            # Apply text formatting if 'text' or 'caption' keys exist
-            if 'text' in payload and payload['text'] is not None:
-                payload['text'] = format_text(payload['text'])
-            if 'caption' in payload and payload['caption'] is not None:
-                payload['caption'] = format_text(payload['caption'])
-                
-            return payload
-        return {}
\ No newline at end of file
+        try:
+            self.logger.info(f"Downloading file from {file_url}")
+            async with self.client.stream('GET', file_url) as response:
+                response.raise_for_status()
+
+                os.makedirs(download_path, exist_ok=True)
+                file_path = os.path.join(download_path, file_name)
+
+                with open(file_path, 'wb') as f:
+                    async for chunk in response.aiter_bytes(chunk_size=8192):
+                        f.write(chunk)
+
+                self.logger.info(f"File saved to {file_path}")
+                return True
+
+        except httpx.HTTPError as e:
+            self.logger.error(f"File download failed: {str(e)}")
+        except OSError as e:
+            self.logger.error(f"File system error: {str(e)}")
+        except Exception:
+            self.logger.exception("Unexpected error during download")
+        return False
+
+    @staticmethod
+    def _httpx_timeout(timeout: Union[float, Tuple[float, float], None]) -> Any:
+        """Converts a requests-style ``(connect, read)`` timeout to httpx.Timeout."""
+        if isinstance(timeout, (tuple, list)):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return timeout
+
+    async def request(
+        self,
+        method: str,
+        payload: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        return_response: bool = True,
+        timeout: Union[float, Tuple[float, float], None] = None
+    ) -> Any:
+        """
+        Execute Telegram API request, retrying flood-control, server and connection errors.
+
+        Args:
+            method: Telegram API method (e.g., 'sendMessage')
+            payload: Dictionary of API parameters (sent as a JSON body, or as form fields with files)
+            files: Files to upload (multipart/form-data)
+            return_response: Whether to return the API result
+            timeout: Timeout in seconds or ``(connect, read)``; defaults to ``self.timeout``
+
+        Returns:
+            The ``result`` field of the API response if return_response=True, None otherwise
+
+        Raises:
+            TelegramError: The matching subclass (BadRequest, Forbidden, RetryAfter, ChatMigrated, ...)
+                when the API rejects the call and it is not retried
+            NetworkError: If Telegram could not be reached
+        """
+        url = urljoin(self.api_endpoint, method)
+        payload = self._prepare_payload(payload)
+        timeout = self._httpx_timeout(self.timeout if timeout is None else timeout)
+        self.logger.info(f"Request to {method} with payload: {payload}")
+        retry_budget.record_request()
+        if files:
+            # Uploads are read in a worker thread, never on the event loop
+            files = await asyncio.to_thread(self._read_files, files)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if is_throttled(method):
+                limiter = self.rate_limiter
+                if limiter is not None:
+                    await limiter.aacquire(payload.get('chat_id'), method)
+
+            try:
+                if files:
+                    response = await self.client.post(
+                        url,
+                        data=self._form_fields(payload),
+                        files=files,
+                        timeout=timeout
+                    )
+                else:
+                    response = await self.client.post(
+                        url,
+                        content=codec.dumpb(payload),
+                        headers=JSON_HEADERS,
+                        timeout=timeout
+                    )
+                json_resp = self._parse_response(method, response.status_code, response.content)
+            except TelegramError as e:
+                error = e
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                # Nothing was sent: safe to repeat any call
+                error = NetworkError(str(e) or e.__class__.__name__, method=method)
+                error.__cause__ = e
+            except (httpx.NetworkError, httpx.RemoteProtocolError) as e:
+                if not is_idempotent(method):
+                    # Reset or aborted after sending: Telegram may have run the call, so it is not repeated
+                    self.logger.error(f"Request failed: {str(e)}")
+                    raise NetworkError(str(e) or e.__class__.__name__, method=method) from e
+                error = NetworkError(str(e) or e.__class__.__name__, method=method)
+                error.__cause__ = e
+            except httpx.HTTPError as e:
+                self.logger.error(f"Request failed: {str(e)}")
+                raise NetworkError(str(e) or e.__class__.__name__, method=method) from e
+            else:
+                self.logger.info(f"Request successful ({response.status_code})")
+                return json_resp['result'] if return_response else None
+
+            delay = self._retry_delay(error, attempt)
+            if delay is None:
+                self.logger.error(f"Telegram API error: {error}")
+                raise error
+            self.logger.warning(f"{error}; retrying in {delay:.2f}s (attempt {attempt + 1})")
+            await asyncio.sleep(delay)
+            self._rewind(files)
+
+    def _convert(self, result: Any, convert: Any) -> Any:
+        """Maps the awaited result of ``request``; returns an awaitable."""
+        async def converted():
+            value = await result
+            return convert(value) if value else None
+        return converted()
+
+    async def aclose(self) -> None:
+        """Close the explicitly supplied client, if any (shared clients stay open)."""
+        if self._client is not None:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> 'AsyncNetwork':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
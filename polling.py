@@ -0,0 +1,382 @@
+import time
+import random
+import functools
+import asyncio
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import wait
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from .dedup import deduplicator
+from .executor import ChatShardedExecutor
+from .updatequeue import durable_queue_enabled, enqueue_updates
+from .exceptions import Conflict, TelegramError
+from .methods import AsyncMethods
+from .network import http_config
+
+try:
+    import httpx
+except ImportError:  # optional dependency for PollingSupervisor
+    httpx = None
+
+"""
+Long polling for bots without a public HTTPS webhook.
+UpdatePoller fetches batches of updates with getUpdates, hands every update of a batch to the bot
+class through the same pipeline as the webhook (monogram.dispatch), and persists the offset in
+BotManager.update_offset once the batch is done, so a restarted poller continues where it stopped.
+PollingSupervisor runs the async variant for many bots in one process.
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class UpdatePoller:
+    """
+    Long-polling loop of one bot.
+
+    Updates of a batch are processed on a ChatShardedExecutor, in order within a chat and
+    concurrently across chats; the next batch is requested when all of them have finished,
+    and only then is the offset confirmed (at-least-once delivery: a crash mid-batch replays
+    the batch).
+
+    Settings:
+        MONOGRAM_POLL_LIMIT: Updates per batch, 1-100 (default 100)
+        MONOGRAM_POLL_TIMEOUT: Long polling timeout in seconds (default 30)
+        MONOGRAM_POLL_WORKERS: Updates processed at the same time (default 8)
+
+    Args:
+        bot: BotManager instance to poll for
+        limit: Updates per batch
+        timeout: Long polling timeout in seconds
+        workers: Chats processed at the same time (executor shards)
+        allowed_updates: Update types to receive (None keeps the bot's previous setting)
+    """
+
+    #: Seconds to wait after a failed getUpdates call, doubled up to ``max_error_delay``
+    error_delay = 1.0
+    max_error_delay = 60.0
+
+    def __init__(self, bot, limit=None, timeout=None, workers=None, allowed_updates=None):
+        self.bot = bot
+        self.limit = limit or getattr(settings, 'MONOGRAM_POLL_LIMIT', 100)
+        self.timeout = getattr(settings, 'MONOGRAM_POLL_TIMEOUT', 30) if timeout is None else timeout
+        self.workers = workers or getattr(settings, 'MONOGRAM_POLL_WORKERS', 8)
+        self.allowed_updates = allowed_updates
+        self.offset = bot.update_offset or None
+        self.durable = durable_queue_enabled()
+        self._stopped = threading.Event()
+        # Metrics
+        self.batches = 0
+        self.updates = 0
+
+    def stop(self):
+        """Makes ``run`` return after the current batch."""
+        self._stopped.set()
+
+    def poll_once(self, executor):
+        """
+        Fetches one batch, processes it and confirms it.
+
+        Returns:
+            int: Number of updates processed
+        """
+        updates = self.bot.getUpdates(
+            offset=self.offset,
+            limit=self.limit,
+            timeout=self.timeout,
+            allowed_updates=self.allowed_updates,
+        )
+        if not updates:
+            return 0
+
+        if self.durable:
+            self._store(updates)
+        else:
+            # Wait for the whole batch; errors are logged by the executor
+            wait(self._submit(executor, updates))
+            self.offset = updates[-1]['update_id'] + 1
+            self.save_offset()
+        self.batches += 1
+        self.updates += len(updates)
+        return len(updates)
+
+    def save_offset(self):
+        """Persists the offset without a full save() (which would re-validate and rebuild the client)."""
+        type(self.bot).objects.filter(pk=self.bot.pk).update(update_offset=self.offset)
+        self.bot.update_offset = self.offset
+
+    def run(self):
+        """
+        Polls until ``stop`` is called.
+
+        Raises:
+            Conflict: If the bot has a webhook or another poller is running
+        """
+        delay = self.error_delay
+        logger.info(f"Polling {self.bot.name} (batch size {self.limit}, timeout {self.timeout}s, {self.workers} workers)")
+        # Unbounded queues: a batch never holds more than ``limit`` updates
+        executor = ChatShardedExecutor(shards=self.workers, max_queue=0, name=f'monogram-poll-{self.bot.name}')
+        try:
+            while not self._stopped.is_set():
+                try:
+                    self.poll_once(executor)
+                    delay = self.error_delay
+                except Conflict:
+                    raise
+                except TelegramError as e:
+                    # Network.request already retried; keep polling after a pause
+                    logger.error(f"getUpdates failed for {self.bot.name}: {e}; retrying in {delay:.0f}s")
+                    self._stopped.wait(delay)
+                    delay = min(delay * 2, self.max_error_delay)
+        finally:
+            executor.shutdown()
+
+    def _store(self, updates):
+        """Hands a batch to the durable queue; the rows and the new offset are committed together."""
+        offset = updates[-1]['update_id'] + 1
+        with transaction.atomic():
+            enqueue_updates(self.bot, updates)
+            type(self.bot).objects.filter(pk=self.bot.pk).update(update_offset=offset)
+        self.offset = self.bot.update_offset = offset
+
+    def _submit(self, executor, updates):
+        """Queues a batch on the executor and returns the futures of its updates."""
+        # A batch replayed after a crash may contain updates that were already handled
+        return [
+            self._submit_one(executor, update_data)
+            for update_data in updates
+            if not deduplicator.contains(self.bot.name, update_data.get('update_id'))
+        ]
+
+    def _submit_one(self, executor, update_data):
+        future = executor.submit(self.bot, update_data)
+        # Marked only once processed: after a crash mid-batch, the unfinished updates are replayed
+        future.add_done_callback(functools.partial(self._processed, update_data.get('update_id')))
+        return future
+
+    def _processed(self, update_id, future):
+        if not future.cancelled():
+            deduplicator.mark(self.bot.name, update_id)
+
+
+class AsyncUpdatePoller(UpdatePoller):
+    """
+    Asyncio variant of UpdatePoller used by PollingSupervisor.
+
+    Long polls through an AsyncMethods client and runs the (synchronous) bot classes
+    on a ChatShardedExecutor shared with the other pollers of the process.
+
+    Args:
+        bot: BotManager instance to poll for
+        api: AsyncMethods client of the bot
+        executor: ChatShardedExecutor shared by the pollers
+        limit: Updates per batch
+        timeout: Long polling timeout in seconds
+        allowed_updates: Update types to receive
+    """
+
+    def __init__(self, bot, api, executor, limit=None, timeout=None, allowed_updates=None):
+        super().__init__(bot, limit=limit, timeout=timeout, allowed_updates=allowed_updates)
+        self.api = api
+        self.executor = executor
+
+    async def poll_once(self):
+        updates = await self.api.getUpdates(
+            offset=self.offset,
+            limit=self.limit,
+            timeout=self.timeout,
+            allowed_updates=self.allowed_updates,
+        )
+        if not updates:
+            return 0
+
+        if self.durable:
+            await sync_to_async(self._store)(updates)
+        else:
+            futures = await self._asubmit(updates)
+            await asyncio.gather(*(asyncio.wrap_future(future) for future in futures), return_exceptions=True)
+            self.offset = updates[-1]['update_id'] + 1
+            await sync_to_async(self.save_offset)()
+        self.batches += 1
+        self.updates += len(updates)
+        return len(updates)
+
+    async def _asubmit(self, updates):
+        """``_submit`` without blocking the event loop on the deduplication backend."""
+        futures = []
+        for update_data in updates:
+            if not await deduplicator.acontains(self.bot.name, update_data.get('update_id')):
+                # The done callback (which marks the update) runs on the executor's thread
+                futures.append(self._submit_one(self.executor, update_data))
+        return futures
+
+    async def run(self):
+        """Polls until cancelled; errors propagate to the supervisor."""
+        while not self._stopped.is_set():
+            await self.poll_once()
+
+
+class PollingSupervisor:
+    """
+    Long-polls many bots from one process.
+
+    Every bot gets an AsyncUpdatePoller task; all of them share one httpx connection pool
+    (bots behind a proxy share one per proxy) and one ChatShardedExecutor runs the bot classes.
+    The pools are closed when ``run`` returns. A poller
+    that fails is restarted after a jittered, exponentially growing delay, which resets once
+    it has been running for ``healthy_after`` seconds. Throughput per bot is reported every
+    ``report_interval`` seconds.
+
+    Settings:
+        MONOGRAM_SUPERVISOR_WORKERS: Chats processed at the same time across all bots (default 32)
+        MONOGRAM_SUPERVISOR_REPORT_INTERVAL: Seconds between throughput reports (default 60, 0 disables)
+
+    Args:
+        bots: BotManager instances to poll for
+        limit: Updates per batch
+        timeout: Long polling timeout in seconds
+        workers: Shards (threads) of the shared executor
+        report_interval: Seconds between reports
+        report: Callable receiving each report line (defaults to logging)
+    """
+
+    restart_delay = 1.0
+    max_restart_delay = 300.0
+    healthy_after = 60.0
+
+    def __init__(self, bots, limit=None, timeout=None, workers=None, report_interval=None, report=None):
+        if httpx is None:
+            raise ImportError("PollingSupervisor requires the 'httpx' package (pip install httpx).")
+        self.bots = list(bots)
+        self.limit = limit
+        self.timeout = timeout
+        self.workers = workers or getattr(settings, 'MONOGRAM_SUPERVISOR_WORKERS', 32)
+        if report_interval is None:
+            report_interval = getattr(settings, 'MONOGRAM_SUPERVISOR_REPORT_INTERVAL', 60)
+        self.report_interval = report_interval
+        self.report = report or logger.info
+        self.pollers = {}
+        self.restarts = {bot.name: 0 for bot in self.bots}
+        # Shared executor of the bot classes, created by ``run``
+        self.executor = None
+        self._reported = {}
+        self._stopped = None
+
+    def stop(self):
+        """Makes ``run`` return; running batches are cancelled and replayed on the next start."""
+        if self._stopped is not None:
+            self._stopped.set()
+
+    def stats(self):
+        """
+        Returns:
+            dict: Per bot name, updates and batches processed, restarts and current offset
+        """
+        return {
+            name: {
+                'updates': poller.updates,
+                'batches': poller.batches,
+                'restarts': self.restarts[name],
+                'offset': poller.offset,
+            }
+            for name, poller in self.pollers.items()
+        }
+
+    async def run(self):
+        self._stopped = asyncio.Event()
+        config = http_config()
+        # Every bot holds one connection in its long poll; leave room for the calls of the handlers
+        connections = len(self.bots) + config['pool_maxsize']
+        clients = {}
+        tasks = []
+        # Unbounded queues: submitting runs on the event loop and must never block
+        executor = ChatShardedExecutor(shards=self.workers, max_queue=0, name='monogram-supervisor')
+        self.executor = executor
+        try:
+            clients[None] = httpx.AsyncClient(limits=httpx.Limits(
+                max_connections=connections,
+                max_keepalive_connections=connections,
+            ))
+            # One pool per proxy, sized the same way for the bots behind it
+            for proxy_url, count in Counter(bot.proxy_url for bot in self.bots if bot.proxy).items():
+                clients[proxy_url] = httpx.AsyncClient(proxy=proxy_url, limits=httpx.Limits(
+                    max_connections=count + config['pool_maxsize'],
+                    max_keepalive_connections=count + config['pool_maxsize'],
+                ))
+
+            for bot in self.bots:
+                api = AsyncMethods(
+                    token=bot.token,
+                    secret_token=bot.secret_token,
+                    endpoint=bot.endpoint,
+                    proxy=bot.proxy,
+                    proxy_url=bot.proxy_url,
+                    client=clients[bot.proxy_url if bot.proxy else None],
+                    **bot.http_options
+                )
+                self.pollers[bot.name] = AsyncUpdatePoller(bot, api, executor, limit=self.limit, timeout=self.timeout)
+
+            tasks = [asyncio.create_task(self._supervise(poller)) for poller in self.pollers.values()]
+            if self.report_interval:
+                tasks.append(asyncio.create_task(self._report_loop()))
+            self.report(f"Supervising {len(self.pollers)} bots ({self.workers} workers, {connections} connections)")
+            await self._stopped.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for client in clients.values():
+                await client.aclose()
+            executor.shutdown(wait=False)
+
+    async def _supervise(self, poller):
+        name = poller.bot.name
+        delay = self.restart_delay
+        while True:
+            started = time.monotonic()
+            try:
+                await poller.run()
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if time.monotonic() - started >= self.healthy_after:
+                    delay = self.restart_delay
+                self.restarts[name] += 1
+                wait = random.uniform(delay / 2, delay)
+                if isinstance(e, Conflict):
+                    logger.error(f"Poller of {name} stopped: {e}. Is a webhook set or another poller running?")
+                elif isinstance(e, TelegramError):
+                    logger.error(f"Poller of {name} failed: {e}")
+                else:
+                    logger.exception(f"Poller of {name} crashed")
+                logger.warning(f"Restarting poller of {name} in {wait:.1f}s")
+                await asyncio.sleep(wait)
+                delay = min(delay * 2, self.max_restart_delay)
+
+    async def _report_loop(self):
+        last = time.monotonic()
+        while True:
+            await asyncio.sleep(self.report_interval)
+            now = time.monotonic()
+            self.report_rates(now - last)
+            last = now
+
+    def report_rates(self, elapsed):
+        """Reports updates/sec per bot since the previous report."""
+        total = 0
+        lines = []
+        for name, poller in self.pollers.items():
+            count = poller.updates - self._reported.get(name, 0)
+            self._reported[name] = poller.updates
+            total += count
+            if count or self.restarts[name]:
+                lines.append(
+                    f"  {name}: {count / elapsed:.1f} updates/s "
+                    f"(total {poller.updates}, restarts {self.restarts[name]})"
+                )
+        self.report(f"{total / elapsed:.1f} updates/s across {len(self.pollers)} bots")
+        for line in lines:
+            self.report(line)
@@ -0,0 +1,258 @@
+import math
+import time
+import asyncio
+import threading
+import logging
+from .exceptions import RetryAfter
+
+"""
+Outgoing rate limiting for the Telegram API.
+Each bot token gets its own RateLimiter with a global bucket and one bucket per chat, following
+Telegram's broadcast limits (about 30 messages per second overall, 1 per second in a private chat,
+20 per minute in a group). Telegram tolerates short bursts in a chat, so a private chat may take a few
+messages at once (a handler answering with two or three messages is not slowed down). Network.request reserves a slot before every message-sending call and
+waits for the returned delay, so bursts are spread out instead of being answered with 429. A call
+that would have to wait longer than the limiter's max_delay fails right away with RetryAfter.
+"""
+
+logger = logging.getLogger(__name__)
+
+# (calls, period in seconds[, burst]); the burst defaults to the number of calls
+DEFAULT_LIMITS = {
+    'global': (30, 1.0),     # messages per second for the whole bot
+    'private': (1, 1.0, 3),  # per private chat, up to 3 at once
+    'group': (20, 60.0),     # per group, supergroup or channel
+}
+
+# Longest wait for a slot before a call fails with RetryAfter (a group allows only 20 messages per minute)
+DEFAULT_MAX_DELAY = 10.0
+
+# Methods that post messages and count against the limits
+THROTTLED_PREFIXES = ('send', 'forward', 'copy')
+UNTHROTTLED_METHODS = frozenset(('sendChatAction',))
+
+
+def is_throttled(method):
+    """Whether calls to an API method count against the message limits."""
+    return method.startswith(THROTTLED_PREFIXES) and method not in UNTHROTTLED_METHODS
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations.
+
+    A reservation always succeeds and returns how long the caller has to wait before using it,
+    so concurrent callers are queued in the order they reserved. Not thread-safe on its own;
+    RateLimiter serializes access.
+
+    Args:
+        limit (int): Number of calls allowed per period.
+        period (float): Length of the period in seconds.
+        burst (int): Calls allowed at once (defaults to ``limit``).
+    """
+
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated')
+
+    def __init__(self, limit, period, burst=None, now=None):
+        self.rate = limit / period
+        self.capacity = float(burst or limit)
+        self.tokens = self.capacity
+        self.updated = time.monotonic() if now is None else now
+
+    def reserve(self, now):
+        """Takes one token and returns the seconds to wait until it is available."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def idle(self, now):
+        """Whether the bucket has refilled completely (and can be dropped)."""
+        return self.tokens + (now - self.updated) * self.rate >= self.capacity
+
+
+class RateLimiter:
+    """
+    Rate limits of one bot: a global bucket plus a bucket per chat.
+
+    Thread-safe; share one instance between all threads and event loops that use the same bot.
+
+    Args:
+        limits (dict): Overrides of DEFAULT_LIMITS, e.g. ``{'global': (25, 1.0)}``.
+        max_chats (int): Number of chat buckets kept before idle ones are dropped.
+        max_delay (float): Longest wait for a slot in seconds; None waits as long as needed.
+    """
+
+    def __init__(self, limits=None, max_chats=10000, max_delay=DEFAULT_MAX_DELAY):
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self.max_chats = max_chats
+        self.max_delay = max_delay
+        self._global = TokenBucket(*self.limits['global'])
+        self._chats = {}
+        self._lock = threading.Lock()
+        # Metrics
+        self.calls = 0
+        self.delayed = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self.rejected = 0
+
+    @staticmethod
+    def chat_kind(chat_id):
+        """'private' for user chats, 'group' for groups, supergroups and channels."""
+        if isinstance(chat_id, str):
+            # '@channelusername' or a numeric id sent as a string
+            if not chat_id.lstrip('-').isdigit():
+                return 'group'
+            chat_id = int(chat_id)
+        return 'group' if chat_id < 0 else 'private'
+
+    def reserve(self, chat_id=None, method=None):
+        """
+        Reserves a slot for one message.
+
+        Args:
+            chat_id: Target chat, or None for calls that only count against the global limit.
+            method: API method of the call (used in the error message).
+
+        Returns:
+            float: Seconds to wait before sending (0 when the message can go out right away).
+
+        Raises:
+            RetryAfter: If the wait would exceed ``max_delay``; no slot is taken.
+        """
+        now = time.monotonic()
+        with self._lock:
+            buckets = [self._global]
+            if chat_id is not None:
+                bucket = self._chats.get(chat_id)
+                if bucket is None:
+                    if len(self._chats) >= self.max_chats:
+                        self._prune(now)
+                    bucket = self._chats[chat_id] = TokenBucket(*self.limits[self.chat_kind(chat_id)], now=now)
+                buckets.append(bucket)
+            delay = max(bucket.reserve(now) for bucket in buckets)
+
+            if self.max_delay is not None and delay > self.max_delay:
+                # Give the tokens back so the rejected call does not delay later ones
+                for bucket in buckets:
+                    bucket.tokens += 1
+                self.rejected += 1
+                raise RetryAfter(
+                    f"Rate limit: the next slot for chat {chat_id} is {delay:.1f}s away "
+                    f"(longer than {self.max_delay}s)",
+                    error_code=429,
+                    method=method,
+                    parameters={'retry_after': math.ceil(delay)},
+                )
+
+            self.calls += 1
+            if delay:
+                self.delayed += 1
+                self.wait_time += delay
+                self.max_wait = max(self.max_wait, delay)
+        return delay
+
+    def acquire(self, chat_id=None, method=None):
+        """
+        Reserves a slot and sleeps until it is available; returns the time waited.
+
+        Raises:
+            RetryAfter: If the slot is more than ``max_delay`` seconds away.
+        """
+        delay = self.reserve(chat_id, method)
+        if delay:
+            logger.debug(f"Rate limit: waiting {delay:.3f}s before sending to {chat_id}")
+            time.sleep(delay)
+        return delay
+
+    async def aacquire(self, chat_id=None, method=None):
+        """Async variant of ``acquire``."""
+        delay = self.reserve(chat_id, method)
+        if delay:
+            logger.debug(f"Rate limit: waiting {delay:.3f}s before sending to {chat_id}")
+            await asyncio.sleep(delay)
+        return delay
+
+    def stats(self):
+        """
+        Returns:
+            dict: Calls, how many of them had to wait, total and longest wait in seconds, calls rejected
+            for exceeding ``max_delay``, tracked chats.
+        """
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'delayed': self.delayed,
+                'wait_time': self.wait_time,
+                'max_wait': self.max_wait,
+                'rejected': self.rejected,
+                'chats': len(self._chats),
+            }
+
+    def _prune(self, now):
+        # Buckets that refilled completely carry no state
+        for chat_id in [chat_id for chat_id, bucket in self._chats.items() if bucket.idle(now)]:
+            del self._chats[chat_id]
+
+
+class RateLimiterRegistry:
+    """
+    Process-wide registry of rate limiters, one per bot token.
+
+    Every BotManager row gets its own limits, while all instances of the same bot
+    (threads, requests, async clients) share one limiter.
+
+    Settings:
+        MONOGRAM_RATE_LIMIT: True (default) for the Telegram limits, False to disable,
+            or a dict overriding them as ``(calls, seconds[, burst])``,
+            e.g. ``{'global': (25, 1.0), 'private': (1, 1.0, 1)}``
+        MONOGRAM_RATE_LIMIT_MAX_WAIT: Longest wait for a slot in seconds before the call raises
+            RetryAfter (default 10, None to wait as long as needed)
+    """
+
+    def __init__(self):
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def config():
+        try:
+            from django.conf import settings
+            return getattr(settings, 'MONOGRAM_RATE_LIMIT', True)
+        except Exception:
+            # Used outside a configured Django project
+            return True
+
+    @staticmethod
+    def max_delay():
+        try:
+            from django.conf import settings
+            return getattr(settings, 'MONOGRAM_RATE_LIMIT_MAX_WAIT', DEFAULT_MAX_DELAY)
+        except Exception:
+            return DEFAULT_MAX_DELAY
+
+    def get(self, token):
+        """Returns the limiter of a bot, or None when rate limiting is disabled."""
+        limiter = self._limiters.get(token)
+        if limiter is not None:
+            return limiter
+
+        config = self.config()
+        if not config:
+            return None
+        with self._lock:
+            limiter = self._limiters.get(token)
+            if limiter is None:
+                limiter = RateLimiter(limits=config if isinstance(config, dict) else None, max_delay=self.max_delay())
+                self._limiters[token] = limiter
+        return limiter
+
+    def clear(self):
+        with self._lock:
+            self._limiters.clear()
+
+
+rate_limiters = RateLimiterRegistry()
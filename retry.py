@@ -0,0 +1,112 @@
+import time
+import random
+import threading
+
+"""
+Retry policy for Telegram API calls.
+Network.request retries flood-control errors (429) after the delay Telegram asks for, and server
+errors (5xx) and connection failures with jittered exponential backoff. Failures after the request may
+have been sent (reset or aborted connections) are only retried for idempotent methods, so a message is
+never posted twice. Backoff retries are paid for from a process-wide RetryBudget, so during an outage
+retries stay a small fraction of the traffic instead of multiplying it.
+"""
+
+# Methods that can be repeated without side effects even when the first call reached Telegram
+IDEMPOTENT_PREFIXES = ('get',)
+
+
+def is_idempotent(method):
+    """Whether an API method may be repeated after a failure in the middle of the exchange."""
+    return method.startswith(IDEMPOTENT_PREFIXES)
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of recent requests.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, on top of a small
+    allowance of ``min_per_second`` retries per second so that low-traffic processes can still retry.
+    Thread-safe.
+
+    Args:
+        ratio (float): Retries allowed per request (0.1 = at most 10% extra load).
+        min_per_second (float): Retries always allowed per second.
+        max_balance (float): Cap on saved up tokens.
+    """
+
+    def __init__(self, ratio=0.1, min_per_second=1.0, max_balance=100.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_balance = max_balance
+        self._balance = max_balance
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.exhausted = 0
+
+    def record_request(self):
+        """Called once for every request sent (not for retries)."""
+        with self._lock:
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def try_retry(self):
+        """Withdraws one retry; returns False when the budget is used up."""
+        now = time.monotonic()
+        with self._lock:
+            self._balance = min(self.max_balance, self._balance + (now - self._updated) * self.min_per_second)
+            self._updated = now
+            if self._balance < 1:
+                self.exhausted += 1
+                return False
+            self._balance -= 1
+            self.retries += 1
+            return True
+
+    def stats(self):
+        """
+        Returns:
+            dict: Current balance, retries granted and retries refused.
+        """
+        with self._lock:
+            return {'balance': self._balance, 'retries': self.retries, 'exhausted': self.exhausted}
+
+
+class RetryPolicy:
+    """
+    How failed calls are retried.
+
+    Settings:
+        MONOGRAM_RETRY: Dict overriding the defaults, e.g. ``{'max_attempts': 5, 'max_retry_after': 60}``,
+            or False to disable retries
+
+    Args:
+        max_attempts (int): Total attempts per call, including the first one.
+        backoff_base (float): First backoff delay in seconds, doubled on every attempt.
+        backoff_max (float): Upper bound of a backoff delay.
+        max_retry_after (float): Longest flood-control wait (429) that is retried automatically.
+    """
+
+    def __init__(self, max_attempts=3, backoff_base=0.5, backoff_max=10.0, max_retry_after=30.0):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+
+    @classmethod
+    def from_settings(cls):
+        try:
+            from django.conf import settings
+            config = getattr(settings, 'MONOGRAM_RETRY', {})
+        except Exception:
+            # Used outside a configured Django project
+            config = {}
+        if config is False:
+            return cls(max_attempts=1)
+        return cls(**(config or {}))
+
+    def backoff(self, attempt):
+        """Full-jitter exponential backoff delay before retry number ``attempt`` (1-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+
+retry_budget = RetryBudget()
@@ -0,0 +1,24 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import BotManager
+from .cache import bot_cache
+
+"""
+Signal handlers keeping monogram's in-memory caches consistent with the BotManager table.
+"""
+
+
+@receiver(post_save, sender=BotManager)
+def invalidate_bot_on_save(sender, instance, **kwargs):
+    """Drops the saved bot from the lookup cache (under its previous name too, in case it was renamed)."""
+    bot_cache.invalidate(name=instance.name, pk=instance.pk)
+    if instance._loaded_name and instance._loaded_name != instance.name:
+        bot_cache.invalidate(name=instance._loaded_name)
+
+
+@receiver(post_delete, sender=BotManager)
+def invalidate_bot_on_delete(sender, instance, **kwargs):
+    """Drops the deleted bot from the lookup cache."""
+    bot_cache.invalidate(name=instance.name, pk=instance.pk)
+    if instance._loaded_name and instance._loaded_name != instance.name:
+        bot_cache.invalidate(name=instance._loaded_name)
@@ -0,0 +1,34 @@
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from monogram.cache import bot_cache
+from monogram.models import BotManager
+
+
+@override_settings(MONOGRAM_BOT_CACHE_BACKEND='default')
+class BotCacheTests(TestCase):
+    def setUp(self):
+        bot_cache.clear()
+        caches['default'].clear()
+        self.addCleanup(bot_cache.clear)
+
+    def test_renamed_bot_is_dropped_under_its_old_name(self):
+        BotManager(name='old', token='1:old').save()
+        bot = bot_cache.get('old')
+        self.assertIsNotNone(caches['default'].get(bot_cache.key_prefix + 'old'))
+
+        bot.name = 'new'
+        bot.save()
+        self.assertIsNone(caches['default'].get(bot_cache.key_prefix + 'old'))
+        with self.assertRaises(BotManager.DoesNotExist):
+            bot_cache.get('old')
+        self.assertEqual(bot_cache.get('new').pk, bot.pk)
+
+    def test_bot_rebuilt_from_backend(self):
+        BotManager(name='shared', token='1:shared').save()
+        bot_cache.get('shared')
+        bot_cache.clear()
+        with self.assertNumQueries(0):
+            bot = bot_cache.get('shared')
+        self.assertEqual(bot._state.db, 'default')
+        self.assertFalse(bot._state.adding)
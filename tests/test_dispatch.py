@@ -0,0 +1,38 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase
+
+from monogram.dispatch import UpdateDispatcher
+
+BOT = SimpleNamespace(name='loopbot')
+
+
+class DispatcherLoopTests(SimpleTestCase):
+    def setUp(self):
+        self.dispatcher = UpdateDispatcher()
+        self.handled = []
+        patcher = mock.patch('monogram.dispatch.process_raw_update', side_effect=lambda bot, data: self.handled.append(data))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _enqueue(self, update_id, drain):
+        self.assertTrue(self.dispatcher.enqueue(BOT, {'update_id': update_id}))
+        if drain:
+            await self.dispatcher._queues[BOT.name].join()
+
+    def test_drained_loop_is_replaced(self):
+        asyncio.run(self._enqueue(1, drain=True))
+        asyncio.run(self._enqueue(2, drain=True))
+        self.assertEqual(self.handled, [{'update_id': 1}, {'update_id': 2}])
+        self.assertEqual(self.dispatcher.unfinished, 0)
+
+    def test_loop_with_unfinished_updates_is_refused(self):
+        # The loop closes before its worker runs, as under WSGI
+        asyncio.run(self._enqueue(1, drain=False))
+        self.assertEqual(self.dispatcher.unfinished, 1)
+        with self.assertRaises(ImproperlyConfigured):
+            asyncio.run(self._enqueue(2, drain=False))
+        self.assertNotIn({'update_id': 2}, self.handled)
@@ -0,0 +1,102 @@
+from django.test import SimpleTestCase
+
+from monogram.handlers import BotHandlerManager, MessageMatcher
+
+
+class Callback:
+    def __init__(self, data):
+        self.data = data
+
+
+class ExampleBot(BotHandlerManager):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    @BotHandlerManager.on_message('hi')
+    def greet(self, message, user):
+        self.calls.append(('greet', message['text']))
+
+    @BotHandlerManager.on_callback(startswith='item:')
+    def item(self, callback_query, user):
+        self.calls.append(('item', callback_query.data))
+
+    def unknown_message(self, message, user):
+        self.calls.append(('unknown', message['text']))
+
+    def unknown_action(self, callback_query):
+        self.calls.append(('unknown_action', callback_query.data))
+
+
+class RuntimeHandlerTests(SimpleTestCase):
+    def test_message_handler_added_on_instance(self):
+        bot = ExampleBot()
+        bot.message_handlers['bye'] = lambda message, user: bot.calls.append(('bye', message['text']))
+        bot.handle_message({'text': 'bye'}, None)
+        bot.handle_message({'text': 'hi'}, None)
+        self.assertEqual(bot.calls, [('bye', 'bye'), ('greet', 'hi')])
+
+    def test_instance_changes_do_not_leak_to_other_instances(self):
+        bot = ExampleBot()
+        del bot.message_handlers['hi']
+        bot.handle_message({'text': 'hi'}, None)
+        self.assertEqual(bot.calls, [('unknown', 'hi')])
+
+        other = ExampleBot()
+        other.handle_message({'text': 'hi'}, None)
+        self.assertEqual(other.calls, [('greet', 'hi')])
+        self.assertIn('hi', other.message_handlers)
+
+    def test_callback_handler_added_on_instance(self):
+        bot = ExampleBot()
+        bot.callback_handlers['item:special'] = (
+            'startswith', lambda callback_query, user: bot.calls.append(('special', callback_query.data))
+        )
+        bot.handle_callback_query(Callback('item:special:1'), None)
+        bot.handle_callback_query(Callback('item:2'), None)
+        bot.handle_callback_query(Callback('other'), None)
+        self.assertEqual(bot.calls, [('special', 'item:special:1'), ('item', 'item:2'), ('unknown_action', 'other')])
+
+
+class RegexBot(BotHandlerManager):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    @BotHandlerManager.on_message(regex=r'order (\d+)')
+    def order(self, message, user, match):
+        self.calls.append(('order', match.group(1)))
+
+    @BotHandlerManager.on_message(regex=r'(\w)\1!')
+    def doubled(self, message, user, match):
+        self.calls.append(('doubled', match.group(1)))
+
+    def unknown_message(self, message, user):
+        self.calls.append(('unknown', message['text']))
+
+
+class RegexRoutingTests(SimpleTestCase):
+    def test_backreference_pattern_matches(self):
+        bot = RegexBot()
+        bot.handle_message({'text': 'aa!'}, None)
+        bot.handle_message({'text': 'ab!'}, None)
+        bot.handle_message({'text': 'order 42'}, None)
+        self.assertEqual(bot.calls, [('doubled', 'a'), ('unknown', 'ab!'), ('order', '42')])
+
+    def test_patterns_without_group_numbers_are_combined(self):
+        matcher = MessageMatcher()
+        matcher.add_regex(r'order (\d+)', 'order')
+        matcher.add_regex(r'(?P<word>\w+)!', 'shout')
+        matcher.compile()
+        self.assertIsNotNone(matcher._combined)
+        handler, match = matcher.match_regex('hey!')
+        self.assertEqual((handler, match.group('word')), ('shout', 'hey'))
+
+    def test_group_numbers_fall_back_to_sequential_matching(self):
+        matcher = MessageMatcher()
+        matcher.add_regex(r'order (\d+)', 'order')
+        matcher.add_regex(r'(a)?b(?(1)c|d)', 'conditional')
+        matcher.compile()
+        self.assertIsNone(matcher._combined)
+        self.assertEqual(matcher.match_regex('abc')[0], 'conditional')
+        self.assertEqual(matcher.match_regex('bd')[0], 'conditional')
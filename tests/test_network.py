@@ -0,0 +1,101 @@
+import asyncio
+from http.client import RemoteDisconnected
+from types import SimpleNamespace
+from unittest import mock, skipIf
+
+import requests
+from django.test import SimpleTestCase, override_settings
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from monogram.exceptions import NetworkError
+from monogram.network import AsyncNetwork, Network, httpx
+from monogram.ratelimit import rate_limiters
+from monogram.retry import RetryPolicy
+
+OK = SimpleNamespace(status_code=200, content=b'{"ok":true,"result":true}')
+
+
+def refused():
+    reason = NewConnectionError(None, 'Failed to establish a new connection: [Errno 111] Connection refused')
+    return requests.exceptions.ConnectionError(MaxRetryError(None, '/bot/sendMessage', reason=reason))
+
+
+def aborted():
+    return requests.exceptions.ConnectionError(
+        ProtocolError('Connection aborted.', RemoteDisconnected('Remote end closed connection without response'))
+    )
+
+
+@override_settings(MONOGRAM_RATE_LIMIT=False)
+class RetrySplitTests(SimpleTestCase):
+    """Only failures before the request was sent are retried for calls that are not idempotent."""
+
+    def setUp(self):
+        rate_limiters.clear()
+        self.network = Network('1:retry', 's', 'api.telegram.org')
+        self.network.retry_policy = RetryPolicy(max_attempts=3, backoff_base=0)
+        self.outcomes = []
+        post = mock.patch.object(self.network.session, 'post', side_effect=self._post)
+        self.post = post.start()
+        self.addCleanup(post.stop)
+
+    def _post(self, url, **kwargs):
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def test_refused_connection_is_retried_for_send(self):
+        self.outcomes = [refused(), OK]
+        self.assertTrue(self.network.request('sendMessage', {'chat_id': 1, 'text': 'hi'}))
+        self.assertEqual(self.post.call_count, 2)
+
+    def test_connect_timeout_is_retried_for_send(self):
+        self.outcomes = [requests.exceptions.ConnectTimeout('connect timeout'), OK]
+        self.assertTrue(self.network.request('sendMessage', {'chat_id': 1, 'text': 'hi'}))
+        self.assertEqual(self.post.call_count, 2)
+
+    def test_aborted_connection_is_not_retried_for_send(self):
+        self.outcomes = [aborted(), OK]
+        with self.assertRaises(NetworkError):
+            self.network.request('sendMessage', {'chat_id': 1, 'text': 'hi'})
+        self.assertEqual(self.post.call_count, 1)
+
+    def test_aborted_connection_is_retried_for_get(self):
+        self.outcomes = [aborted(), OK]
+        self.assertTrue(self.network.request('getMe'))
+        self.assertEqual(self.post.call_count, 2)
+
+
+@skipIf(httpx is None, 'httpx is not installed')
+@override_settings(MONOGRAM_RATE_LIMIT=False)
+class AsyncRetrySplitTests(SimpleTestCase):
+    def request(self, method, errors):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) <= len(errors):
+                raise errors[len(calls) - 1]
+            return httpx.Response(200, json={'ok': True, 'result': True})
+
+        rate_limiters.clear()
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            network = AsyncNetwork('1:retry', 's', 'api.telegram.org', client=client)
+            network.retry_policy = RetryPolicy(max_attempts=3, backoff_base=0)
+            async with network:
+                return await network.request(method, {'chat_id': 1, 'text': 'hi'})
+
+        return asyncio.run(run()), len(calls)
+
+    def test_connect_error_is_retried_for_send(self):
+        self.assertEqual(self.request('sendMessage', [httpx.ConnectError('refused')]), (True, 2))
+
+    def test_read_error_is_not_retried_for_send(self):
+        with self.assertRaises(NetworkError):
+            self.request('sendMessage', [httpx.ReadError('reset')])
+
+    def test_remote_protocol_error_is_retried_for_get(self):
+        self.assertEqual(self.request('getChat', [httpx.RemoteProtocolError('aborted')]), (True, 2))
@@ -0,0 +1,44 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import mock, skipIf
+
+from django.test import SimpleTestCase
+
+from monogram.polling import PollingSupervisor, httpx
+
+
+def bot(name, proxy_url=None):
+    return SimpleNamespace(
+        name=name, token=f'1:{name}', secret_token='', endpoint='api.telegram.org',
+        proxy=proxy_url is not None, proxy_url=proxy_url, http_options={}, update_offset=0,
+    )
+
+
+@skipIf(httpx is None, 'httpx is not installed')
+class PollingSupervisorTests(SimpleTestCase):
+    def test_usable_before_run(self):
+        supervisor = PollingSupervisor([bot('a')], report_interval=0)
+        self.assertIsNone(supervisor.executor)
+        self.assertEqual(supervisor.stats(), {})
+        supervisor.stop()
+
+    def test_clients_are_closed_on_shutdown(self):
+        bots = [bot('direct'), bot('p1', 'http://proxy-a:8080'), bot('p2', 'http://proxy-a:8080'), bot('p3', 'http://proxy-b:8080')]
+        supervisor = PollingSupervisor(bots, report_interval=0)
+
+        async def poll_forever(self, poller):
+            await asyncio.Event().wait()
+
+        async def run():
+            with mock.patch.object(PollingSupervisor, '_supervise', poll_forever):
+                task = asyncio.create_task(supervisor.run())
+                while len(supervisor.pollers) < len(bots) and not task.done():
+                    await asyncio.sleep(0)
+                supervisor.stop()
+                await task
+
+        asyncio.run(run())
+        clients = {poller.api.client for poller in supervisor.pollers.values()}
+        # One shared pool, plus one per proxy
+        self.assertEqual(len(clients), 3)
+        self.assertTrue(all(client.is_closed for client in clients))
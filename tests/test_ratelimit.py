@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from monogram import codec
+from monogram.methods import Methods
+from monogram.monoTypes import Message
+from monogram.ratelimit import RateLimiter, rate_limiters
+
+CHAT = {'id': 42, 'type': 'private'}
+SENT = codec.dumpb({'ok': True, 'result': {'message_id': 2, 'date': 0, 'chat': CHAT, 'text': 'ok'}})
+
+
+class PrivateChatBurstTests(SimpleTestCase):
+    def setUp(self):
+        rate_limiters.clear()
+        self.addCleanup(rate_limiters.clear)
+        self.bot = Methods(token='77:burst', secret_token='', endpoint='api.telegram.org', proxy=False, proxy_url=None)
+        post = mock.patch.object(
+            self.bot.session, 'post', return_value=SimpleNamespace(status_code=200, content=SENT)
+        )
+        post.start()
+        self.addCleanup(post.stop)
+        sleep = mock.patch('monogram.ratelimit.time.sleep')
+        self.sleep = sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def test_handler_sending_several_replies_does_not_wait(self):
+        message = Message(bot=self.bot, message_id=1, date=0, chat=CHAT, text='/start')
+        # A typical handler: a greeting, the menu and a hint
+        message.answer('Welcome!')
+        message.reply('Here is the menu')
+        message.answer('Tap a button')
+        self.sleep.assert_not_called()
+        self.assertEqual(self.bot.rate_limiter.stats()['delayed'], 0)
+
+    def test_private_chat_is_limited_after_the_burst(self):
+        limiter = RateLimiter()
+        delays = [limiter.reserve(CHAT['id']) for _ in range(4)]
+        self.assertEqual(delays[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(delays[3], 1.0, places=2)
+
+    def test_burst_can_be_overridden(self):
+        limiter = RateLimiter(limits={'private': (1, 1.0)})
+        self.assertEqual(limiter.reserve(CHAT['id']), 0.0)
+        self.assertGreater(limiter.reserve(CHAT['id']), 0.9)
@@ -0,0 +1,148 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from monogram.methods import Methods
+from monogram.monoTypes import Message
+from monogram.network import Network
+from monogram.text import Formater, FormattedText, format_text
+
+SENT = {'message_id': 2, 'date': 0, 'chat': {'id': 1, 'type': 'private'}, 'text': 'ok'}
+
+
+class FormatOnceTests(SimpleTestCase):
+    """
+    Text must be converted to HTML exactly once however many layers it passes through
+    (Message helper -> API method -> payload preparation in Network.request).
+    """
+
+    # A code span is rendered without a nested _render call, so every pass counts once
+    text = 'Hello `world`'
+
+    def setUp(self):
+        self.bot = Methods(token='123:abc', secret_token='', endpoint='api.telegram.org', proxy=False, proxy_url=None)
+        self.message = Message(bot=self.bot, message_id=1, date=0, chat={'id': 1, 'type': 'private'}, text='hi')
+        self.sent = []
+        send = mock.patch.object(Network, '_send', autospec=True, side_effect=self._send)
+        send.start()
+        self.addCleanup(send.stop)
+
+    def _send(self, client, method, url, payload, files, return_response, timeout):
+        self.sent.append((method, payload))
+        return SENT
+
+    def assertFormattedOnce(self, call, field='text'):
+        with mock.patch.object(Formater, '_render', wraps=Formater._render) as render:
+            call()
+        self.assertEqual(render.call_count, 1)
+        method, payload = self.sent[-1]
+        self.assertEqual(payload[field], 'Hello <code>world</code>')
+        self.assertIsInstance(payload[field], FormattedText)
+
+    def test_answer(self):
+        self.assertFormattedOnce(lambda: self.message.answer(self.text))
+
+    def test_reply(self):
+        self.assertFormattedOnce(lambda: self.message.reply(self.text))
+
+    def test_edit_message(self):
+        self.assertFormattedOnce(lambda: self.message.editMessage(self.text))
+
+    def test_send_message(self):
+        self.assertFormattedOnce(lambda: self.bot.sendMessage(chat_id=1, text=self.text))
+
+    def test_send_photo_caption(self):
+        with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as photo:
+            photo.write(b'jpeg')
+        self.addCleanup(os.remove, photo.name)
+        self.assertFormattedOnce(
+            lambda: self.bot.sendPhoto(chat_id=1, photo=photo.name, caption=self.text), field='caption'
+        )
+
+    def test_send_animation_caption(self):
+        self.assertFormattedOnce(
+            lambda: self.bot.sendAnimation(chat_id=1, animation='file-id', caption=self.text), field='caption'
+        )
+
+    def test_formatted_text_is_not_formatted_again(self):
+        formatted = format_text(self.text)
+        with mock.patch.object(Formater, '_render', wraps=Formater._render) as render:
+            self.bot.sendMessage(chat_id=1, text=formatted)
+        self.assertEqual(render.call_count, 0)
+
+
+class FormatTextTests(SimpleTestCase):
+    def assertFormats(self, cases):
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(format_text(text), expected)
+
+    def test_styles(self):
+        self.assertFormats([
+            ('*bold*', '<b>bold</b>'),
+            ('_italic_', '<i>italic</i>'),
+            ('__underline__', '<u>underline</u>'),
+            ('~strike~', '<s>strike</s>'),
+            ('||spoiler||', '<span class="tg-spoiler">spoiler</span>'),
+            ('[text](http://www.example.com/)', '<a href="http://www.example.com/">text</a>'),
+            ('![👍](tg://emoji?id=5368324170671202286)', '<tg-emoji emoji-id="5368324170671202286">👍</tg-emoji>'),
+            ('*multi\nline*', '<b>multi\nline</b>'),
+            ('_end_.', '<i>end</i>.'),
+        ])
+
+    def test_code_and_pre(self):
+        self.assertFormats([
+            ('`code`', '<code>code</code>'),
+            ('`*not bold* __init__`', '<code>*not bold* __init__</code>'),
+            ('```pre *x*```', '<pre>pre *x*</pre>'),
+            ('```python\nprint(1)\n```', '<pre><code class="language-python">print(1)\n</code></pre>'),
+            ('```\n_a_\n```', '<pre>\n_a_\n</pre>'),
+        ])
+
+    def test_nested_spans(self):
+        self.assertFormats([
+            ('*bold _italic_*', '<b>bold <i>italic</i></b>'),
+            ('||*bold* spoiler||', '<span class="tg-spoiler"><b>bold</b> spoiler</span>'),
+            ('[*bold link*](http://x.y/)', '<a href="http://x.y/"><b>bold link</b></a>'),
+            ('__under ~strike~__', '<u>under <s>strike</s></u>'),
+        ])
+
+    def test_adjacent_spans(self):
+        self.assertFormats([
+            ('*a* *b*', '<b>a</b> <b>b</b>'),
+            ('*a**b*', '<b>a</b><b>b</b>'),
+            ('_a_ _b_', '<i>a</i> <i>b</i>'),
+            ('||a|| ||b||', '<span class="tg-spoiler">a</span> <span class="tg-spoiler">b</span>'),
+            ('`a``b`', '<code>a</code><code>b</code>'),
+        ])
+
+    def test_unmatched_delimiters(self):
+        self.assertFormats([
+            ('*unclosed', '*unclosed'),
+            ('_unclosed', '_unclosed'),
+            ('a || b', 'a || b'),
+            ('`open', '`open'),
+            ('~~', '~~'),
+            ('_ spaced _', '_ spaced _'),
+            ('_a_b_', '_a_b_'),
+            ('__a__b', '__a__b'),
+            ('[text](no url)', '[text](no url)'),
+        ])
+
+    def test_identifiers_and_urls_are_kept(self):
+        self.assertFormats([
+            ('__init__.py', '__init__.py'),
+            ('snake_case_name', 'snake_case_name'),
+            ('open my_file_.txt', 'open my_file_.txt'),
+            ('5 * 3 * 2', '5 * 3 * 2'),
+            ('https://example.com/a_b_/c', 'https://example.com/a_b_/c'),
+            ('see https://example.com/_x_', 'see https://example.com/_x_'),
+        ])
+
+    def test_plain_and_empty_text(self):
+        self.assertEqual(format_text('plain text'), 'plain text')
+        self.assertIsInstance(format_text('plain text'), FormattedText)
+        self.assertEqual(format_text(''), '')
+        self.assertIsNone(format_text(None))
@@ -0,0 +1,56 @@
+from django.test import SimpleTestCase, override_settings
+
+from monogram.dispatch import parse_update
+from monogram.monoTypes import CompactCallbackQuery, CompactMessage, Message
+
+BOT = object()
+
+MESSAGE = {
+    'message_id': 7,
+    'date': 0,
+    'chat': {'id': 1, 'type': 'private'},
+    'from': {'id': 2, 'is_bot': False, 'first_name': 'Ann'},
+    'text': '/start',
+    'entities': [{'type': 'bot_command', 'offset': 0, 'length': 6}],
+    'document': {'file_id': 'doc', 'file_unique_id': 'u'},
+}
+
+
+class CompactUpdateTests(SimpleTestCase):
+    @override_settings(MONOGRAM_COMPACT_UPDATES=True)
+    def test_message_is_compact(self):
+        update = parse_update(BOT, {'update_id': 1, 'message': MESSAGE})
+        message = update.message
+        self.assertIsInstance(message, CompactMessage)
+        self.assertIs(message.bot, BOT)
+        self.assertEqual(message.text, '/start')
+        self.assertEqual(message.chat.id, 1)
+        self.assertEqual(message.from_user.first_name, 'Ann')
+        self.assertEqual(message.entities[0].type, 'bot_command')
+        # Fields without a slot stay raw
+        self.assertEqual(message['document'], {'file_id': 'doc', 'file_unique_id': 'u'})
+        self.assertEqual(message.to_dict(), MESSAGE)
+        self.assertEqual(update.type, 'message')
+
+    @override_settings(MONOGRAM_COMPACT_UPDATES=True)
+    def test_callback_query_is_compact(self):
+        update = parse_update(BOT, {'update_id': 2, 'callback_query': {
+            'id': 'q', 'from': MESSAGE['from'], 'chat_instance': 'c', 'data': 'item:1', 'message': MESSAGE,
+        }})
+        query = update.callback_query
+        self.assertIsInstance(query, CompactCallbackQuery)
+        self.assertEqual(query.data, 'item:1')
+        self.assertIsInstance(query.message, CompactMessage)
+        self.assertIs(query.message.bot, BOT)
+
+    @override_settings(MONOGRAM_COMPACT_UPDATES=True)
+    def test_other_kinds_use_regular_types(self):
+        update = parse_update(BOT, {'update_id': 3, 'poll_answer': {
+            'poll_id': 'p', 'option_ids': [0], 'user': MESSAGE['from'],
+        }})
+        self.assertEqual(update.type, 'poll_answer')
+        self.assertEqual(update.poll_answer.poll_id, 'p')
+
+    def test_regular_types_by_default(self):
+        update = parse_update(BOT, {'update_id': 4, 'message': MESSAGE})
+        self.assertIsInstance(update.message, Message)
@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+
+
+class FormatCache:
+    """
+    Bounded LRU cache of formatted texts, keyed on the raw text.
+
+    Entries are evicted least recently used first once either limit is
+    exceeded. Texts larger than the whole byte budget are never cached.
+
+    Args:
+        max_entries (int): Maximum number of cached texts.
+        max_bytes (int): Maximum UTF-8 size of all cached raw and formatted texts together.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=1024 * 1024):
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, text):
+        """Returns the cached formatted text, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(text)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(text)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, text, formatted):
+        """Stores a formatted text, evicting old entries to stay within both limits."""
+        size = len(text.encode()) + len(formatted.encode())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(text, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[text] = (formatted, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """Drops every entry and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """
+        Returns:
+            dict: Entry count, byte size, hits, misses and evictions.
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,47 +1,138 @@
 import re
+from .Cache import FormatCache
 
-def format_text(text):
+# Every markup span, tried left to right in a single scan of the text.
+# Alternatives earlier in the pattern win at the same position, so code is
+# matched before styles and '__' before '_'. Bold, italic and underline must
+# hug their content and '_' must not touch a word (or a file extension), so
+# arithmetic and identifiers like 5 * 3 * 2, snake_case or __init__.py stay as they are.
+_SPAN = re.compile(
+    r'```(?:(?P<lang>[\w+#-]+)\n)?(?P<pre>.*?)```'
+    r'|`(?P<code>[^`]+)`'
+    r'|!\[(?P<emoji>[^\]]*)\]\(tg://emoji\?id=(?P<emoji_id>[^)]*)\)'
+    r'|\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)\s]+)\)'
+    r'|\|\|(?P<spoiler>.+?)\|\|'
+    r'|(?<![\w/])__(?P<underline>\S(?:.*?\S)??)__(?!\.?\w)'
+    r'|\*(?P<bold>[^*\s](?:[^*]*?[^*\s])??)\*'
+    r'|(?<![\w/])_(?P<italic>[^_\s](?:[^_]*?[^_\s])??)_(?!\.?\w)'
+    r'|~(?P<strike>[^~]+)~',
+    re.DOTALL
+)
+
+# Characters that can start a span; text without them is returned untouched
+_MARKUP = re.compile(r'[*_~|`\[]')
+
+# Style span -> Telegram HTML (opening tag, closing tag)
+_TAGS = {
+    'bold': ('<b>', '</b>'),
+    'italic': ('<i>', '</i>'),
+    'underline': ('<u>', '</u>'),
+    'strike': ('<s>', '</s>'),
+    'spoiler': ('<span class="tg-spoiler">', '</span>'),
+}
+
+
+class FormattedText(str):
+    """
+    Text that has already been converted to Telegram HTML.
+
+    format_text returns its input unchanged when given a FormattedText, so
+    the text is formatted exactly once however many layers (Message helpers,
+    API methods, payload preparation) it passes through. Wrap pre-built HTML
+    in it to send it as is.
     """
-    Formats the given text by applying various formatting styles.
+    __slots__ = ()
+
+
+# Optional memoization of format_text, see enable_format_cache
+_cache = None
+
+
+def enable_format_cache(max_entries=1024, max_bytes=1024 * 1024):
+    """
+    Memoizes format_text in a bounded LRU cache keyed on the raw text.
+
+    Useful when the same menu/help texts are sent over and over; a repeated
+    text then costs a single lookup. Calling it again replaces the cache.
 
     Args:
-        text (str): The text to be formatted.
+        max_entries (int): Maximum number of cached texts.
+        max_bytes (int): Byte budget of the cache.
 
     Returns:
-        str: The formatted text.
+        FormatCache: The active cache (use ``stats()`` for hit/miss counters).
     """
-    if text:
-        # Bold: *bold text*
-        text = re.sub(r'\*([^*]+)\*', r'<b>\1</b>', text)
+    global _cache
+    _cache = FormatCache(max_entries=max_entries, max_bytes=max_bytes)
+    return _cache
 
-        # Italic: _italic text_ (but not in URLs)
-        text = re.sub(r'(?<!:/)(?<![a-zA-Z0-9])_([^_\s]+)_(?![a-zA-Z0-9])', r'<i>\1</i>', text)
 
-        # Underline: __underline__ (but not in URLs)
-        text = re.sub(r'(?<!:/)(?<![a-zA-Z0-9])__(.+?)__(?![a-zA-Z0-9])', r'<u>\1</u>', text)
+def disable_format_cache():
+    """Turns memoization off and drops the cache."""
+    global _cache
+    _cache = None
 
-        # Strikethrough: ~strikethrough~
-        text = re.sub(r'~(.*?)~', r'<s>\1</s>', text)
 
-        # Spoiler: ||spoiler||
-        text = re.sub(r'\|\|(.*?)\|\|', r'<span class="spoiler">\1</span>', text)
+def get_format_cache():
+    """Returns the active FormatCache, or None when caching is disabled."""
+    return _cache
 
-        # Inline URL: [inline URL](http://www.example.com/)
-        text = re.sub(r'\[inline URL\]\((.*?)\)', r'<a href="\1">\1</a>', text)
 
-        # Inline mention: [inline mention of a user](tg://user?id=123456789)
-        text = re.sub(r'\[inline mention of a user\]\((.*?)\)', r'<a href="\1">@user</a>', text)
+def _replace(match):
+    kind = match.lastgroup
+    value = match.group(kind)
 
-        # Emoji: ![👍](tg://emoji?id=5368324170671202286)
-        text = re.sub(r'!\[(.*?)\]\(tg://emoji\?id=(.*?)\)', r'<img src="\1" alt="emoji">', text)
+    if kind == 'pre':
+        lang = match.group('lang')
+        if lang:
+            return f'<pre><code class="language-{lang}">{value}</code></pre>'
+        return f'<pre>{value}</pre>'
+    if kind == 'code':
+        return f'<code>{value}</code>'
+    if kind == 'emoji_id':
+        return f'<tg-emoji emoji-id="{value}">{match.group("emoji")}</tg-emoji>'
+    if kind == 'link_url':
+        return f'<a href="{value}">{_render(match.group("link_text"))}</a>'
 
-        # Inline fixed-width code: `inline fixed-width code`
-        text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
+    opening, closing = _TAGS[kind]
+    return f'{opening}{_render(value)}{closing}'
 
-        # Pre-formatted fixed-width code block: ```pre-formatted fixed-width code block```
-        text = re.sub(r'```(.*?)```', r'<pre>\1</pre>', text, flags=re.DOTALL)
 
-        # Pre-formatted fixed-width code block (Python): ```python\npre-formatted fixed-width code block written in the Python programming language\n```
-        text = re.sub(r'```(.*?)```', r'<pre><code class="language-python">\1</code></pre>', text, flags=re.DOTALL)
+def _render(text):
+    # Nested styles are rendered by formatting the inside of each span
+    if _MARKUP.search(text) is None:
+        return text
+    return _SPAN.sub(_replace, text)
+
+
+def format_text(text):
+    """
+    Formats the given text by converting markup into Telegram HTML.
+
+    The text is scanned once with a single precompiled pattern; styles nest
+    (the inside of a span is formatted too) and unmatched delimiters are left
+    as they are. Content of code spans and blocks is not formatted.
+
+    Supported markup:
+        *bold*, _italic_, __underline__, ~strikethrough~, ||spoiler||,
+        `inline code`, ```pre```, ```python\\ncode block```,
+        [text](http://www.example.com/), ![👍](tg://emoji?id=5368324170671202286)
 
+    Args:
+        text (str): The text to be formatted.
+
+    Returns:
+        FormattedText: The formatted text (returned as is if it was already formatted).
+    """
+    if not text or isinstance(text, FormattedText):
         return text
+
+    cache = _cache
+    if cache is None:
+        return FormattedText(_render(text))
+
+    formatted = cache.get(text)
+    if formatted is None:
+        formatted = FormattedText(_render(text))
+        cache.put(text, formatted)
+    return formatted
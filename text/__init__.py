@@ -1,5 +1,6 @@
 from .Text import Spoiler, Mono, Bold, Italic, Hashtag, Underline, CreateLink, Strikethrough, Mention, inlineMention, INIsection
-from .Formater import format_text
+from .Formater import format_text, FormattedText, enable_format_cache, disable_format_cache, get_format_cache
+from .Cache import FormatCache
 
 __version__ = '0.1.0'
 
@@ -16,4 +17,9 @@ __all__ = [
     "inlineMention",
     "INIsection",
     "format_text",
+    "FormattedText",
+    "FormatCache",
+    "enable_format_cache",
+    "disable_format_cache",
+    "get_format_cache",
 ]
\ No newline at end of file
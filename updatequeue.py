@@ -0,0 +1,228 @@
+import uuid
+import logging
+import functools
+import threading
+from datetime import timedelta
+from concurrent.futures import wait
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from . import codec
+from .cache import bot_cache
+from .dispatch import process_raw_update
+from .executor import ChatShardedExecutor
+
+"""
+Durable update queue.
+With MONOGRAM_DURABLE_QUEUE enabled, the webhooks and pollers only store raw updates as QueuedUpdate rows
+(bulk inserts, duplicates dropped by the unique (bot, update_id) constraint) and acknowledge them to Telegram;
+``manage.py monogram worker`` processes them. Workers claim batches with SELECT ... FOR UPDATE SKIP LOCKED,
+delete rows once processed, and claims older than the visibility timeout are taken over by other workers,
+so an update is replayed after a crash instead of being lost.
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def durable_queue_enabled():
+    return getattr(settings, 'MONOGRAM_DURABLE_QUEUE', False)
+
+
+def enqueue_raw(bot, update_id, body):
+    """
+    Stores one update exactly as received.
+
+    Args:
+        bot: BotManager instance receiving the update
+        update_id: Identifier of the update
+        body: Raw JSON body (bytes or str)
+    """
+    from .models import QueuedUpdate
+
+    QueuedUpdate.objects.bulk_create([_row(bot, update_id, body)], ignore_conflicts=True)
+
+
+async def aenqueue_raw(bot, update_id, body):
+    """Async variant of ``enqueue_raw``."""
+    from .models import QueuedUpdate
+
+    await QueuedUpdate.objects.abulk_create([_row(bot, update_id, body)], ignore_conflicts=True)
+
+
+def enqueue_updates(bot, updates):
+    """
+    Stores a batch of decoded updates with one bulk insert.
+
+    Args:
+        bot: BotManager instance receiving the updates
+        updates: Decoded update payloads, e.g. a getUpdates result
+    """
+    from .models import QueuedUpdate
+
+    QueuedUpdate.objects.bulk_create(
+        [_row(bot, update['update_id'], codec.dumps(update)) for update in updates],
+        ignore_conflicts=True,
+    )
+
+
+def _row(bot, update_id, body):
+    from .models import QueuedUpdate
+
+    # Stored as text so rows stay readable in the admin and the database shell
+    if isinstance(body, bytes):
+        body = body.decode()
+    return QueuedUpdate(bot_id=bot.pk, update_id=update_id, payload=body)
+
+
+class QueueWorker:
+    """
+    Processes queued updates in batches.
+
+    Each batch runs on a ChatShardedExecutor (in order per chat, in parallel across chats) and is
+    acknowledged by deleting its rows. An update that cannot be loaded or whose bot class raises
+    is released for another attempt and dropped with an error after ``max_attempts``.
+
+    Updates of one chat are processed in order within a worker. Several worker processes claim
+    batches independently, so the updates of a chat may then run concurrently in different
+    workers; give each worker its own ``bots`` when a bot relies on per-chat ordering.
+
+    Settings:
+        MONOGRAM_QUEUE_BATCH_SIZE: Updates claimed at a time (default 100)
+        MONOGRAM_QUEUE_WORKERS: Chats processed at the same time (default 8)
+        MONOGRAM_QUEUE_VISIBILITY_TIMEOUT: Seconds after which a claimed, unacknowledged update
+            is claimed again (default 300; must exceed the time a batch takes)
+        MONOGRAM_QUEUE_MAX_ATTEMPTS: Attempts before an update is dropped (default 5)
+
+    Args:
+        bots: Names of the bots to process (None for all)
+        batch_size: Updates claimed at a time
+        workers: Executor shards
+        visibility_timeout: Seconds before an unacknowledged claim expires
+        max_attempts: Attempts per update
+    """
+
+    #: Seconds to sleep when the queue is empty
+    idle_delay = 0.5
+
+    def __init__(self, bots=None, batch_size=None, workers=None, visibility_timeout=None, max_attempts=None):
+        from .models import BotManager
+
+        self.bot_ids = None
+        if bots:
+            self.bot_ids = list(BotManager.objects.filter(name__in=bots).values_list('pk', flat=True))
+        self.batch_size = batch_size or getattr(settings, 'MONOGRAM_QUEUE_BATCH_SIZE', 100)
+        self.workers = workers or getattr(settings, 'MONOGRAM_QUEUE_WORKERS', 8)
+        self.visibility_timeout = visibility_timeout or getattr(settings, 'MONOGRAM_QUEUE_VISIBILITY_TIMEOUT', 300)
+        self.max_attempts = max_attempts or getattr(settings, 'MONOGRAM_QUEUE_MAX_ATTEMPTS', 5)
+        self.worker_id = uuid.uuid4().hex[:12]
+        self._stopped = threading.Event()
+        # Metrics
+        self.processed = 0
+        self.failed = 0
+
+    def stop(self):
+        """Makes ``run`` return after the current batch."""
+        self._stopped.set()
+
+    def claim(self):
+        """
+        Claims the oldest available updates.
+
+        Returns:
+            list: ``(id, bot name, payload, attempts)`` of the claimed rows, oldest first
+        """
+        from .models import QueuedUpdate
+
+        now = timezone.now()
+        token = f'{self.worker_id}:{uuid.uuid4().hex[:16]}'
+        available = Q(claimed_at__isnull=True) | Q(claimed_at__lt=now - timedelta(seconds=self.visibility_timeout))
+        rows = QueuedUpdate.objects.filter(available)
+        if self.bot_ids is not None:
+            rows = rows.filter(bot_id__in=self.bot_ids)
+
+        with transaction.atomic():
+            ids = list(
+                rows.select_for_update(skip_locked=True).order_by('id').values_list('id', flat=True)[:self.batch_size]
+            )
+            if not ids:
+                return []
+            # Re-checking availability keeps claims exclusive on backends without row locks (SQLite)
+            QueuedUpdate.objects.filter(available, id__in=ids).update(
+                claimed_at=now, claimed_by=token, attempts=F('attempts') + 1
+            )
+        return list(
+            QueuedUpdate.objects.filter(claimed_by=token).order_by('id')
+            .values_list('id', 'bot__name', 'payload', 'attempts')
+        )
+
+    def run_once(self, executor):
+        """
+        Claims, processes and acknowledges one batch.
+
+        Returns:
+            int: Number of updates claimed
+        """
+        from .models import QueuedUpdate
+
+        claimed = self.claim()
+        if not claimed:
+            return 0
+
+        futures = {}
+        failed = []
+        for pk, bot_name, payload, attempts in claimed:
+            try:
+                bot = bot_cache.get(bot_name)
+                update_data = codec.loads(payload)
+            except Exception:
+                logger.exception(f"Cannot load queued update {pk} of {bot_name}")
+                failed.append((pk, attempts))
+                continue
+            futures[executor.submit(bot, update_data)] = (pk, attempts)
+        wait(futures)
+
+        done = [pk for future, (pk, _) in futures.items() if future.exception() is None]
+        failed += [item for future, item in futures.items() if future.exception() is not None]
+        dropped = [pk for pk, attempts in failed if attempts >= self.max_attempts]
+        retry = [pk for pk, attempts in failed if attempts < self.max_attempts]
+
+        if done or dropped:
+            QueuedUpdate.objects.filter(id__in=done + dropped).delete()
+        if retry:
+            QueuedUpdate.objects.filter(id__in=retry).update(claimed_at=None, claimed_by='')
+        if dropped:
+            logger.error(f"Dropped {len(dropped)} queued updates after {self.max_attempts} attempts: {dropped}")
+
+        self.processed += len(done)
+        self.failed += len(retry) + len(dropped)
+        return len(claimed)
+
+    def run(self):
+        """Processes the queue until ``stop`` is called."""
+        logger.info(
+            f"Queue worker {self.worker_id} started (batch size {self.batch_size}, {self.workers} workers, "
+            f"visibility timeout {self.visibility_timeout}s)"
+        )
+        # Unbounded queues: a batch never holds more than ``batch_size`` updates. Errors of the bot
+        # classes fail the futures, so those updates are retried
+        executor = ChatShardedExecutor(
+            shards=self.workers,
+            max_queue=0,
+            handler=functools.partial(process_raw_update, raise_errors=True),
+            name=f'monogram-worker-{self.worker_id}',
+        )
+        try:
+            while not self._stopped.is_set():
+                # Long-running process: drop connections that broke or outlived CONN_MAX_AGE
+                close_old_connections()
+                try:
+                    claimed = self.run_once(executor)
+                except DatabaseError:
+                    # E.g. a lock timeout; unacknowledged claims expire and are retried
+                    logger.exception(f"Queue worker {self.worker_id} failed to claim or acknowledge a batch")
+                    claimed = 0
+                if not claimed:
+                    self._stopped.wait(self.idle_delay)
+        finally:
+            executor.shutdown()
@@ -1,7 +1,8 @@
 from django.urls import path
-from .webhook import WebhookList, WebhookHandler
+from .webhook import WebhookList, WebhookHandler, AsyncWebhookHandler
 
 urlpatterns = [
     path('webhook/', WebhookList.as_view(), name='webhook_list'),
     path('webhook/<str:botname>/', WebhookHandler.as_view(), name='webhook_handler'),
+    path('webhook/<str:botname>/async/', AsyncWebhookHandler.as_view(), name='async_webhook_handler'),
 ]
\ No newline at end of file
@@ -1,7 +1,9 @@
-import json
+import queue
 import logging
 from django.views import View
-from django.http import JsonResponse, HttpResponse, HttpResponseBadRequest, HttpResponseForbidden
+from django.core.exceptions import ImproperlyConfigured
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, HttpResponse, HttpResponseBadRequest, HttpResponseForbidden, Http404
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse
 from django.contrib import messages
@@ -10,7 +12,12 @@ from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from .models import BotManager  
 from .forms import BotForm
-from .monoTypes import Update
+from .dispatch import process_update, parse_update, dispatcher
+from .cache import bot_cache
+from .dedup import deduplicator, update_id_of
+from .executor import get_executor
+from .updatequeue import durable_queue_enabled, enqueue_raw, aenqueue_raw
+from . import codec
 
 logger = logging.getLogger(__name__)
 
@@ -114,21 +121,54 @@ class WebhookHandler(View):
             HTTP 200 OK on success, appropriate error otherwise
         """
 
+        # Served from the in-memory bot cache; hits the database only on a miss.
+        # Looked up outside the try below so an unknown bot is a 404, not a 500
+        try:
+            bot = bot_cache.get(botname)
+        except BotManager.DoesNotExist:
+            raise Http404("Bot not found")
+
         try:
-            bot = get_object_or_404(BotManager, name=botname)
-            
             # Validate secret token
             if not self._verify_secret_token(request, bot):
                 return HttpResponseForbidden("Invalid secret token")
             
+            # Acknowledge redeliveries before the body is decoded
+            update_id = update_id_of(request.body)
+            if deduplicator.seen(bot.name, update_id):
+                return HttpResponse(status=200)
+
+            if update_id is not None and durable_queue_enabled():
+                # Stored before Telegram gets its 200; a worker processes it (monogram worker)
+                try:
+                    enqueue_raw(bot, update_id, request.body)
+                except Exception:
+                    deduplicator.forget(bot.name, update_id)
+                    raise
+                return HttpResponse(status=200)
+
             # Process update
-            update_data = json.loads(request.body)
-            # print(update_data)
-            update = Update(bot=bot, **update_data)
+            try:
+                update_data = codec.loads(request.body)
+                # print(update_data)
+                if getattr(settings, 'MONOGRAM_ORDERED_DISPATCH', False):
+                    # Acknowledge now; the update runs after the earlier ones of its chat
+                    get_executor().submit(bot, update_data, block=False)
+                    return HttpResponse(status=200)
+                update = parse_update(bot, update_data)
+            except queue.Full:
+                deduplicator.forget(bot.name, update_id)
+                logger.warning(f"Update queue full for {bot.name}, rejecting update")
+                # Telegram retries non-2xx responses later
+                return HttpResponse(status=503)
+            except Exception:
+                # Not accepted: let Telegram's redelivery through
+                deduplicator.forget(bot.name, update_id)
+                raise
             self._process_update(bot, update)
             return HttpResponse(status=200)
             
-        except json.JSONDecodeError:
+        except codec.DecodeError:
             logger.error("Invalid JSON payload")
             return HttpResponseBadRequest("Invalid JSON format")
         except Exception as e:
@@ -138,8 +178,9 @@ class WebhookHandler(View):
     def _set_webhook(self, request, bot):
         """Configures Telegram webhook for specified bot"""
         try:
-            # Build webhook URL
-            webhook_path = reverse('webhook_handler', kwargs={'botname': bot.name})
+            # Build webhook URL (the async endpoint when MONOGRAM_ASYNC_WEBHOOK is enabled)
+            route = 'async_webhook_handler' if getattr(settings, 'MONOGRAM_ASYNC_WEBHOOK', False) else 'webhook_handler'
+            webhook_path = reverse(route, kwargs={'botname': bot.name})
             webhook_url = f"https://{settings.DOMAIN_NAME}{webhook_path}"
             # from pprint import pprint
             # pprint(vars(bot))
@@ -152,7 +193,7 @@ class WebhookHandler(View):
             }
             response = bot.setWebhook(**params, return_response=True)
             
-            if response and response.status_code == 200:
+            if response:
                 messages.success(request, "Webhook successfully configured!")
                 bot.webhook_active = True
                 bot.save()
@@ -170,7 +211,7 @@ class WebhookHandler(View):
         try:
             response = bot.deleteWebhook(return_response=True)
             
-            if response and response.status_code == 200:
+            if response:
                 messages.success(request, "Webhook successfully removed!")
                 bot.webhook_active = False
                 bot.save()
@@ -186,8 +227,8 @@ class WebhookHandler(View):
     def _get_webhook_info(self, bot):
         """Retrieves current webhook information (for UI display)"""
         try:
-            response = bot.getWebhookInfo(return_response=True)
-            return response.json() if response else None
+            # The request layer already decodes the result
+            return bot.getWebhookInfo(return_response=True) or None
             
         except Exception:
             logger.exception("Failed to get webhook info")
@@ -206,27 +247,77 @@ class WebhookHandler(View):
         return redirect(reverse('webhook_handler', kwargs={'botname': botname}))
       
     def _process_update(self, bot, update):
-        """Processes incoming Telegram update (to be implemented)"""
-        logger.info(f"Received update for {bot.name}: {update}")
-        
-        if not bot.object:
-            logger.error(f"No bot class defined for {bot.name}")
-            return
-            
+        """Processes incoming Telegram update through the shared dispatch pipeline"""
+        process_update(bot, update)
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncWebhookHandler(View):
+    """
+    Async webhook endpoint for ASGI deployments.
+
+    Validates the secret token, queues the raw update on the per-bot
+    dispatcher and acknowledges Telegram immediately; the bot class runs
+    later on a bounded worker pool (see ``monogram.dispatch.UpdateDispatcher``).
+    """
+
+    async def post(self, request, botname):
+        """
+        Accepts an incoming Telegram update without processing it inline.
+
+        Args:
+            request: Django request object
+            botname: Name of the bot receiving the update
+
+        Returns:
+            HTTP 200 OK once queued, 503 if the bot's queue is full
+        """
         try:
-            # load dynamic bot class
-            module_path, class_name = bot.object.rsplit('.', 1)
-            module = __import__(module_path, fromlist=[class_name])
-            BotClass = getattr(module, class_name)
-           
-            # create instance from bot class and process update
-            bot_instance = BotClass(bot, update)
-            
-            # bot_instance.handle_update()
-            
-        except ImportError as e:
-            logger.exception(f"Failed to import bot class: {bot.object}")
-        except AttributeError:
-            logger.exception(f"Class not found: {bot.object}")
-        except Exception as e:
-            logger.exception(f"Error processing update: {str(e)}")
\ No newline at end of file
+            bot = await bot_cache.aget(botname)
+        except BotManager.DoesNotExist:
+            raise Http404("Bot not found")
+
+        if not self._verify_secret_token(request, bot):
+            return HttpResponseForbidden("Invalid secret token")
+
+        update_id = update_id_of(request.body)
+        if await deduplicator.aseen(bot.name, update_id):
+            return HttpResponse(status=200)
+
+        if update_id is not None and durable_queue_enabled():
+            try:
+                await aenqueue_raw(bot, update_id, request.body)
+            except Exception:
+                await deduplicator.aforget(bot.name, update_id)
+                logger.exception("Failed to store update")
+                return HttpResponse(status=503)
+            return HttpResponse(status=200)
+
+        try:
+            update_data = codec.loads(request.body)
+        except codec.DecodeError:
+            await deduplicator.aforget(bot.name, update_id)
+            logger.error("Invalid JSON payload")
+            return HttpResponseBadRequest("Invalid JSON format")
+
+        if getattr(settings, 'MONOGRAM_ORDERED_DISPATCH', False):
+            try:
+                get_executor().submit(bot, update_data, block=False)
+                accepted = True
+            except queue.Full:
+                logger.warning(f"Update queue full for {bot.name}, rejecting update")
+                accepted = False
+        else:
+            if not isinstance(request, ASGIRequest):
+                # Under WSGI the view runs on a throwaway event loop that would take the queued update with it
+                await deduplicator.aforget(bot.name, update_id)
+                raise ImproperlyConfigured("The async webhook must be served by an ASGI server")
+            accepted = dispatcher.enqueue(bot, update_data)
+
+        if not accepted:
+            # Telegram retries non-2xx responses later
+            await deduplicator.aforget(bot.name, update_id)
+            return HttpResponse(status=503)
+        return HttpResponse(status=200)
+
+    _verify_secret_token = WebhookHandler._verify_secret_token